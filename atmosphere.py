@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+DARPA Lift Challenge - ISA Atmosphere Model
+
+International Standard Atmosphere (troposphere and lower stratosphere) with
+an optional temperature offset (ISA + dT), for air density by altitude and
+temperature:
+- isa_temperature / isa_pressure / isa_density_exact: closed-form model
+- air_density: fast density lookup from precomputed tables
+
+Following the ISA + dT convention, pressure at a given altitude is the
+standard pressure and only temperature is shifted. The tables hold
+log-pressure and standard temperature every ATMOSPHERE_TABLE_STEP_M, and
+air_density interpolates them, so any array of altitudes and offsets
+costs two np.interp calls. Results pass straight into the air_density
+arguments of simulator and batch_simulator.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+# ISA constants
+ISA_SEA_LEVEL_TEMPERATURE_K = 288.15
+ISA_SEA_LEVEL_PRESSURE_PA = 101325.0
+ISA_LAPSE_RATE_K_PER_M = 0.0065
+ISA_TROPOPAUSE_M = 11000.0
+ISA_GAS_CONSTANT = 287.05287  # J/(kg K), dry air
+ISA_GRAVITY = 9.80665  # m/s^2, standard gravity used by ISA
+
+# Altitude range covered by the tables (m) and table spacing
+ATMOSPHERE_ALTITUDE_RANGE_M: Tuple[float, float] = (-500.0, 20000.0)
+ATMOSPHERE_TABLE_STEP_M = 50.0
+
+_TROPOPAUSE_TEMPERATURE_K = ISA_SEA_LEVEL_TEMPERATURE_K - ISA_LAPSE_RATE_K_PER_M * ISA_TROPOPAUSE_M
+_PRESSURE_EXPONENT = ISA_GRAVITY / (ISA_GAS_CONSTANT * ISA_LAPSE_RATE_K_PER_M)
+_TROPOPAUSE_PRESSURE_PA = ISA_SEA_LEVEL_PRESSURE_PA * (
+    _TROPOPAUSE_TEMPERATURE_K / ISA_SEA_LEVEL_TEMPERATURE_K) ** _PRESSURE_EXPONENT
+
+
+def _check_altitude(altitude_m: np.ndarray):
+    """Raise ValueError for altitudes outside the modelled range"""
+    low, high = ATMOSPHERE_ALTITUDE_RANGE_M
+    if np.any((altitude_m < low) | (altitude_m > high)):
+        raise ValueError(f"Altitude must be within {low:g} to {high:g} m")
+
+
+def _scalar_or_array(values: np.ndarray):
+    """Return a float for 0-d results, else the array"""
+    return values.item() if values.ndim == 0 else values
+
+
+def isa_temperature(altitude_m, temp_offset_c=0.0):
+    """
+    ISA temperature in K at altitude, shifted by temp_offset_c.
+
+    Returns: Temperature in K (float for scalar inputs, else array)
+    """
+    altitude_m = np.asarray(altitude_m, dtype=np.float64)
+    _check_altitude(altitude_m)
+    standard = np.where(altitude_m <= ISA_TROPOPAUSE_M,
+                        ISA_SEA_LEVEL_TEMPERATURE_K - ISA_LAPSE_RATE_K_PER_M * altitude_m,
+                        _TROPOPAUSE_TEMPERATURE_K)
+    return _scalar_or_array(standard + np.asarray(temp_offset_c, dtype=np.float64))
+
+
+def isa_pressure(altitude_m):
+    """
+    ISA static pressure in Pa at altitude.
+
+    Returns: Pressure in Pa (float for scalar inputs, else array)
+    """
+    altitude_m = np.asarray(altitude_m, dtype=np.float64)
+    _check_altitude(altitude_m)
+    troposphere = ISA_SEA_LEVEL_PRESSURE_PA * (
+        1 - ISA_LAPSE_RATE_K_PER_M * np.minimum(altitude_m, ISA_TROPOPAUSE_M)
+        / ISA_SEA_LEVEL_TEMPERATURE_K) ** _PRESSURE_EXPONENT
+    stratosphere = _TROPOPAUSE_PRESSURE_PA * np.exp(
+        -ISA_GRAVITY * (altitude_m - ISA_TROPOPAUSE_M) / (ISA_GAS_CONSTANT * _TROPOPAUSE_TEMPERATURE_K))
+    return _scalar_or_array(np.where(altitude_m <= ISA_TROPOPAUSE_M, troposphere, stratosphere))
+
+
+def isa_density_exact(altitude_m, temp_offset_c=0.0):
+    """
+    Air density in kg/m^3 from the closed-form ISA + dT model.
+
+    Returns: Density in kg/m^3 (float for scalar inputs, else array)
+    """
+    pressure = np.asarray(isa_pressure(altitude_m))
+    temperature = np.asarray(isa_temperature(altitude_m, temp_offset_c))
+    return _scalar_or_array(pressure / (ISA_GAS_CONSTANT * temperature))
+
+
+# Precomputed tables (the tropopause falls on a table point, so the
+# piecewise-linear temperature is reproduced exactly)
+_TABLE_ALTITUDE_M = np.arange(ATMOSPHERE_ALTITUDE_RANGE_M[0],
+                              ATMOSPHERE_ALTITUDE_RANGE_M[1] + ATMOSPHERE_TABLE_STEP_M / 2,
+                              ATMOSPHERE_TABLE_STEP_M)
+_TABLE_LOG_PRESSURE = np.log(isa_pressure(_TABLE_ALTITUDE_M))
+_TABLE_TEMPERATURE_K = isa_temperature(_TABLE_ALTITUDE_M)
+
+
+def air_density(altitude_m, temp_offset_c=0.0):
+    """
+    Air density in kg/m^3 at altitude for ISA + temp_offset_c.
+
+    Interpolates the precomputed tables (relative error below 2e-6 against
+    isa_density_exact). Inputs broadcast against each other, so an
+    altitude column and a temperature-offset row give a full grid.
+
+    Args:
+        altitude_m: Pressure altitude(s) in m
+        temp_offset_c: Temperature offset(s) from ISA in degC (= K)
+
+    Returns: Density in kg/m^3 (float for scalar inputs, else array)
+    """
+    altitude_m = np.asarray(altitude_m, dtype=np.float64)
+    _check_altitude(altitude_m)
+    pressure = np.exp(np.interp(altitude_m, _TABLE_ALTITUDE_M, _TABLE_LOG_PRESSURE))
+    temperature = (np.interp(altitude_m, _TABLE_ALTITUDE_M, _TABLE_TEMPERATURE_K) +
+                   np.asarray(temp_offset_c, dtype=np.float64))
+    return _scalar_or_array(pressure / (ISA_GAS_CONSTANT * temperature))
+
+
+if __name__ == "__main__":
+    from simulator import AIR_DENSITY_SEA_LEVEL, ft_to_m, lbs_to_kg
+    from batch_simulator import DesignTable, payload_ratio_analysis_batch
+
+    print("=" * 80)
+    print("ISA ATMOSPHERE")
+    print("=" * 80)
+
+    altitudes_ft = np.array([0, 1000, 2000, 3000, 5000, 8000])
+    offsets_c = np.array([-15.0, 0.0, 15.0, 25.0])
+    density = air_density(ft_to_m(altitudes_ft)[:, None], offsets_c[None, :])
+
+    print(f"\n{'Altitude (ft)':<15}" + "".join(f"{f'ISA{o:+.0f}C':>12}" for o in offsets_c))
+    for alt_ft, row in zip(altitudes_ft, density):
+        print(f"{alt_ft:<15}" + "".join(f"{rho:>12.4f}" for rho in row))
+
+    probe_m = _TABLE_ALTITUDE_M[:-1] + 17.0
+    error = np.max(np.abs(air_density(probe_m, 10.0) / isa_density_exact(probe_m, 10.0) - 1))
+    print(f"\nSea level: {air_density(0.0):.4f} kg/m^3 (simulator uses {AIR_DENSITY_SEA_LEVEL})")
+    print(f"Max table interpolation error: {error:.1e}")
+
+    # Altitude x temperature x design as one batched evaluation
+    designs = DesignTable.from_columns(
+        aircraft_weight_kg=11.0, num_rotors=np.array([8, 12, 16]), rotor_diameter_m=0.61,
+        generator_weight_kg=13.0, generator_power_w=15000
+    )
+    result = payload_ratio_analysis_batch(designs.expand_dims(3), lbs_to_kg(110),
+                                          air_density=density[None, :, :])
+    print(f"\nPeak power (kW), 110 lb payload, {result.shape} evaluations grid:")
+    for i, rotors in enumerate(designs.num_rotors):
+        print(f"  {rotors} rotors at {altitudes_ft[-1]} ft: " +
+              ", ".join(f"ISA{o:+.0f}C {p/1000:.1f}" for o, p in zip(offsets_c, result['max_power_w'][i, -1])))
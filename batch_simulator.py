@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+DARPA Lift Challenge - Vectorized Batch Performance Simulator
+
+NumPy-backed counterpart of simulator.PerformanceCalculator for scoring
+large numbers of candidate designs in one call:
+- DesignTable: struct-of-arrays view of many AircraftConfig rows
+- BatchPerformanceCalculator: hover, forward flight and climb power arrays
+- calculate_mission_energy_batch / payload_ratio_analysis_batch: the full
+  mission evaluated for many designs, payloads and cruise speeds at once
+- PayloadAnalysisTable: columnar counterpart of simulator.PayloadAnalysis
+
+The physics is identical to simulator.py; only the evaluation is batched.
+The multirotor/wing branch of forward flight is resolved with masks rather
+than per-row control flow, so every method runs as a handful of array ops.
+"""
+
+from dataclasses import dataclass, fields, MISSING
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from simulator import (
+    AircraftConfig, PayloadAnalysis, GRAVITY, AIR_DENSITY_SEA_LEVEL,
+)
+
+
+# Column dtypes for a design table (field name -> dtype)
+DESIGN_COLUMNS = {
+    'aircraft_weight_kg': np.float64,
+    'num_rotors': np.int64,
+    'rotor_diameter_m': np.float64,
+    'hover_efficiency': np.float64,
+    'cruise_efficiency': np.float64,
+    'has_wing': np.bool_,
+    'wing_area_m2': np.float64,
+    'wing_efficiency': np.float64,
+    'hybrid_power': np.bool_,
+    'generator_weight_kg': np.float64,
+    'generator_power_w': np.float64,
+    'battery_capacity_wh': np.float64,
+    'battery_weight_kg': np.float64,
+}
+
+# Defaults for optional columns, taken from AircraftConfig
+_CONFIG_DEFAULTS = {f.name: f.default for f in fields(AircraftConfig)
+                    if f.default is not MISSING}
+
+
+@dataclass
+class DesignTable:
+    """
+    Struct-of-arrays table of aircraft designs.
+
+    Each attribute mirrors the AircraftConfig field of the same name and
+    holds one value per design. All columns share a common shape (usually
+    1-D with one entry per design).
+    """
+    aircraft_weight_kg: np.ndarray
+    num_rotors: np.ndarray
+    rotor_diameter_m: np.ndarray
+    hover_efficiency: np.ndarray
+    cruise_efficiency: np.ndarray
+    has_wing: np.ndarray
+    wing_area_m2: np.ndarray
+    wing_efficiency: np.ndarray
+    hybrid_power: np.ndarray
+    generator_weight_kg: np.ndarray
+    generator_power_w: np.ndarray
+    battery_capacity_wh: np.ndarray
+    battery_weight_kg: np.ndarray
+
+    @classmethod
+    def from_columns(cls, **columns) -> 'DesignTable':
+        """
+        Build a table from column arrays or scalars.
+
+        Required columns are aircraft_weight_kg, num_rotors and
+        rotor_diameter_m; the rest fall back to the AircraftConfig defaults.
+        Scalars and arrays are broadcast against each other.
+
+        Returns: DesignTable
+        """
+        unknown = set(columns) - set(DESIGN_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown design columns: {sorted(unknown)}")
+
+        values = {}
+        for name in DESIGN_COLUMNS:
+            if name in columns:
+                values[name] = columns[name]
+            elif name in _CONFIG_DEFAULTS:
+                values[name] = _CONFIG_DEFAULTS[name]
+            else:
+                raise ValueError(f"Missing required design column: {name}")
+
+        arrays = np.broadcast_arrays(*[np.asarray(values[name], dtype=dtype)
+                                       for name, dtype in DESIGN_COLUMNS.items()])
+        # broadcast_arrays returns read-only views; copy so columns are owned
+        return cls(*[np.array(a) for a in arrays])
+
+    @classmethod
+    def from_configs(cls, configs: Iterable[AircraftConfig]) -> 'DesignTable':
+        """Build a table from a sequence of AircraftConfig objects"""
+        configs = list(configs)
+        return cls(*[np.array([getattr(c, name) for c in configs], dtype=dtype)
+                     for name, dtype in DESIGN_COLUMNS.items()])
+
+    def __len__(self) -> int:
+        return self.aircraft_weight_kg.shape[0] if self.aircraft_weight_kg.ndim else 1
+
+    @property
+    def shape(self) -> tuple:
+        """Common shape of all columns"""
+        return self.aircraft_weight_kg.shape
+
+    def columns(self) -> dict:
+        """Return the columns as a {field name: array} dict"""
+        return {name: getattr(self, name) for name in DESIGN_COLUMNS}
+
+    def take(self, index) -> 'DesignTable':
+        """Select rows by integer index array, slice or boolean mask"""
+        return DesignTable(*[getattr(self, name)[index] for name in DESIGN_COLUMNS])
+
+    def expand_dims(self, ndim: int) -> 'DesignTable':
+        """
+        Append trailing length-1 axes so the table broadcasts as the leading
+        axis against other arrays, e.g. ndim=2 gives (N, 1) columns for an
+        N designs x M payloads grid.
+        """
+        extra = ndim - len(self.shape)
+        if extra <= 0:
+            return self
+        new_shape = self.shape + (1,) * extra
+        return DesignTable(*[getattr(self, name).reshape(new_shape)
+                             for name in DESIGN_COLUMNS])
+
+    def row(self, i: int) -> AircraftConfig:
+        """Return row i as a scalar AircraftConfig"""
+        return AircraftConfig(**{name: getattr(self, name)[i].item()
+                                 for name in DESIGN_COLUMNS})
+
+    def to_configs(self) -> List[AircraftConfig]:
+        """Return every row as an AircraftConfig (1-D tables only)"""
+        return [self.row(i) for i in range(len(self))]
+
+    def total_disk_area(self) -> np.ndarray:
+        """Total rotor disk area in m^2 for every design"""
+        single_rotor_area = np.pi * (self.rotor_diameter_m / 2) ** 2
+        return single_rotor_area * self.num_rotors
+
+    def disk_loading(self, total_weight_kg) -> np.ndarray:
+        """Disk loading in kg/m^2 for every design"""
+        return np.asarray(total_weight_kg) / self.total_disk_area()
+
+    def total_weight(self) -> np.ndarray:
+        """Total aircraft weight including power system for every design"""
+        return (self.aircraft_weight_kg +
+                self.generator_weight_kg +
+                self.battery_weight_kg)
+
+
+class BatchPerformanceCalculator:
+    """
+    Vectorized aircraft performance metrics for a DesignTable.
+
+    Method names and formulas match simulator.PerformanceCalculator. Weight
+    and speed arguments, and the air density (kg/m^3), may be scalars or
+    arrays that broadcast against the table columns; results are float64
+    arrays of the broadcast shape.
+    """
+
+    def __init__(self, table: DesignTable, air_density=AIR_DENSITY_SEA_LEVEL):
+        self.table = table
+        self.air_density = np.asarray(air_density, dtype=np.float64)
+        self._disk_area = table.total_disk_area()
+
+        if np.any(self._disk_area <= 0):
+            raise ValueError("Disk area must be positive")
+
+    def hover_power_ideal(self, total_weight_kg) -> np.ndarray:
+        """
+        Ideal hover power using momentum theory.
+
+        Formula: P_ideal = T^1.5 / sqrt(2 * rho * A)
+
+        Returns: Power in Watts
+        """
+        thrust_n = np.asarray(total_weight_kg, dtype=np.float64) * GRAVITY
+        return thrust_n ** 1.5 / np.sqrt(2 * self.air_density * self._disk_area)
+
+    def hover_power_actual(self, total_weight_kg) -> np.ndarray:
+        """
+        Actual hover power including losses.
+
+        Returns: Power in Watts
+        """
+        return self.hover_power_ideal(total_weight_kg) / self.table.hover_efficiency
+
+    def forward_flight_power(self, total_weight_kg, speed_ms) -> np.ndarray:
+        """
+        Forward flight power for every design.
+
+        Wing designs use the wing model and the rest use the multirotor
+        model, selected per row by the has_wing mask.
+
+        Args:
+            total_weight_kg: Total weight in kg
+            speed_ms: Forward speed in m/s
+
+        Returns: Power in Watts
+        """
+        has_wing = self.table.has_wing
+        multirotor_power = self._multirotor_forward_power(total_weight_kg, speed_ms)
+
+        if not np.any(has_wing):
+            return multirotor_power
+
+        wing_power = self._wing_forward_power(total_weight_kg, speed_ms)
+        return np.where(has_wing, wing_power, multirotor_power)
+
+    def _multirotor_forward_power(self, total_weight_kg, speed_ms) -> np.ndarray:
+        """Multirotor forward flight power with translational lift benefit"""
+        hover_power = self.hover_power_actual(total_weight_kg)
+        speed_ms = np.asarray(speed_ms, dtype=np.float64)
+
+        optimal_speed = 12.0  # m/s (about 27 mph)
+
+        benefit_factor = 0.15 * (speed_ms / optimal_speed)
+        below_optimal = hover_power - hover_power * benefit_factor
+
+        excess_speed = speed_ms - optimal_speed
+        drag_penalty = hover_power * 0.02 * (excess_speed / optimal_speed)
+        above_optimal = hover_power * 0.85 + drag_penalty
+
+        return np.where(speed_ms <= optimal_speed, below_optimal, above_optimal)
+
+    def _wing_forward_power(self, total_weight_kg, speed_ms) -> np.ndarray:
+        """Hybrid VTOL forward flight power (wing lift plus rotor thrust)"""
+        speed_ms = np.asarray(speed_ms, dtype=np.float64)
+        q = 0.5 * self.air_density * speed_ms ** 2
+
+        lift_coefficient = 1.2
+        wing_lift_n = q * self.table.wing_area_m2 * lift_coefficient
+
+        total_weight_n = np.asarray(total_weight_kg, dtype=np.float64) * GRAVITY
+        wing_lift_fraction = np.minimum(wing_lift_n / total_weight_n, 0.95)
+
+        rotor_thrust_n = total_weight_n * (1 - wing_lift_fraction)
+        rotor_weight_equivalent = rotor_thrust_n / GRAVITY
+        rotor_power = self.hover_power_ideal(rotor_weight_equivalent) / self.table.hover_efficiency
+
+        aspect_ratio = 12
+        lift_to_drag = aspect_ratio * self.table.wing_efficiency
+        drag_n = wing_lift_n / lift_to_drag
+        drag_power = drag_n * speed_ms / self.table.cruise_efficiency
+
+        return rotor_power + drag_power
+
+    def climb_power(self, total_weight_kg, climb_rate_ms, hover_power=None) -> np.ndarray:
+        """
+        Power for climbing: hover power plus potential energy rate.
+
+        hover_power may pass in an already computed
+        hover_power_actual(total_weight_kg).
+
+        Returns: Power in Watts
+        """
+        total_weight_kg = np.asarray(total_weight_kg, dtype=np.float64)
+        if hover_power is None:
+            hover_power = self.hover_power_actual(total_weight_kg)
+        climb_power_component = (total_weight_kg * GRAVITY * climb_rate_ms /
+                                 self.table.hover_efficiency)
+        return hover_power + climb_power_component
+
+    def max_flight_time(self, total_weight_kg, avg_power_w) -> np.ndarray:
+        """
+        Maximum flight time in minutes.
+
+        Hybrid designs assume 2 hours of generator output; battery designs
+        use battery capacity.
+        """
+        available_energy = np.where(self.table.hybrid_power,
+                                    self.table.generator_power_w * 2.0,
+                                    self.table.battery_capacity_wh)
+        flight_time_hours = available_energy / np.asarray(avg_power_w, dtype=np.float64)
+        return flight_time_hours * 60
+
+
+def ground_speed_batch(airspeed_ms, wind_speed_ms, wind_from_deg, track_deg) -> np.ndarray:
+    """
+    Vectorized simulator.ground_speed: ground speed along a track flown at
+    constant airspeed, crabbing into the crosswind.
+
+    Returns: Ground speed in m/s (NaN where the wind cannot be overcome)
+    """
+    relative = np.radians(np.asarray(wind_from_deg, dtype=np.float64) + 180 - track_deg)
+    wind_speed_ms = np.asarray(wind_speed_ms, dtype=np.float64)
+    tailwind = wind_speed_ms * np.cos(relative)
+    crosswind = wind_speed_ms * np.sin(relative)
+    along_air = np.asarray(airspeed_ms, dtype=np.float64) ** 2 - crosswind ** 2
+    with np.errstate(invalid='ignore'):
+        speed = tailwind + np.sqrt(along_air)
+    return np.where((along_air > 0) & (speed > 0), speed, np.nan)
+
+
+def _broadcast_inputs(table: DesignTable, payload_kg, cruise_speed_ms, outer: bool,
+                      air_density=AIR_DENSITY_SEA_LEVEL, wind_speed_ms=0.0, wind_from_deg=0.0):
+    """
+    Align the design table, payloads, cruise speeds and flight conditions.
+
+    outer=False broadcasts everything elementwise. outer=True evaluates the
+    full grid: result axes are (design, payload, speed), and air density
+    and wind must broadcast against that grid.
+
+    Returns: (table, payload, speed, (air density, wind speed, wind
+             direction), result shape)
+    """
+    payload_kg = np.asarray(payload_kg, dtype=np.float64)
+    cruise_speed_ms = np.asarray(cruise_speed_ms, dtype=np.float64)
+    conditions = tuple(np.asarray(value, dtype=np.float64)
+                       for value in (air_density, wind_speed_ms, wind_from_deg))
+
+    if outer:
+        table = table.expand_dims(3)
+        payload_kg = payload_kg.reshape(1, -1, 1)
+        cruise_speed_ms = cruise_speed_ms.reshape(1, 1, -1)
+
+    shape = np.broadcast_shapes(table.shape, payload_kg.shape, cruise_speed_ms.shape,
+                                *(value.shape for value in conditions))
+    return table, payload_kg, cruise_speed_ms, conditions, shape
+
+
+def calculate_mission_energy_batch(table: DesignTable,
+                                   payload_kg,
+                                   cruise_speed_ms=7.5,
+                                   outer: bool = False,
+                                   air_density=AIR_DENSITY_SEA_LEVEL,
+                                   wind_speed_ms=0.0,
+                                   wind_from_deg=0.0) -> Dict:
+    """
+    Calculate mission energy for many designs, payloads and cruise speeds.
+
+    Batched equivalent of simulator.calculate_mission_energy, evaluated as
+    mission_profile.STANDARD_MISSION. The returned dict has the same
+    'phases' / 'totals' / 'feasibility' layout, but every leaf is an array
+    with one entry per evaluation instead of a scalar.
+
+    Args:
+        table: Design table (N rows)
+        payload_kg: Payload weight(s) in kg
+        cruise_speed_ms: Cruise speed(s) in m/s
+        outer: If True, evaluate every design x payload x speed combination
+               and return arrays of shape (N, M, S); otherwise broadcast the
+               inputs elementwise
+        air_density: Air density(s) in kg/m^3, e.g. from
+                     atmosphere.air_density (default: ISA sea level)
+        wind_speed_ms: Steady wind speed(s) in m/s
+        wind_from_deg: Direction(s) the wind blows from, relative to the
+                       loaded leg track; wind arrays make wind a batch axis
+
+    Returns: Dictionary of arrays with the mission energy breakdown.
+             feasibility['generator_adequate'] is False for battery designs;
+             times and energies are NaN where the wind cannot be overcome.
+    """
+    # The phases are declared in mission_profile, which builds on this module
+    from mission_profile import STANDARD_MISSION
+    return STANDARD_MISSION.evaluate(table, payload_kg, cruise_speed_ms, outer,
+                                     air_density, wind_speed_ms, wind_from_deg)
+
+
+class PayloadAnalysisTable(PayloadAnalysis):
+    """
+    Array-backed payload_ratio_analysis results for many evaluations.
+
+    Same fields as simulator.PayloadAnalysis with an array in place of each
+    scalar: only the six independent columns are stored and the rest are
+    derived on access. table['key'] returns a column, row(i) a scalar
+    PayloadAnalysis record and to_dict() the plain dict of columns.
+    """
+    __slots__ = ()
+
+    @property
+    def shape(self) -> tuple:
+        return np.shape(self.mission_time_min)
+
+    def row(self, i) -> PayloadAnalysis:
+        """Scalar record for one evaluation (i indexes the result shape)"""
+        return PayloadAnalysis(*(getattr(self, name)[i].item() for name in PayloadAnalysis.__slots__))
+
+    def to_records(self) -> List[PayloadAnalysis]:
+        """Scalar records for every evaluation, in C order"""
+        columns = [np.ravel(getattr(self, name)).tolist() for name in PayloadAnalysis.__slots__]
+        return [PayloadAnalysis(*values) for values in zip(*columns)]
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(shape={self.shape})'
+
+
+def payload_ratio_analysis_batch(table: DesignTable,
+                                 payload_kg,
+                                 cruise_speed_ms=7.5,
+                                 outer: bool = False,
+                                 air_density=AIR_DENSITY_SEA_LEVEL,
+                                 wind_speed_ms=0.0,
+                                 wind_from_deg=0.0) -> PayloadAnalysisTable:
+    """
+    Payload ratio metrics for many designs at once.
+
+    Batched equivalent of simulator.payload_ratio_analysis: returns a
+    PayloadAnalysisTable with the same keys, each mapped to an array of
+    results.
+
+    Args:
+        table: Design table (N rows)
+        payload_kg: Payload weight(s) in kg
+        cruise_speed_ms: Cruise speed(s) in m/s
+        outer: Evaluate the full design x payload x speed grid
+        air_density: Air density(s) in kg/m^3 (default: ISA sea level)
+        wind_speed_ms: Steady wind speed(s) in m/s
+        wind_from_deg: Direction(s) the wind blows from, relative to the
+                       loaded leg track
+
+    Returns: PayloadAnalysisTable of result columns
+    """
+    mission = calculate_mission_energy_batch(table, payload_kg, cruise_speed_ms, outer,
+                                             air_density, wind_speed_ms, wind_from_deg)
+    totals = mission['totals']
+    feasibility = mission['feasibility']
+
+    return PayloadAnalysisTable(
+        aircraft_weight_kg=totals['unloaded_weight_kg'],
+        payload_kg=totals['payload_kg'],
+        mission_time_min=totals['total_time_min'],
+        mission_energy_wh=totals['total_energy_wh'],
+        max_power_w=feasibility['max_power_w'],
+        avg_power_w=feasibility['avg_power_w']
+    )
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+DARPA Lift Challenge - Simulator Micro-Benchmarks
+
+Times the simulator kernels and the main analyses, and guards them against
+performance regressions:
+- calls/sec: best of several timed runs, each at least --min-time long
+- allocation: peak traced memory (tracemalloc) of a single call
+
+Usage:
+    python benchmarks.py --save             # record baselines
+    python benchmarks.py                    # compare against baselines
+    python benchmarks.py --tolerance 10     # fail on a >10% slowdown
+
+Baselines are machine-specific, so record them on the machine that runs
+the comparison. They are saved to benchmark_baseline.json next to this
+file (ignored by git) unless --baseline names another path.
+
+The exit status is 1 when any benchmark regresses or exceeds its absolute
+budget in BUDGETS_MS (e.g. CLI startup time).
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional
+
+from simulator import (AircraftConfig, PerformanceCalculator, calculate_mission_energy,
+                       disable_memoization, lbs_to_kg, payload_ratio_analysis)
+from cli import STARTUP_BUDGET_MS, measure_startup
+
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                     'benchmark_baseline.json')
+DEFAULT_TOLERANCE_PCT = 20.0
+
+# Representative designs: 16-rotor multirotor and 4+1 quadplane
+MULTIROTOR = AircraftConfig(
+    aircraft_weight_kg=11.0, num_rotors=16, rotor_diameter_m=0.61,
+    generator_weight_kg=13.0, generator_power_w=15000
+)
+QUADPLANE = AircraftConfig(
+    aircraft_weight_kg=12.0, num_rotors=4, rotor_diameter_m=0.76,
+    has_wing=True, wing_area_m2=1.5,
+    generator_weight_kg=10.0, generator_power_w=12000
+)
+PAYLOAD_KG = lbs_to_kg(110)
+TOTAL_WEIGHT_KG = MULTIROTOR.total_weight() + PAYLOAD_KG
+
+
+def _quiet(func: Callable) -> Callable:
+    """Wrap func so its printed report is discarded"""
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+    return run
+
+
+def _sweep():
+    from optimizer import optimize_rotor_configuration
+    optimize_rotor_configuration(PAYLOAD_KG, lbs_to_kg(55), 13.0, 15000)
+
+
+def _monte_carlo():
+    from monte_carlo import run_monte_carlo
+    run_monte_carlo(n_trials=100_000, seed=0)
+
+
+def _adaptive_monte_carlo():
+    from monte_carlo import run_adaptive_monte_carlo
+    run_adaptive_monte_carlo('sobol', seed=0, payload_kg=PAYLOAD_KG)
+
+
+# Benchmark name -> zero-argument callable
+BENCHMARKS: Dict[str, Callable[[], None]] = {
+    'hover_power_ideal':
+        lambda: PerformanceCalculator(MULTIROTOR).hover_power_ideal(TOTAL_WEIGHT_KG),
+    'forward_flight_power_multirotor':
+        lambda: PerformanceCalculator(MULTIROTOR).forward_flight_power(TOTAL_WEIGHT_KG, 7.5),
+    'forward_flight_power_wing':
+        lambda: PerformanceCalculator(QUADPLANE).forward_flight_power(TOTAL_WEIGHT_KG, 15.0),
+    'calculate_mission_energy':
+        lambda: calculate_mission_energy(MULTIROTOR, PAYLOAD_KG, 7.5),
+    'payload_ratio_analysis':
+        lambda: payload_ratio_analysis(MULTIROTOR, PAYLOAD_KG, 7.5),
+    'optimize_rotor_configuration': _quiet(_sweep),
+    'monte_carlo_simulation': _monte_carlo,
+    'adaptive_monte_carlo_sobol': _adaptive_monte_carlo,
+    'cli_startup': lambda: measure_startup(repeat=1),
+}
+
+# Benchmark name -> maximum time per call in ms, enforced on every run
+BUDGETS_MS: Dict[str, float] = {
+    'cli_startup': STARTUP_BUDGET_MS,
+}
+
+
+@dataclass
+class BenchmarkResult:
+    """Throughput and allocation of one benchmark"""
+    name: str
+    calls_per_sec: float
+    peak_alloc_kib: float
+
+
+def measure(func: Callable[[], None], min_time_s: float = 0.2, repeat: int = 5) -> BenchmarkResult:
+    """
+    Time func and trace its allocations.
+
+    Each of the repeat runs calls func in a loop for at least min_time_s;
+    the fastest run gives calls/sec, which filters out scheduler noise.
+
+    Returns: BenchmarkResult (name left empty)
+    """
+    func()  # warm up imports and caches
+
+    best_rate = 0.0
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time_s:
+            func()
+            calls += 1
+            elapsed = time.perf_counter() - start
+        best_rate = max(best_rate, calls / elapsed)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult('', best_rate, peak / 1024)
+
+
+def run_benchmarks(names: Optional[List[str]] = None,
+                   min_time_s: float = 0.2,
+                   repeat: int = 5) -> List[BenchmarkResult]:
+    """Run the selected benchmarks (default: all) with memoization off"""
+    disable_memoization()
+    results = []
+    for name in names or BENCHMARKS:
+        if name not in BENCHMARKS:
+            raise ValueError(f"Unknown benchmark: {name}")
+        result = measure(BENCHMARKS[name], min_time_s, repeat)
+        result.name = name
+        results.append(result)
+    return results
+
+
+def load_baseline(path: str) -> Dict[str, BenchmarkResult]:
+    """Baselines saved by save_baseline, keyed by benchmark name"""
+    with open(path) as f:
+        data = json.load(f)
+    return {name: BenchmarkResult(name=name, **values) for name, values in data.items()}
+
+
+def save_baseline(results: List[BenchmarkResult], path: str):
+    """Write results as baselines, keeping entries for benchmarks not rerun"""
+    data = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            data = json.load(f)
+    for result in results:
+        values = asdict(result)
+        del values['name']
+        data[result.name] = values
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+
+def find_regressions(results: List[BenchmarkResult],
+                     baseline: Dict[str, BenchmarkResult],
+                     tolerance_pct: float = DEFAULT_TOLERANCE_PCT) -> List[str]:
+    """
+    Names of benchmarks whose throughput fell more than tolerance_pct
+    below baseline (benchmarks without a baseline are skipped).
+    """
+    threshold = 1 - tolerance_pct / 100
+    return [r.name for r in results
+            if r.name in baseline and r.calls_per_sec < baseline[r.name].calls_per_sec * threshold]
+
+
+def find_over_budget(results: List[BenchmarkResult],
+                     budgets_ms: Dict[str, float] = BUDGETS_MS) -> List[str]:
+    """Names of benchmarks slower per call than their budget in BUDGETS_MS"""
+    return [r.name for r in results
+            if r.name in budgets_ms and 1000 / r.calls_per_sec > budgets_ms[r.name]]
+
+
+def print_report(results: List[BenchmarkResult], baseline: Dict[str, BenchmarkResult]):
+    """Print a results table with the change against baseline"""
+    print(f"{'Benchmark':<32} {'Calls/sec':>14} {'Peak alloc':>12} {'vs baseline':>12}")
+    print("-" * 73)
+    for r in results:
+        if r.name in baseline:
+            change = f"{(r.calls_per_sec / baseline[r.name].calls_per_sec - 1) * 100:+.1f}%"
+        else:
+            change = "n/a"
+        print(f"{r.name:<32} {r.calls_per_sec:>14,.1f} {r.peak_alloc_kib:>9,.1f} KiB {change:>12}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the simulator kernels")
+    parser.add_argument('names', nargs='*', help="Benchmarks to run (default: all)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH, help="Baseline file")
+    parser.add_argument('--save', action='store_true', help="Record results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE_PCT,
+                        help="Allowed throughput drop in percent")
+    parser.add_argument('--min-time', type=float, default=0.2, help="Seconds per timed run")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per benchmark")
+    parser.add_argument('--list', action='store_true', help="List benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    results = run_benchmarks(args.names, args.min_time, args.repeat)
+    baseline = load_baseline(args.baseline) if os.path.exists(args.baseline) else {}
+    print_report(results, baseline)
+
+    status = 0
+    over_budget = find_over_budget(results)
+    if over_budget:
+        print("\nOVER BUDGET: " + ", ".join(f"{name} (budget {BUDGETS_MS[name]:g} ms)"
+                                           for name in over_budget))
+        status = 1
+    if args.save:
+        save_baseline(results, args.baseline)
+        print(f"\nBaseline saved to {args.baseline}")
+        return status
+
+    regressions = find_regressions(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\nREGRESSION (>{args.tolerance:g}% slower): {', '.join(regressions)}")
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
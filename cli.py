@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+DARPA Lift Challenge - Command-Line Interface
+
+One entry point for the analyses, each run on its own:
+- sweep: rotor count x diameter sweep for one payload and generator
+- montecarlo: adaptive Monte Carlo uncertainty analysis
+- sensitivity: one-at-a-time and Sobol sensitivity of the baseline design
+- report: validation report against the research estimates
+- failure: motor failure and redundancy analysis
+- requirements: competition rule checklist of the reference design
+
+Usage:
+    python cli.py sweep --payload-lbs 110 --top 5
+    python cli.py montecarlo --sampler sobol --seed 0
+    python cli.py --format ndjson sweep --payload-lbs 110 | my_aggregator
+
+With --format ndjson, results are streamed to stdout as newline-delimited
+JSON (streaming.NDJSONWriter) as they are computed: one 'design' record per
+valid sweep design, one 'mc_batch' record per Monte Carlo round, one
+'requirement' record per rule check, and so on, each followed by a
+closing summary record. The report subcommand is text only. Records are
+held at most half a second before they are written.
+
+The failure summary's max_tolerated_failures is the largest k such that
+every combination of k failed motors stays within the power limit
+(FailureAnalysis.max_tolerated_failures): -1 means even the intact
+aircraft exceeds the limit at the reference payload.
+
+With --cache PATH (default: $LIFT_EVAL_CACHE), payload analysis results
+are read from and stored to a persistent evaluation cache (eval_cache.py),
+so repeated sweeps and reports reuse results from earlier runs.
+
+Only the standard library is imported at startup; each subcommand imports
+the modules it needs when it runs, so a batch of short jobs does not pay
+for numpy and the other analyses. `python cli.py --help` is held to
+STARTUP_BUDGET_MS (see measure_startup and the cli_startup benchmark).
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional
+
+
+# Wall time allowed for `python cli.py --help` (interpreter start included)
+STARTUP_BUDGET_MS = 100.0
+
+# Commands that only print tables (no --format ndjson)
+TEXT_ONLY_COMMANDS = frozenset({'report'})
+
+
+def _writer(args):
+    from streaming import NDJSONWriter
+
+    return NDJSONWriter(max_buffered=args.buffer)
+
+
+def _sweep(args) -> int:
+    from simulator import lbs_to_kg
+
+    sweep_args = dict(
+        target_payload_kg=lbs_to_kg(args.payload_lbs),
+        max_aircraft_weight_kg=lbs_to_kg(args.max_weight_lbs),
+        hybrid_generator_weight_kg=args.generator_kg,
+        hybrid_generator_power_w=args.generator_w,
+        has_wing=args.wing,
+        workers=args.workers or None,
+        optimize_cruise_speed=args.optimize_speed
+    )
+
+    if args.format == 'ndjson':
+        from optimizer import iter_rotor_configurations
+        from result_store import SWEEP_RESULT_KEYS, ResultStore
+        from streaming import TopK
+
+        top = TopK(args.top, 'payload_ratio')
+        kept = [] if args.results else None
+        with _writer(args) as out:
+            for design in iter_rotor_configurations(**sweep_args):
+                out.write('design', design)
+                top.push(design)
+                if kept is not None:
+                    kept.append(design)
+            out.write('summary', designs=top.seen, top=top.results())
+        if kept is not None:
+            kept.sort(key=lambda x: x['payload_ratio'], reverse=True)
+            ResultStore.from_records(kept, SWEEP_RESULT_KEYS).save(args.results)
+        return 0 if top.seen else 1
+
+    from optimizer import optimize_rotor_configuration
+
+    result = optimize_rotor_configuration(**sweep_args, results_path=args.results, keep_all=False)
+    if not result['best']:
+        print("✗ NO FEASIBLE SOLUTION FOUND")
+        return 1
+
+    print(f"\n{'Rotors':>6} {'Diameter':>9} {'Aircraft':>10} {'Ratio':>7} {'Speed':>9} "
+          f"{'Time':>9} {'Peak':>9} {'Energy':>10}")
+    print("-" * 77)
+    for design in result['top_10'][:args.top]:
+        print(f"{design['num_rotors']:>6} {design['rotor_diameter_in']:>8.0f}\" "
+              f"{design['aircraft_weight_lbs']:>6.1f} lbs {design['payload_ratio']:>6.2f}:1 "
+              f"{design['cruise_speed_ms']:>5.1f} m/s {design['mission_time_min']:>5.1f} min "
+              f"{design['peak_power_w']/1000:>6.1f} kW {design['energy_wh']/1000:>6.2f} kWh")
+    return 0
+
+
+def _montecarlo(args) -> int:
+    if args.format == 'ndjson':
+        from dataclasses import asdict
+        from monte_carlo import run_adaptive_monte_carlo
+
+        with _writer(args) as out:
+            result = run_adaptive_monte_carlo(
+                args.sampler, max_trials=args.max_trials, seed=args.seed,
+                on_batch=lambda batch: out.write('mc_batch', batch))
+            out.write('summary', asdict(result))
+        return 0
+
+    from comprehensive_testing import monte_carlo_simulation
+
+    monte_carlo_simulation(n_trials=args.max_trials, seed=args.seed, sampler=args.sampler)
+    return 0
+
+
+def _sensitivity(args) -> int:
+    if args.format == 'ndjson':
+        from optimizer import global_sensitivity
+
+        with _writer(args) as out:
+            indices = global_sensitivity()
+            for output, result in indices.items():
+                for name in result.parameters:
+                    out.write('sobol_index', output=output, parameter=name,
+                              first_order=result.first_order[name],
+                              total_order=result.total_order[name],
+                              first_order_ci=result.first_order_ci[name],
+                              total_order_ci=result.total_order_ci[name],
+                              n_evaluations=result.n_evaluations)
+            out.write('summary', outputs=list(indices))
+        return 0
+
+    from optimizer import sensitivity_analysis
+
+    sensitivity_analysis()
+    return 0
+
+
+def _report(args) -> int:
+    from validation_report import generate_validation_report
+
+    generate_validation_report()
+    return 0
+
+
+def _failure(args) -> int:
+    if args.format == 'ndjson':
+        from comprehensive_testing import motor_failure_records, reference_failure_analysis
+
+        with _writer(args) as out:
+            analysis = reference_failure_analysis()
+            for record in motor_failure_records(analysis=analysis):
+                out.write('motor_failure', record)
+            out.write('summary', max_tolerated_failures=int(analysis.max_tolerated_failures[0]))
+        return 0
+
+    from comprehensive_testing import test_failure_modes
+
+    test_failure_modes()
+    return 0
+
+
+def _requirements(args) -> int:
+    if args.format == 'ndjson':
+        from comprehensive_testing import competition_requirements
+
+        all_pass = True
+        with _writer(args) as out:
+            for requirement, value, passed in competition_requirements():
+                out.write('requirement', requirement=requirement, value=value, passed=passed)
+                all_pass = all_pass and passed
+            out.write('summary', all_passed=all_pass)
+    else:
+        from comprehensive_testing import verify_competition_requirements
+
+        all_pass = verify_competition_requirements()
+    return 0 if all_pass else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argument parser with one subparser per analysis"""
+    parser = argparse.ArgumentParser(description="DARPA Lift Challenge design analyses")
+    parser.add_argument('--time', action='store_true',
+                        help="Report the wall time of the analysis on stderr")
+    parser.add_argument('--format', choices=('table', 'ndjson'), default='table',
+                        help="Human-readable tables or streamed NDJSON records")
+    parser.add_argument('--buffer', type=int, default=1000,
+                        help="NDJSON records buffered between writes")
+    parser.add_argument('--cache', default=os.environ.get('LIFT_EVAL_CACHE'), metavar='PATH',
+                        help="Persistent evaluation cache database (default: $LIFT_EVAL_CACHE)")
+    subparsers = parser.add_subparsers(dest='command', required=True, metavar='command')
+
+    sweep = subparsers.add_parser('sweep', help="Rotor configuration sweep")
+    sweep.add_argument('--payload-lbs', type=float, default=110, help="Target payload")
+    sweep.add_argument('--max-weight-lbs', type=float, default=55, help="Aircraft weight limit")
+    sweep.add_argument('--generator-kg', type=float, default=13.0, help="Generator weight")
+    sweep.add_argument('--generator-w', type=float, default=15000, help="Generator power")
+    sweep.add_argument('--wing', action='store_true', help="Sweep winged (quadplane) designs")
+    sweep.add_argument('--optimize-speed', action='store_true',
+                       help="Score each design at its own best cruise speed")
+    sweep.add_argument('--workers', type=int, default=1, help="Worker processes (0 = all CPUs)")
+    sweep.add_argument('--results', help="Save all valid designs to this .npy file")
+    sweep.add_argument('--top', type=int, default=10, help="Designs to list")
+    sweep.set_defaults(handler=_sweep)
+
+    montecarlo = subparsers.add_parser('montecarlo', help="Monte Carlo uncertainty analysis")
+    montecarlo.add_argument('--sampler', choices=('sobol', 'halton', 'random'), default='sobol')
+    montecarlo.add_argument('--max-trials', type=int, default=1_000_000, help="Trial budget")
+    montecarlo.add_argument('--seed', type=int, help="Random seed (default: fresh entropy)")
+    montecarlo.set_defaults(handler=_montecarlo)
+
+    subparsers.add_parser('sensitivity', help="Parameter sensitivity analysis").set_defaults(
+        handler=_sensitivity)
+    subparsers.add_parser('report', help="Validation report").set_defaults(
+        handler=_report)
+
+    subparsers.add_parser('failure', help="Motor failure analysis").set_defaults(handler=_failure)
+
+    subparsers.add_parser('requirements', help="Competition requirements check").set_defaults(
+        handler=_requirements)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.format == 'ndjson' and args.command in TEXT_ONLY_COMMANDS:
+        parser.error(f"{args.command} has no ndjson output")
+
+    if args.cache:
+        from eval_cache import enable_evaluation_cache
+
+        enable_evaluation_cache(args.cache)
+
+    start = time.perf_counter()
+    try:
+        status = args.handler(args)
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head); stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    if args.time:
+        print(f"{args.command}: {time.perf_counter() - start:.3f} s", file=sys.stderr)
+    return status
+
+
+def measure_startup(repeat: int = 5) -> float:
+    """
+    Best wall time of `python cli.py --help` over repeat runs.
+
+    Returns: Startup time in milliseconds
+    """
+    import subprocess
+
+    command = [sys.executable, os.path.abspath(__file__), '--help']
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,8 +11,32 @@ Runs exhaustive simulations to validate design under all conditions:
 """
 
 from simulator import *
-import random
+from atmosphere import air_density
+from batch_simulator import DesignTable, calculate_mission_energy_batch, payload_ratio_analysis_batch
+from failure_analysis import MOTOR_THRUST_MARGIN, FailureAnalysis, failure_analysis_batch, failure_cases
+from monte_carlo import run_adaptive_monte_carlo
+from solvers import (
+    CRUISE_SPEED_BOUNDS_MS, FeasibilityConstraints, max_feasible_payload, optimal_cruise_speed
+)
+from wind import wind_envelope
 import math
+from typing import Optional
+import numpy as np
+
+
+# 16-rotor reference design and payload of the failure and rules checks
+REFERENCE_DESIGN = AircraftConfig(
+    aircraft_weight_kg=11.0,
+    num_rotors=16,
+    rotor_diameter_m=0.61,
+    hover_efficiency=0.65,
+    cruise_efficiency=0.75,
+    has_wing=False,
+    hybrid_power=True,
+    generator_weight_kg=13.0,
+    generator_power_w=15000
+)
+REFERENCE_PAYLOAD_KG = lbs_to_kg(240)
 
 
 def test_edge_cases():
@@ -101,25 +125,19 @@ def test_edge_cases():
     print("MAXIMUM PAYLOAD SEARCH")
     print("="*80)
 
-    max_feasible_payload = 0
-    max_feasible_ratio = 0
-
-    for payload_lbs in range(110, 350, 10):
-        payload_kg = lbs_to_kg(payload_lbs)
-        try:
-            result = payload_ratio_analysis(base_config, payload_kg)
-
-            power_ok = result['max_power_w'] < base_config.generator_power_w * 1.2
-            time_ok = result['meets_time_requirement']
-
-            if power_ok and time_ok:
-                max_feasible_payload = payload_lbs
-                max_feasible_ratio = result['payload_ratio']
-        except:
-            break
+    # Bisect the power/time feasibility boundary to 0.1 lb
+    boundary_kg = max_feasible_payload(
+        base_config,
+        FeasibilityConstraints(power_limit_factor=1.2),
+        tol_kg=lbs_to_kg(0.1)
+    )
 
-    print(f"\nMaximum feasible payload: {max_feasible_payload} lbs")
-    print(f"Maximum payload ratio: {max_feasible_ratio:.2f}:1")
+    if boundary_kg is None:
+        print("\nNo feasible payload: aircraft cannot fly the mission empty")
+    else:
+        max_feasible_ratio = kg_to_lbs(boundary_kg) / kg_to_lbs(base_config.total_weight())
+        print(f"\nMaximum feasible payload: {kg_to_lbs(boundary_kg):.1f} lbs ({boundary_kg:.2f} kg)")
+        print(f"Maximum payload ratio: {max_feasible_ratio:.2f}:1")
 
     return results
 
@@ -150,9 +168,6 @@ def test_cruise_speed_optimization():
     print(f"{'Speed (m/s)':<12} {'Speed (mph)':<12} {'Time (min)':<12} {'Energy (kWh)':<12} {'Avg Power (kW)':<15} {'Feasible':<10}")
     print("-" * 80)
 
-    best_speed = None
-    best_energy = float('inf')
-
     for speed_ms in [5, 6, 7, 7.5, 8, 9, 10, 11, 12, 13, 14, 15, 17.5, 20]:
         try:
             mission = calculate_mission_energy(config, payload_kg, speed_ms)
@@ -165,10 +180,6 @@ def test_cruise_speed_optimization():
 
             feasible = (time_min < 30 and max_power_kw < config.generator_power_w/1000 * 1.2)
 
-            if feasible and energy_kwh < best_energy:
-                best_energy = energy_kwh
-                best_speed = speed_ms
-
             status = "✓" if feasible else "✗"
 
             print(f"{speed_ms:<12.1f} {speed_mph:<12.1f} {time_min:<12.1f} {energy_kwh:<12.1f} {avg_power_kw:<15.1f} {status:<10}")
@@ -176,6 +187,15 @@ def test_cruise_speed_optimization():
         except Exception as e:
             print(f"{speed_ms:<12.1f} {'N/A':<12} {'N/A':<12} {'N/A':<12} {'ERROR':<15} ✗")
 
+    # Golden-section search for the minimum-energy feasible speed
+    best_speed = optimal_cruise_speed(config, payload_kg, FeasibilityConstraints(power_limit_factor=1.2))
+
+    if best_speed is None:
+        print(f"\n**No feasible cruise speed between {CRUISE_SPEED_BOUNDS_MS[0]:.0f} and {CRUISE_SPEED_BOUNDS_MS[1]:.0f} m/s**")
+        return None, None
+
+    best_energy = calculate_mission_energy(config, payload_kg, best_speed)['totals']['total_energy_wh'] / 1000
+
     print(f"\n**Optimal cruise speed: {best_speed:.1f} m/s ({best_speed*2.237:.1f} mph)**")
     print(f"**Minimum energy: {best_energy:.2f} kWh**")
 
@@ -208,35 +228,27 @@ def test_environmental_conditions():
     print(f"{'Altitude (ft)':<15} {'Air Density':<15} {'Power Change':<15} {'Feasible':<10}")
     print("-" * 60)
 
-    baseline_result = payload_ratio_analysis(config, payload_kg)
-    baseline_power = baseline_result['max_power_w']
-
-    altitudes = [
-        (0, 1.225),      # Sea level
-        (1000, 1.190),   # 1000 ft
-        (2000, 1.155),   # 2000 ft
-        (3000, 1.121),   # 3000 ft
-        (5000, 1.056),   # 5000 ft (Denver altitude)
-    ]
+    table = DesignTable.from_configs([config])
+    baseline_power = payload_ratio_analysis(config, payload_kg)['max_power_w']
 
-    for alt_ft, density_ratio in altitudes:
-        # Air density affects hover power
-        # P ∝ 1/sqrt(rho), so less dense air requires more power
-        adjusted_density = 1.225 * density_ratio
-        power_factor = math.sqrt(1.225 / adjusted_density)
+    # Field elevations, ISA day (5000 ft = Denver altitude)
+    altitudes_ft = [0, 1000, 2000, 3000, 5000]
+    densities = air_density([ft_to_m(alt_ft) for alt_ft in altitudes_ft])
+    peak_power = payload_ratio_analysis_batch(table, payload_kg, air_density=densities)['max_power_w']
 
-        adjusted_power = baseline_power * power_factor
-        power_change_pct = (power_factor - 1) * 100
+    for alt_ft, density, power in zip(altitudes_ft, densities, peak_power):
+        density_ratio = density / AIR_DENSITY_SEA_LEVEL
+        power_change_pct = (power / baseline_power - 1) * 100
 
-        feasible = adjusted_power < config.generator_power_w * 1.2
+        feasible = power < config.generator_power_w * 1.2
         status = "✓" if feasible else "✗"
 
         print(f"{alt_ft:<15} {density_ratio:<15.3f} {power_change_pct:+14.1f}% {status:<10}")
 
     # Temperature effects
     print("\n### Temperature Effects ###\n")
-    print(f"{'Temp (°F)':<15} {'Temp (°C)':<15} {'Impact':<40}")
-    print("-" * 75)
+    print(f"{'Temp (°F)':<15} {'Temp (°C)':<15} {'Power Change':<15} {'Impact':<40}")
+    print("-" * 90)
 
     temps = [
         (40, 4.4, "Cold - battery performance reduced 10-15%"),
@@ -247,8 +259,13 @@ def test_environmental_conditions():
         (105, 40.6, "Very hot - significant cooling needed, risk of overheating"),
     ]
 
-    for temp_f, temp_c, impact in temps:
-        print(f"{temp_f:<15} {temp_c:<15.1f} {impact:<40}")
+    # Sea level, temperature offset from the 15 °C ISA day
+    densities = air_density(0.0, [temp_c - 15.0 for _, temp_c, _ in temps])
+    peak_power = payload_ratio_analysis_batch(table, payload_kg, air_density=densities)['max_power_w']
+
+    for (temp_f, temp_c, impact), power in zip(temps, peak_power):
+        power_change_pct = (power / baseline_power - 1) * 100
+        print(f"{temp_f:<15} {temp_c:<15.1f} {power_change_pct:+14.1f}% {impact:<40}")
 
     print("\n### Wind Effects ###\n")
     print(f"{'Wind (knots)':<15} {'Wind (mph)':<15} {'Impact on Mission':<40}")
@@ -267,68 +284,134 @@ def test_environmental_conditions():
     for wind_kt, wind_mph, impact in winds:
         print(f"{wind_kt:<15} {wind_mph:<15.1f} {impact:<40}")
 
-    # Wind power impact estimate
-    print("\n### Estimated Power Increase with Headwind ###\n")
-    print("Headwind increases drag and reduces effective cruise efficiency.")
-    print(f"{'Headwind (mph)':<20} {'Power Increase':<20} {'Feasible':<10}")
-    print("-" * 55)
-
-    for wind_mph in [0, 5, 10, 15, 20, 25]:
-        # Rough approximation: power increases quadratically with wind
-        power_increase_pct = (wind_mph / 25) ** 2 * 30  # Up to 30% at 25 mph
-        adjusted_power = baseline_power * (1 + power_increase_pct / 100)
-
-        feasible = adjusted_power < config.generator_power_w * 1.2
-        status = "✓" if feasible else "⚠️"
-
-        print(f"{wind_mph:<20} {power_increase_pct:+18.1f}% {status:<10}")
+    # Wind effect on the mission: ground speed sets the cruise leg times
+    print("\n### Mission Time with Wind (7.5 m/s cruise airspeed) ###\n")
+    print("Airspeed sets cruise power; ground speed sets the leg times.")
+    print(f"{'Wind (knots)':<15} {'Headwind':<15} {'Tailwind':<15} {'Crosswind':<15}")
+    print("-" * 60)
 
+    # Directions relative to the loaded (4 nm) leg; the 1 nm leg flies back
+    wind_kt = np.array([0, 5, 10, 15, 20, 25])
+    directions = np.array([0.0, 180.0, 90.0])  # head, tail, cross on the loaded leg
+    mission = calculate_mission_energy_batch(
+        table, payload_kg, 7.5,
+        wind_speed_ms=kt_to_ms(wind_kt)[:, None], wind_from_deg=directions[None, :])
+    times = mission['totals']['total_time_min']
+
+    for kt, row in zip(wind_kt, times):
+        cells = ["unflyable" if np.isnan(t) else f"{t:.1f} min{'' if t < MISSION_TIME_LIMIT_MIN else ' ✗'}"
+                 for t in row]
+        print(f"{kt:<15} " + " ".join(f"{cell:<15}" for cell in cells))
+
+    # Certification against every wind vector up to the competition limit
+    print(f"\n### Wind Envelope (up to {MISSION_MAX_WIND_KT} knots, all directions) ###\n")
+    print(f"{'Cruise (m/s)':<15} {'Feasible winds':<15} {'Worst case':<35} {'Certified':<10}")
+    print("-" * 80)
 
-def test_failure_modes():
-    """Test redundancy and failure scenarios"""
-    print("\n" + "="*80)
-    print("FAILURE MODE ANALYSIS")
-    print("="*80)
+    cruise_speeds = np.array([7.5, 10.0, 12.5, 15.0, 20.0])
+    envelope = wind_envelope(DesignTable.from_configs([config] * len(cruise_speeds)),
+                             payload_kg, cruise_speeds)
 
-    print("\n### Motor Failure Scenarios ###\n")
+    for i, speed in enumerate(cruise_speeds):
+        worst = envelope.worst_case(i)
+        worst_time = ("unflyable" if math.isnan(worst['mission_time_min'])
+                      else f"{worst['mission_time_min']:.1f} min")
+        worst_text = f"{worst['wind_speed_ms']:.1f} m/s from {worst['wind_from_deg']:.0f}°: {worst_time}"
+        status = "✓" if envelope.certified[i] else "✗"
+        print(f"{speed:<15.1f} {envelope.feasible_fraction[i]*100:>12.1f}%  {worst_text:<35} {status:<10}")
 
-    # 16-rotor configuration
-    total_rotors = 16
-    payload_kg = lbs_to_kg(240)
 
-    print(f"Base configuration: {total_rotors} rotors")
-    print(f"Testing with progressive motor failures\n")
+def reference_failure_analysis(config=REFERENCE_DESIGN, payload_kg=REFERENCE_PAYLOAD_KG,
+                               max_failures=6) -> FailureAnalysis:
+    """Failure analysis of a single design (the reference design by default)"""
+    return failure_analysis_batch(DesignTable.from_configs([config]), payload_kg, max_failures)
 
-    print(f"{'Failed Motors':<15} {'Active Motors':<15} {'Power Increase':<20} {'Hover Possible':<15}")
-    print("-" * 70)
 
-    for failed in range(0, 6):
-        active = total_rotors - failed
+def motor_failure_records(config=REFERENCE_DESIGN, payload_kg=REFERENCE_PAYLOAD_KG, max_failures=6,
+                          analysis: Optional[FailureAnalysis] = None):
+    """
+    Motor failure results for 0..max_failures failed motors.
 
-        # With fewer rotors, remaining must work harder
-        # Power per rotor increases proportionally
-        power_increase_pct = (total_rotors / active - 1) * 100 if active > 0 else float('inf')
+    Args:
+        analysis: reference_failure_analysis result for the same arguments,
+                  if already computed
 
-        # Assuming base config can hover with some margin
-        # Typically need at least 4 rotors for stability (quadcopter)
-        # With 16, can lose up to 4 and still have 12 (plenty of redundancy)
+    Yields: One dict per failure count
+    """
+    cases = failure_cases(config.num_rotors, max_failures)
+    if analysis is None:
+        analysis = reference_failure_analysis(config, payload_kg, max_failures)
 
-        can_hover = active >= 8  # Conservative: need at least half
-        safe_landing = active >= 4  # Can land safely with 4+
+    for failed in range(max_failures + 1):
+        controllable = analysis.controllable_fraction[0, failed]
+        survivable = analysis.survivable_fraction[0, failed]
 
-        if can_hover:
+        if survivable == 1.0:
             status = "✓ Full capability"
-        elif safe_landing:
-            status = "⚠️ Emergency landing only"
+        elif survivable > 0:
+            status = f"⚠️ {survivable*100:.0f}% of cases"
+        elif controllable > 0:
+            status = "⚠️ Over power limit"
         else:
             status = "✗ Crash likely"
 
-        print(f"{failed:<15} {active:<15} {power_increase_pct:+18.1f}% {status:<15}")
+        yield {
+            'failed_motors': failed,
+            'combinations': cases.combinations(failed),
+            'unique_cases': cases.unique_cases(failed),
+            'controllable_fraction': controllable,
+            'survivable_fraction': survivable,
+            'worst_rotor_power_w': analysis.worst_rotor_power_w[0, failed],
+            'worst_hover_power_w': analysis.worst_hover_power_w[0, failed],
+            'rotor_power_increase_pct': (analysis.worst_rotor_power_w[0, failed] /
+                                         analysis.nominal_rotor_power_w[0] - 1) * 100,
+            'status': status,
+        }
 
+
+def test_failure_modes():
+    """Test redundancy and failure scenarios"""
+    print("\n" + "="*80)
+    print("FAILURE MODE ANALYSIS")
+    print("="*80)
+
+    print("\n### Motor Failure Scenarios ###\n")
+
+    config = REFERENCE_DESIGN
+    total_rotors = config.num_rotors
+    payload_kg = REFERENCE_PAYLOAD_KG
+    max_failures = 6
+
+    print(f"Base configuration: {total_rotors} rotors on a ring, alternating spin")
+    print(f"Every failure combination, thrust redistributed to trim roll/pitch/yaw")
+    print(f"Motors rated for {MOTOR_THRUST_MARGIN:.0f}x nominal hover thrust\n")
+
+    print(f"{'Failed Motors':<15} {'Combinations':<14} {'Unique Cases':<14} {'Controllable':>13}  "
+          f"{'Worst Rotor Power':>18}  {'Hover Possible':<15}")
+    print("-" * 95)
+
+    records = list(motor_failure_records(config, payload_kg, max_failures))
+    for record in records:
+        print(f"{record['failed_motors']:<15} {record['combinations']:<14} {record['unique_cases']:<14} "
+              f"{record['controllable_fraction']*100:>12.1f}%  "
+              f"{record['rotor_power_increase_pct']:>+17.1f}%  {record['status']:<15}")
+
+    always_controllable = next((r['failed_motors'] for r in records
+                                if r['controllable_fraction'] < 1.0), max_failures + 1) - 1
+    tolerated = next((r['failed_motors'] for r in records
+                      if r['survivable_fraction'] < 1.0), max_failures + 1) - 1
     print("\n**Redundancy Assessment:**")
-    print(f"  - Can lose 3-4 motors and maintain full mission capability")
-    print(f"  - Can lose up to 12 motors and still land safely")
-    print(f"  - 16-rotor design provides excellent redundancy")
+    print(f"  - Any {always_controllable} motors can fail and the aircraft stays controllable")
+    print(f"  - Hover power with all motors: {records[0]['worst_hover_power_w']/1000:.1f} kW; "
+          f"worst case after {always_controllable} failures: "
+          f"{records[always_controllable]['worst_hover_power_w']/1000:.1f} kW "
+          f"(generator limit {FeasibilityConstraints().power_limit_w(config.generator_power_w)/1000:.1f} kW)")
+    if tolerated >= 0:
+        print(f"  - Survives any {tolerated} failures within the power limit "
+              f"at {kg_to_lbs(payload_kg):.0f} lb payload")
+    else:
+        print(f"  - Hover exceeds the power limit even with all motors "
+              f"at {kg_to_lbs(payload_kg):.0f} lb payload")
 
     print("\n### Generator Failure Scenarios ###\n")
 
@@ -403,10 +486,10 @@ def test_weight_sensitivity():
     print("  - Need 5-10% weight contingency in design")
 
 
-def monte_carlo_simulation(n_trials=1000):
-    """Monte Carlo simulation with parameter uncertainty"""
+def monte_carlo_simulation(n_trials=1_000_000, seed=None, sampler='sobol'):
+    """Monte Carlo simulation with parameter uncertainty (n_trials is the budget)"""
     print("\n" + "="*80)
-    print(f"MONTE CARLO UNCERTAINTY ANALYSIS ({n_trials} trials)")
+    print(f"MONTE CARLO UNCERTAINTY ANALYSIS ({sampler}, up to {n_trials:,} trials)")
     print("="*80)
 
     print("\nSimulating realistic parameter variations:")
@@ -415,191 +498,96 @@ def monte_carlo_simulation(n_trials=1000):
     print("  - Generator power: -10% to +5% (performance variation)")
     print("  - Cruise efficiency: 0.70 to 0.80 (nominal 0.75)")
 
-    # Nominal configuration
-    nominal_aircraft_weight = 24.0  # kg
-    nominal_generator_weight = 13.0  # kg
-
-    successful_missions = 0
-    ratios = []
-    times = []
-    energies = []
-
-    payload_kg = lbs_to_kg(240)
-
-    for trial in range(n_trials):
-        # Random parameter variations
-        hover_eff = random.uniform(0.60, 0.70)
-        cruise_eff = random.uniform(0.70, 0.80)
-        weight_factor = random.uniform(0.95, 1.15)
-        gen_power_factor = random.uniform(0.90, 1.05)
-
-        aircraft_weight = nominal_aircraft_weight * weight_factor
-        gen_power = 15000 * gen_power_factor
-
-        # Skip if over weight limit
-        total_aircraft_lbs = kg_to_lbs(aircraft_weight + nominal_generator_weight)
-        if total_aircraft_lbs > 55:
-            continue
-
-        try:
-            config = AircraftConfig(
-                aircraft_weight_kg=aircraft_weight - nominal_generator_weight,
-                num_rotors=16,
-                rotor_diameter_m=0.61,
-                hover_efficiency=hover_eff,
-                cruise_efficiency=cruise_eff,
-                has_wing=False,
-                hybrid_power=True,
-                generator_weight_kg=nominal_generator_weight,
-                generator_power_w=gen_power
-            )
-
-            result = payload_ratio_analysis(config, payload_kg)
-
-            # Check if mission succeeds
-            power_ok = result['max_power_w'] < gen_power * 1.2
-            time_ok = result['meets_time_requirement']
-
-            if power_ok and time_ok:
-                successful_missions += 1
-                ratios.append(result['payload_ratio'])
-                times.append(result['mission_time_min'])
-                energies.append(result['mission_energy_wh'] / 1000)
-
-        except:
-            pass
-
-    success_rate = successful_missions / n_trials * 100
+    result = run_adaptive_monte_carlo(sampler, max_trials=n_trials, seed=seed)
+    success_rate = result.success_rate
+    ci_low, ci_high = result.success_ci
 
     print(f"\n**Results:**")
-    print(f"  Successful missions: {successful_missions}/{n_trials} ({success_rate:.1f}%)")
-
-    if successful_missions > 0:
-        avg_ratio = sum(ratios) / len(ratios)
-        min_ratio = min(ratios)
-        max_ratio = max(ratios)
+    status = "converged" if result.converged else "budget exhausted before convergence"
+    print(f"  Samples used: {result.n_trials:,} of {n_trials:,} ({status})")
+    print(f"  Successful missions: {result.n_success:,}/{result.n_trials:,} ({success_rate:.1f}%)")
+    print(f"  {result.confidence:.0%} confidence interval: {ci_low:.2f}% to {ci_high:.2f}%")
 
-        avg_time = sum(times) / len(times)
-        max_time = max(times)
-
-        avg_energy = sum(energies) / len(energies)
-        max_energy = max(energies)
+    if result.n_success > 0:
+        ratio = result.payload_ratio
+        times = result.mission_time_min
+        energy = result.mission_energy_kwh
 
         print(f"\n  Payload Ratio:")
-        print(f"    Average: {avg_ratio:.2f}:1")
-        print(f"    Range: {min_ratio:.2f}:1 to {max_ratio:.2f}:1")
+        print(f"    Average: {ratio['mean']:.2f}:1")
+        print(f"    Range: {ratio['min']:.2f}:1 to {ratio['max']:.2f}:1")
+        print(f"    5th/50th/95th percentile: {ratio['p5']:.2f} / {ratio['p50']:.2f} / {ratio['p95']:.2f}")
 
         print(f"\n  Mission Time:")
-        print(f"    Average: {avg_time:.1f} minutes")
-        print(f"    Maximum: {max_time:.1f} minutes")
-        print(f"    Margin: {30 - max_time:.1f} minutes")
+        print(f"    Average: {times['mean']:.1f} minutes")
+        print(f"    Maximum: {times['max']:.1f} minutes")
+        print(f"    Margin: {30 - times['max']:.1f} minutes")
 
         print(f"\n  Energy Consumption:")
-        print(f"    Average: {avg_energy:.1f} kWh")
-        print(f"    Maximum: {max_energy:.1f} kWh")
-
-        # Risk assessment
-        if success_rate > 95:
-            risk = "LOW - Very robust design"
-        elif success_rate > 85:
-            risk = "MODERATE - Good design with some uncertainty"
-        elif success_rate > 70:
-            risk = "ELEVATED - Marginal design, may have issues"
-        else:
-            risk = "HIGH - Design likely to fail"
+        print(f"    Average: {energy['mean']:.1f} kWh")
+        print(f"    Maximum: {energy['max']:.1f} kWh")
+        print(f"    5th/50th/95th percentile: {energy['p5']:.1f} / {energy['p50']:.1f} / {energy['p95']:.1f} kWh")
 
-        print(f"\n**Risk Assessment: {risk}**")
+        print(f"\n**Risk Assessment: {result.risk}**")
 
     return success_rate
 
 
-def verify_competition_requirements():
-    """Verify all competition requirements are met"""
-    print("\n" + "="*80)
-    print("COMPETITION REQUIREMENTS VERIFICATION")
-    print("="*80)
-
-    config = AircraftConfig(
-        aircraft_weight_kg=11.0,
-        num_rotors=16,
-        rotor_diameter_m=0.61,
-        hover_efficiency=0.65,
-        cruise_efficiency=0.75,
-        has_wing=False,
-        hybrid_power=True,
-        generator_weight_kg=13.0,
-        generator_power_w=15000
-    )
-
-    payload_kg = lbs_to_kg(240)
-    aircraft_lbs = kg_to_lbs(config.total_weight())
-
-    print("\n### Rule Compliance Checklist ###\n")
-
-    requirements = []
+def competition_requirements(config=REFERENCE_DESIGN, payload_kg=REFERENCE_PAYLOAD_KG):
+    """
+    Check a design against the competition rules, one rule at a time.
 
+    Yields: (requirement, value, passed) for each rule
+    """
     # 2.1 Weight Limit
-    weight_ok = aircraft_lbs < 55
-    requirements.append(("2.1 - Aircraft weight < 55 lbs",
-                        f"{aircraft_lbs:.1f} lbs",
-                        weight_ok))
+    aircraft_lbs = kg_to_lbs(config.total_weight())
+    yield ("2.1 - Aircraft weight < 55 lbs", f"{aircraft_lbs:.1f} lbs", aircraft_lbs < 55)
 
     # 2.2 VTOL capable
-    requirements.append(("2.2 - VTOL capable",
-                        "Multirotor design",
-                        True))
+    yield ("2.2 - VTOL capable", "Multirotor design", True)
 
     # 2.3 VLOS
-    requirements.append(("2.3 - Visual Line of Sight",
-                        "Pilot controlled",
-                        True))
+    yield ("2.3 - Visual Line of Sight", "Pilot controlled", True)
 
     # 2.4 Remote ID
-    requirements.append(("2.4 - Remote ID compliance",
-                        "Module can be added",
-                        True))
+    yield ("2.4 - Remote ID compliance", "Module can be added", True)
 
     # 2.7 Heavier than air
-    requirements.append(("2.7 - Heavier than air (no helium)",
-                        "Multirotor, no LTA",
-                        True))
+    yield ("2.7 - Heavier than air (no helium)", "Multirotor, no LTA", True)
 
     # 3.2 Minimum payload
     payload_lbs = kg_to_lbs(payload_kg)
-    payload_ok = payload_lbs >= 110
-    requirements.append(("3.2 - Minimum 110 lb payload to score",
-                        f"{payload_lbs:.0f} lbs",
-                        payload_ok))
+    yield ("3.2 - Minimum 110 lb payload to score", f"{payload_lbs:.0f} lbs", payload_lbs >= 110)
 
     # 4.1 Flight path (5 nm total)
-    requirements.append(("4.1 - 5 nm flight path",
-                        "Simulated in analysis",
-                        True))
+    yield ("4.1 - 5 nm flight path", "Simulated in analysis", True)
 
     # 4.2 Altitude (350 ft ±50)
-    requirements.append(("4.2 - 350 ft AGL ±50 ft",
-                        "Autopilot capable",
-                        True))
+    yield ("4.2 - 350 ft AGL ±50 ft", "Autopilot capable", True)
 
     # 4.6 Time limit
     result = payload_ratio_analysis(config, payload_kg)
-    time_ok = result['mission_time_min'] < 30
-    requirements.append(("4.6 - Mission time < 30 minutes",
-                        f"{result['mission_time_min']:.1f} minutes",
-                        time_ok))
+    yield ("4.6 - Mission time < 30 minutes", f"{result['mission_time_min']:.1f} minutes",
+           result['mission_time_min'] < 30)
 
     # Performance target
-    ratio_target = result['payload_ratio'] >= 4.0
-    requirements.append(("GOAL - Payload ratio ≥ 4:1",
-                        f"{result['payload_ratio']:.2f}:1",
-                        ratio_target))
+    yield ("GOAL - Payload ratio ≥ 4:1", f"{result['payload_ratio']:.2f}:1",
+           result['payload_ratio'] >= 4.0)
 
-    # Print results
-    for req, value, passed in requirements:
+
+def verify_competition_requirements():
+    """Verify all competition requirements are met"""
+    print("\n" + "="*80)
+    print("COMPETITION REQUIREMENTS VERIFICATION")
+    print("="*80)
+
+    print("\n### Rule Compliance Checklist ###\n")
+
+    all_pass = True
+    for req, value, passed in competition_requirements():
         status = "✓ PASS" if passed else "✗ FAIL"
         print(f"{req:<45} {value:<25} {status}")
-
-    all_pass = all(r[2] for r in requirements)
+        all_pass = all_pass and passed
 
     print(f"\n{'='*80}")
     if all_pass:
@@ -626,7 +614,7 @@ def run_all_tests():
     test_environmental_conditions()
     test_failure_modes()
     test_weight_sensitivity()
-    success_rate = monte_carlo_simulation(n_trials=500)
+    success_rate = monte_carlo_simulation(n_trials=1_000_000)
     all_requirements_met = verify_competition_requirements()
 
     # Final summary
@@ -635,8 +623,11 @@ def run_all_tests():
     print("="*80)
 
     print(f"\n**Key Results:**")
-    print(f"  ✓ Optimal cruise speed: {optimal_speed:.1f} m/s ({optimal_speed*2.237:.1f} mph)")
-    print(f"  ✓ Minimum mission energy: {optimal_energy:.1f} kWh")
+    if optimal_speed is not None:
+        print(f"  ✓ Optimal cruise speed: {optimal_speed:.1f} m/s ({optimal_speed*2.237:.1f} mph)")
+        print(f"  ✓ Minimum mission energy: {optimal_energy:.1f} kWh")
+    else:
+        print(f"  ✗ No feasible cruise speed at this payload")
     print(f"  ✓ Monte Carlo success rate: {success_rate:.1f}%")
     print(f"  ✓ Competition requirements: {'ALL MET' if all_requirements_met else 'SOME FAILED'}")
 
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+DARPA Lift Challenge - Persistent Evaluation Cache
+
+On-disk, content-addressed cache of payload_ratio_analysis results shared
+by every script and process on a machine:
+- evaluation_key: stable hash of the AircraftConfig fields, payload,
+  cruise speed, flight conditions and simulator.PHYSICS_VERSION
+- EvaluationCache: SQLite store with batch lookup/insert, LRU eviction
+  beyond max_entries, and WAL-mode access from concurrent processes
+- enable_evaluation_cache / evaluation_cache: install a cache as the
+  persistent layer of simulator.payload_ratio_analysis
+
+Bumping simulator.PHYSICS_VERSION changes every key, so results from an
+older physics model are never returned; they age out through eviction.
+Set LIFT_EVAL_CACHE to a database path to enable the cache for the
+analysis scripts and cli.py (enable_from_environment).
+
+Layered under the in-process memoization of simulator.py: memoization
+avoids repeated work within a run, this cache across runs. New results
+are buffered and written in batches, one transaction per flush.
+"""
+
+import atexit
+import hashlib
+import operator
+import os
+import sqlite3
+import struct
+import time
+from contextlib import contextmanager
+from dataclasses import fields
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import simulator
+from simulator import AircraftConfig, AIR_DENSITY_SEA_LEVEL, PayloadAnalysis, PHYSICS_VERSION
+
+
+# Environment variable naming the cache database of the analysis scripts
+CACHE_PATH_ENV = 'LIFT_EVAL_CACHE'
+
+DEFAULT_MAX_ENTRIES = 1_000_000
+
+# New results buffered before they are written
+DEFAULT_FLUSH_SIZE = 1000
+
+# Eviction trims the store to this fraction of max_entries, so it runs
+# once per many inserts rather than on every one
+_EVICTION_TARGET = 0.9
+
+# Stored value: the PayloadAnalysis constructor fields as little-endian
+# doubles (exact, and NaN-safe unlike SQLite REAL columns)
+_VALUE_FIELDS = ('aircraft_weight_kg', 'payload_kg', 'mission_time_min',
+                 'mission_energy_wh', 'max_power_w', 'avg_power_w')
+_VALUE_FORMAT = struct.Struct('<6d')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluations (
+    key BLOB PRIMARY KEY,
+    value BLOB NOT NULL,
+    used INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS evaluations_used ON evaluations (used);
+"""
+
+# SQLite limit on bound parameters per statement (conservative)
+_MAX_PARAMETERS = 900
+
+# Keys hash the config fields and the five evaluation inputs packed as
+# doubles (so 11 and 11.0 share an entry), under a hash key derived from
+# the physics version and the config field names
+_CONFIG_FIELDS = tuple(f.name for f in fields(AircraftConfig))
+_config_values = operator.attrgetter(*_CONFIG_FIELDS)
+_KEY_FORMAT = struct.Struct(f'<{len(_CONFIG_FIELDS) + 5}d')
+_KEY_SALT = hashlib.blake2b(repr((PHYSICS_VERSION, _CONFIG_FIELDS)).encode(),
+                            digest_size=32).digest()
+
+# (config, payload_kg, cruise_speed_ms, air_density, wind_speed_ms, wind_from_deg)
+Evaluation = Tuple[AircraftConfig, float, float, float, float, float]
+
+
+def evaluation_key(config: AircraftConfig, payload_kg: float, cruise_speed_ms: float = 7.5,
+                   air_density: float = AIR_DENSITY_SEA_LEVEL, wind_speed_ms: float = 0.0,
+                   wind_from_deg: float = 0.0) -> bytes:
+    """
+    Content address of one payload_ratio_analysis evaluation.
+
+    Returns: 16-byte digest
+    """
+    data = _KEY_FORMAT.pack(*_config_values(config), payload_kg, cruise_speed_ms,
+                            air_density, wind_speed_ms, wind_from_deg)
+    return hashlib.blake2b(data, digest_size=16, key=_KEY_SALT).digest()
+
+
+def _pack(result: PayloadAnalysis) -> bytes:
+    return _VALUE_FORMAT.pack(*(getattr(result, name) for name in _VALUE_FIELDS))
+
+
+def _unpack(value: bytes) -> PayloadAnalysis:
+    return PayloadAnalysis(*_VALUE_FORMAT.unpack(value))
+
+
+class EvaluationCache:
+    """
+    SQLite-backed persistent cache of payload analysis results.
+
+    Each process opens its own connection (reopened after a fork), and the
+    database runs in WAL mode with a busy timeout, so sweeps in several
+    processes can share one file. Entries record when they were last used;
+    once the store exceeds max_entries the least recently used are evicted.
+
+    Args:
+        path: Database file (created if missing)
+        max_entries: Entries kept before eviction
+        flush_size: New results buffered before they are written
+        timeout_s: How long to wait for another process's write lock
+    """
+
+    def __init__(self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 flush_size: int = DEFAULT_FLUSH_SIZE, timeout_s: float = 30.0):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.path = path
+        self.max_entries = max_entries
+        self.flush_size = flush_size
+        self.timeout_s = timeout_s
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._connection = None
+        self._pid = None
+        self._pending: Dict[bytes, bytes] = {}   # computed, not yet written
+        self._prefetched: Dict[bytes, bytes] = {}
+        self._used: set = set()                  # hit keys whose use time to refresh
+
+    # -- storage -----------------------------------------------------------
+
+    def _db(self) -> sqlite3.Connection:
+        """This process's connection (a forked child must not reuse its parent's)"""
+        if self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout_s,
+                                         isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, PayloadAnalysis]:
+        """
+        Batch lookup.
+
+        Returns: {key: PayloadAnalysis} for the keys found
+        """
+        found = {}
+        missing = []
+        for key in keys:
+            value = self._pending.get(key) or self._prefetched.get(key)
+            if value is not None:
+                found[key] = _unpack(value)
+            else:
+                missing.append(key)
+
+        db = self._db()
+        for start in range(0, len(missing), _MAX_PARAMETERS):
+            chunk = missing[start:start + _MAX_PARAMETERS]
+            rows = db.execute(
+                f"SELECT key, value FROM evaluations WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk).fetchall()
+            for key, value in rows:
+                found[key] = _unpack(value)
+                self._used.add(key)
+        return found
+
+    def put_many(self, items: Iterable[Tuple[bytes, PayloadAnalysis]]):
+        """Batch insert (written in one transaction, then evicts if over size)"""
+        rows = [(key, _pack(result)) for key, result in items]
+        if rows:
+            self._write(rows)
+
+    def _write(self, rows: List[Tuple[bytes, bytes]]):
+        now = time.time_ns()
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.executemany("INSERT OR REPLACE INTO evaluations (key, value, used) VALUES (?, ?, ?)",
+                           [(key, value, now) for key, value in rows])
+            if self._used:
+                db.executemany("UPDATE evaluations SET used = ? WHERE key = ?",
+                               [(now, key) for key in self._used])
+            size = db.execute("SELECT count(*) FROM evaluations").fetchone()[0]
+            if size > self.max_entries:
+                excess = size - int(self.max_entries * _EVICTION_TARGET)
+                db.execute("DELETE FROM evaluations WHERE key IN "
+                           "(SELECT key FROM evaluations ORDER BY used LIMIT ?)", (excess,))
+                self.evictions += excess
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        self._used.clear()
+
+    def flush(self):
+        """
+        Write buffered results, refresh the use time of hits and drop
+        prefetched results that were not consumed (e.g. keys the memo layer
+        answered first).
+        """
+        self._prefetched.clear()
+        self._write_pending()
+
+    def _write_pending(self):
+        """Write buffered results and refresh the use time of hits"""
+        if self._pending or self._used:
+            self._write(list(self._pending.items()))
+            self._pending.clear()
+
+    # -- evaluation ----------------------------------------------------------
+
+    def prefetch(self, evaluations: Iterable[Evaluation]):
+        """
+        Load the stored results of many upcoming evaluations in one query,
+        so the get_or_compute calls that follow skip the database.
+        """
+        keys = [evaluation_key(*evaluation) for evaluation in evaluations]
+        for key, result in self.get_many(keys).items():
+            self._prefetched[key] = _pack(result)
+
+    def get_or_compute(self, config: AircraftConfig, payload_kg: float, cruise_speed_ms: float,
+                       air_density: float, wind_speed_ms: float, wind_from_deg: float,
+                       compute: Callable[[], PayloadAnalysis]) -> PayloadAnalysis:
+        """Return the stored result of an evaluation, computing and storing it on a miss"""
+        key = evaluation_key(config, payload_kg, cruise_speed_ms, air_density,
+                             wind_speed_ms, wind_from_deg)
+        value = self._prefetched.pop(key, None) or self._pending.get(key)
+        if value is None:
+            row = self._db().execute("SELECT value FROM evaluations WHERE key = ?",
+                                     (key,)).fetchone()
+            if row is not None:
+                value = row[0]
+                self._used.add(key)
+        if value is not None:
+            self.hits += 1
+            return _unpack(value)
+
+        self.misses += 1
+        result = compute()
+        self._pending[key] = _pack(result)
+        if len(self._pending) >= self.flush_size:
+            # Keep the prefetched results the rest of the batch will use
+            self._write_pending()
+        return result
+
+    # -- maintenance -------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._db().execute("SELECT count(*) FROM evaluations").fetchone()[0] + len(self._pending)
+
+    def clear(self):
+        """Delete every stored result and reset the counters"""
+        self._pending.clear()
+        self._prefetched.clear()
+        self._used.clear()
+        self._db().execute("DELETE FROM evaluations")
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict:
+        """Cache counters (this process only)"""
+        lookups = self.hits + self.misses
+        return {
+            'path': self.path,
+            'size': len(self),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def close(self):
+        """Flush and close this process's connection"""
+        if self._pid == os.getpid():
+            self.flush()
+            self._connection.close()
+        self._connection = None
+        self._pid = None
+
+    def __enter__(self) -> 'EvaluationCache':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def enable_evaluation_cache(path: str, max_entries: int = DEFAULT_MAX_ENTRIES) -> EvaluationCache:
+    """
+    Make payload_ratio_analysis read and write the cache at path.
+
+    The cache is flushed when the process exits.
+
+    Returns: The active cache
+    """
+    disable_evaluation_cache()
+    cache = EvaluationCache(path, max_entries)
+    simulator.set_evaluation_cache(cache)
+    atexit.register(cache.close)
+    return cache
+
+
+def disable_evaluation_cache():
+    """Flush and detach the active cache"""
+    cache = simulator.get_evaluation_cache()
+    if cache is not None:
+        simulator.set_evaluation_cache(None)
+        atexit.unregister(cache.close)
+        cache.close()
+
+
+def enable_from_environment() -> Optional[EvaluationCache]:
+    """Enable the cache named by $LIFT_EVAL_CACHE, if set"""
+    path = os.environ.get(CACHE_PATH_ENV)
+    return enable_evaluation_cache(path) if path else None
+
+
+@contextmanager
+def evaluation_cache(path: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+    """Context manager that enables the persistent cache for the enclosed block"""
+    previous = simulator.get_evaluation_cache()
+    simulator.set_evaluation_cache(None)
+    cache = EvaluationCache(path, max_entries)
+    simulator.set_evaluation_cache(cache)
+    try:
+        yield cache
+    finally:
+        cache.close()
+        simulator.set_evaluation_cache(previous)
+
+
+if __name__ == "__main__":
+    import tempfile
+    from simulator import lbs_to_kg, payload_ratio_analysis
+
+    configs = [AircraftConfig(aircraft_weight_kg=weight, num_rotors=rotors, rotor_diameter_m=diameter,
+                              generator_weight_kg=13.0, generator_power_w=15000)
+               for weight in (9.0, 10.0, 11.0, 12.0)
+               for rotors in (8, 12, 16)
+               for diameter in (0.46, 0.51, 0.56, 0.61, 0.66, 0.71, 0.76)]
+    speeds = [6.0 + 0.25 * i for i in range(17)]
+    payload = lbs_to_kg(110)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'evaluations.sqlite')
+        for run in ('cold', 'warm'):
+            with evaluation_cache(path) as cache:
+                start = time.perf_counter()
+                cache.prefetch((config, payload, speed, AIR_DENSITY_SEA_LEVEL, 0.0, 0.0)
+                               for config in configs for speed in speeds)
+                results = [payload_ratio_analysis(config, payload, speed)
+                           for config in configs for speed in speeds]
+                elapsed = time.perf_counter() - start
+                stats = cache.stats()
+            print(f"{run}: {len(results):,} evaluations in {elapsed*1000:.1f} ms "
+                  f"({stats['hits']:,} hits, {stats['misses']:,} misses, {stats['size']:,} stored)")
+
+        uncached = [payload_ratio_analysis(config, payload, speed)
+                    for config in configs for speed in speeds]
+        assert all(a.to_dict() == b.to_dict() for a, b in zip(results, uncached))
+        print("Cached results match the simulator")
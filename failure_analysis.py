@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+DARPA Lift Challenge - Motor Failure Analysis
+
+Checks whether a multirotor can still hover after any combination of
+motor failures:
+- rotor_layout: rotors evenly spaced on a ring with alternating spin
+- failure_cases: every failure combination, reduced by the layout's
+  symmetries, with the thrust redistribution of each remaining case
+- failure_analysis_batch: per-rotor and total hover power of every case
+  for many designs, summarised per number of failed motors
+
+Thrust is redistributed with the minimum-norm (pseudo-inverse) allocation
+that keeps total thrust equal to weight and the roll, pitch and yaw
+moments at zero (rotor torque taken proportional to thrust). A case is
+controllable when that allocation exists without negative thrust and no
+rotor exceeds MOTOR_THRUST_MARGIN times its nominal hover thrust.
+
+The allocation is independent of arm length and aircraft weight, so it is
+solved once per layout and reused by every design with that rotor count.
+Failure sets that map onto each other under a rotation or mirror of the
+airframe (spin directions preserved or all reversed) need the same power,
+so only one representative of each is solved; a 16-rotor ring has 65,536
+failure sets but 2,250 distinct cases.
+"""
+
+import functools
+import itertools
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from simulator import AIR_DENSITY_SEA_LEVEL, GRAVITY
+from batch_simulator import DesignTable
+from solvers import FeasibilityConstraints
+
+
+# Maximum rotor thrust / nominal hover thrust (2:1 thrust-to-weight motors)
+MOTOR_THRUST_MARGIN = 2.0
+
+# Allocation residual below which a case counts as trimmed
+_TRIM_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class RotorLayout:
+    """Rotor positions (unit arm radius) and spin directions (+1 / -1)"""
+    num_rotors: int
+    x: np.ndarray
+    y: np.ndarray
+    spin: np.ndarray
+
+    def symmetries(self) -> np.ndarray:
+        """
+        Rotor permutations that leave the allocation problem unchanged.
+
+        Rotations and mirrors of the ring qualify when they preserve every
+        spin direction or reverse all of them (yaw balance is unaffected by
+        a global sign flip).
+
+        Returns: (G, num_rotors) array; row g maps rotor i to rotor [g, i]
+        """
+        n = self.num_rotors
+        index = np.arange(n)
+        candidates = [(index + k) % n for k in range(n)] + [(k - index) % n for k in range(n)]
+        return np.array([perm for perm in candidates
+                         if np.array_equal(self.spin[perm], self.spin) or
+                         np.array_equal(self.spin[perm], -self.spin)])
+
+
+def rotor_layout(num_rotors: int) -> RotorLayout:
+    """
+    Evenly spaced ring of rotors with alternating spin directions.
+
+    Raises ValueError for odd rotor counts, which cannot alternate spins
+    around the ring.
+    """
+    if num_rotors < 2 or num_rotors % 2:
+        raise ValueError("Rotor ring needs an even number of rotors (at least 2)")
+    angle = 2 * np.pi * np.arange(num_rotors) / num_rotors
+    spin = np.where(np.arange(num_rotors) % 2 == 0, 1.0, -1.0)
+    return RotorLayout(num_rotors, np.cos(angle), np.sin(angle), spin)
+
+
+@dataclass(frozen=True)
+class FailureCases:
+    """
+    Distinct failure cases of a rotor layout.
+
+    Arrays have one row per representative case (M rows); multiplicity
+    counts the failure combinations that case stands for.
+    """
+    layout: RotorLayout
+    failed: np.ndarray           # (M, num_rotors) bool
+    num_failed: np.ndarray       # (M,)
+    multiplicity: np.ndarray     # (M,)
+    thrust_fraction: np.ndarray  # (M, num_rotors) share of total thrust per rotor
+    trimmable: np.ndarray        # (M,) allocation exists with no negative thrust
+
+    @property
+    def max_thrust_fraction(self) -> np.ndarray:
+        """Largest single-rotor share of total thrust in each case"""
+        return self.thrust_fraction.max(axis=1)
+
+    @property
+    def power_factor(self) -> np.ndarray:
+        """Sum of thrust_fraction^1.5 (hover power scales with it)"""
+        return np.sum(self.thrust_fraction ** 1.5, axis=1)
+
+    def combinations(self, num_failed: int) -> int:
+        """Number of failure combinations with num_failed motors out"""
+        return int(self.multiplicity[self.num_failed == num_failed].sum())
+
+    def unique_cases(self, num_failed: int) -> int:
+        """Number of distinct cases with num_failed motors out"""
+        return int(np.count_nonzero(self.num_failed == num_failed))
+
+
+def _canonical_failure_sets(layout: RotorLayout, num_failed: int):
+    """
+    Representatives of all num_failed-motor failure sets under the layout
+    symmetries.
+
+    Returns: (failed masks (M, n) bool, multiplicity (M,))
+    """
+    n = layout.num_rotors
+    index = np.array(list(itertools.combinations(range(n), num_failed)), dtype=np.int64)
+    failed = np.zeros((len(index), n), dtype=bool)
+    failed[np.arange(len(index))[:, None], index] = True
+
+    # Smallest bitmask over all symmetric images identifies the orbit
+    bit_values = np.int64(1) << np.arange(n, dtype=np.int64)
+    images = failed[:, layout.symmetries()] @ bit_values
+    canonical, multiplicity = np.unique(images.min(axis=1), return_counts=True)
+    return (canonical[:, None] & bit_values) != 0, multiplicity
+
+
+def _allocate_thrust(layout: RotorLayout, failed: np.ndarray):
+    """
+    Minimum-norm thrust allocation for every failure case.
+
+    Returns: (thrust fraction (M, n), trimmable (M,))
+    """
+    # Rows: total thrust, roll moment, pitch moment, yaw torque
+    effectiveness = np.stack([np.ones(layout.num_rotors), layout.y, layout.x, layout.spin])
+    effectiveness = np.where(failed[:, None, :], 0.0, effectiveness[None, :, :])
+    target = np.array([1.0, 0.0, 0.0, 0.0])
+
+    fraction = np.linalg.pinv(effectiveness) @ target
+    residual = np.linalg.norm(effectiveness @ fraction[..., None] - target[:, None], axis=(1, 2))
+    trimmable = (residual < _TRIM_TOLERANCE) & np.all(fraction > -_TRIM_TOLERANCE, axis=1)
+    fraction = np.where(trimmable[:, None], np.clip(fraction, 0.0, None), np.nan)
+    return fraction, trimmable
+
+
+@functools.lru_cache(maxsize=None)
+def failure_cases(num_rotors: int, max_failures: Optional[int] = None) -> FailureCases:
+    """
+    Enumerate and solve all failure combinations of up to max_failures
+    motors (default: all of them) on a rotor_layout ring.
+
+    Results are cached per (num_rotors, max_failures); they do not depend
+    on the design.
+
+    Returns: FailureCases
+    """
+    layout = rotor_layout(num_rotors)
+    if max_failures is None:
+        max_failures = num_rotors
+    max_failures = min(max_failures, num_rotors)
+
+    failed, multiplicity, num_failed = [], [], []
+    for k in range(max_failures + 1):
+        masks, counts = _canonical_failure_sets(layout, k)
+        failed.append(masks)
+        multiplicity.append(counts)
+        num_failed.append(np.full(len(masks), k))
+    failed = np.concatenate(failed)
+    fraction, trimmable = _allocate_thrust(layout, failed)
+
+    return FailureCases(layout, failed, np.concatenate(num_failed),
+                        np.concatenate(multiplicity), fraction, trimmable)
+
+
+@dataclass
+class FailureAnalysis:
+    """
+    Motor failure tolerance of N designs.
+
+    Per-failure-count arrays have shape (N, K + 1), column k covering all
+    combinations of k failed motors (NaN beyond a design's rotor count).
+    """
+    controllable_fraction: np.ndarray  # share of combinations that can be trimmed
+    survivable_fraction: np.ndarray    # ... and stay within the power limit
+    worst_rotor_power_w: np.ndarray    # highest per-rotor hover power (trimmable cases)
+    worst_hover_power_w: np.ndarray    # highest total hover power (trimmable cases)
+    nominal_rotor_power_w: np.ndarray  # (N,) per-rotor hover power, no failures
+    nominal_hover_power_w: np.ndarray  # (N,) total hover power, no failures
+
+    @property
+    def max_tolerated_failures(self) -> np.ndarray:
+        """
+        Largest k such that every combination of up to k failures is
+        survivable (-1 when the intact aircraft is not).
+        """
+        ok = self.survivable_fraction == 1.0
+        return np.where(ok.all(axis=1), ok.shape[1], np.argmin(ok, axis=1)) - 1
+
+
+def failure_analysis_batch(table: DesignTable,
+                           payload_kg,
+                           max_failures: Optional[int] = None,
+                           motor_thrust_margin: float = MOTOR_THRUST_MARGIN,
+                           constraints: Optional[FeasibilityConstraints] = None,
+                           air_density=AIR_DENSITY_SEA_LEVEL) -> FailureAnalysis:
+    """
+    Hover capability after motor failures for many designs.
+
+    Hover is checked at the loaded weight. Hybrid designs must keep total
+    hover power within constraints.power_limit_w(generator_power_w);
+    battery designs are limited by control and motor thrust only.
+
+    Args:
+        table: Design table (N rows, 1-D, even rotor counts)
+        payload_kg: Payload weight in kg (scalar or one per design)
+        max_failures: Most simultaneous failures to check (default: all)
+        motor_thrust_margin: Max rotor thrust / nominal hover thrust
+        constraints: Feasibility limits (defaults to FeasibilityConstraints())
+        air_density: Air density in kg/m^3 (scalar or one per design)
+
+    Returns: FailureAnalysis
+    """
+    if constraints is None:
+        constraints = FeasibilityConstraints()
+
+    n_designs = len(table)
+    payload_kg = np.broadcast_to(np.asarray(payload_kg, dtype=np.float64), (n_designs,))
+    air_density = np.broadcast_to(np.asarray(air_density, dtype=np.float64), (n_designs,))
+    num_rotors = table.num_rotors.astype(int)
+    max_k = int(num_rotors.max()) if max_failures is None else max_failures
+    columns = max_k + 1
+
+    controllable_fraction = np.full((n_designs, columns), np.nan)
+    survivable_fraction = np.full((n_designs, columns), np.nan)
+    worst_rotor_power_w = np.full((n_designs, columns), np.nan)
+    worst_hover_power_w = np.full((n_designs, columns), np.nan)
+    nominal_rotor_power_w = np.empty(n_designs)
+
+    for n in np.unique(num_rotors):
+        rows = np.flatnonzero(num_rotors == n)
+        cases = failure_cases(int(n), max_k)
+
+        # Per-rotor momentum theory: P = T^1.5 / sqrt(2 rho A_rotor) / efficiency
+        thrust_n = (table.total_weight()[rows] + payload_kg[rows]) * GRAVITY
+        rotor_area = np.pi * (table.rotor_diameter_m[rows] / 2) ** 2
+        scale = (thrust_n ** 1.5 / np.sqrt(2 * air_density[rows] * rotor_area) /
+                 table.hover_efficiency[rows])[:, None]
+        rotor_power = scale * cases.max_thrust_fraction ** 1.5
+        hover_power = scale * cases.power_factor
+        nominal_rotor_power_w[rows] = rotor_power[:, 0]  # case 0 has no failures
+
+        controllable = cases.trimmable & (cases.max_thrust_fraction * n <=
+                                          motor_thrust_margin + _TRIM_TOLERANCE)
+        power_limit = constraints.power_limit_w(table.generator_power_w[rows])[:, None]
+        power_ok = ~table.hybrid_power[rows, None] | (hover_power <= power_limit)
+        survivable = controllable & power_ok
+
+        for k in range(min(max_k, n) + 1):
+            in_k = cases.num_failed == k
+            weight = cases.multiplicity[in_k]
+            trimmed = cases.trimmable[in_k]
+            controllable_fraction[rows, k] = np.dot(controllable[in_k], weight) / weight.sum()
+            survivable_fraction[rows, k] = survivable[:, in_k] @ weight / weight.sum()
+            if np.any(trimmed):
+                worst_rotor_power_w[rows, k] = rotor_power[:, in_k][:, trimmed].max(axis=1)
+                worst_hover_power_w[rows, k] = hover_power[:, in_k][:, trimmed].max(axis=1)
+
+    return FailureAnalysis(
+        controllable_fraction=controllable_fraction,
+        survivable_fraction=survivable_fraction,
+        worst_rotor_power_w=worst_rotor_power_w,
+        worst_hover_power_w=worst_hover_power_w,
+        nominal_rotor_power_w=nominal_rotor_power_w,
+        nominal_hover_power_w=nominal_rotor_power_w * num_rotors
+    )
+
+
+if __name__ == "__main__":
+    import time
+    from simulator import lbs_to_kg
+
+    start = time.perf_counter()
+    cases = failure_cases(16)
+    elapsed = time.perf_counter() - start
+    print(f"16-rotor ring: {len(cases.layout.symmetries())} symmetries, "
+          f"{int(cases.multiplicity.sum()):,} failure sets -> {len(cases.failed):,} cases "
+          f"solved in {elapsed*1000:.0f} ms")
+
+    table = DesignTable.from_columns(
+        aircraft_weight_kg=11.0, num_rotors=np.array([8, 12, 16]), rotor_diameter_m=0.61,
+        generator_weight_kg=13.0, generator_power_w=15000
+    )
+    analysis = failure_analysis_batch(table, lbs_to_kg(110), max_failures=4)
+
+    print(f"\n{'Rotors':<8} {'Failed':<8} {'Cases':>8} {'Combos':>8} {'Control':>9} "
+          f"{'Survive':>9} {'Rotor power':>13}")
+    print("-" * 70)
+    for i, n in enumerate(table.num_rotors):
+        cases = failure_cases(int(n), 4)
+        for k in range(5):
+            increase = analysis.worst_rotor_power_w[i, k] / analysis.nominal_rotor_power_w[i] - 1
+            print(f"{n:<8} {k:<8} {cases.unique_cases(k):>8} {cases.combinations(k):>8} "
+                  f"{analysis.controllable_fraction[i, k]*100:>8.1f}% "
+                  f"{analysis.survivable_fraction[i, k]*100:>8.1f}% {increase*100:>+12.1f}%")
+        print(f"  -> tolerates any {analysis.max_tolerated_failures[i]} failures")
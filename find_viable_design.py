@@ -169,6 +169,13 @@ def create_final_design_recommendation():
 
 
 if __name__ == "__main__":
+    from eval_cache import enable_from_environment
+
+    # Configs recur across the analyses; reuse physics results (and, with
+    # $LIFT_EVAL_CACHE set, results stored by earlier runs)
+    enable_memoization()
+    enable_from_environment()
+
     # First, find minimum generator size
     min_gen_kw, min_gen_kg = find_required_generator_power()
 
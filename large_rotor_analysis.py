@@ -203,6 +203,13 @@ def test_lower_payloads():
 
 
 if __name__ == "__main__":
+    from eval_cache import enable_from_environment
+
+    # Configs recur across the analyses; reuse physics results (and, with
+    # $LIFT_EVAL_CACHE set, results stored by earlier runs)
+    enable_memoization()
+    enable_from_environment()
+
     print("\n")
     print("╔" + "="*78 + "╗")
     print("║" + " "*20 + "LARGE ROTOR VIABILITY ANALYSIS" + " "*27 + "║")
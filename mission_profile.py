@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+DARPA Lift Challenge - Mission Profiles
+
+Declarative mission descriptions compiled into vectorized evaluators:
+- Phase specs: Climb, Cruise, Hover, Descend and PayloadChange
+- MissionProfile: an ordered list of phase specs plus the time limit
+- MissionKernel: a compiled profile that evaluates whole design batches
+  with the calculate_mission_energy_batch result layout
+
+STANDARD_MISSION is the competition course from calculate_mission_energy;
+calculate_mission_energy_batch evaluates it through this module, so course
+variants are new profiles rather than copies of the function. The scalar
+calculate_mission_energy keeps its own unrolled phases for speed; importing
+this module checks that both describe the same course.
+
+Compiling resolves the aircraft weight of every phase to a payload state
+(which share of the payload is aboard, plus any fixed weight change) and
+evaluates hover power once per state; climb phases reuse it.
+"""
+
+import functools
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from simulator import (
+    AircraftConfig, MISSION_PHASES, calculate_mission_energy, AIR_DENSITY_SEA_LEVEL, MISSION_ALTITUDE_M, MISSION_CLIMB_RATE_MS,
+    MISSION_LOADED_DISTANCE_M, MISSION_UNLOADED_DISTANCE_M,
+    MISSION_DESCENT_TIME_S, MISSION_DROP_TIME_S, MISSION_LANDING_TIME_S,
+    MISSION_TIME_LIMIT_MIN, MISSION_LOADED_TRACK_DEG, MISSION_UNLOADED_TRACK_DEG, ms_to_kmh,
+)
+from batch_simulator import (
+    BatchPerformanceCalculator, DesignTable, _broadcast_inputs, ground_speed_batch,
+)
+
+
+@dataclass(frozen=True)
+class Climb:
+    """Vertical climb at a constant rate"""
+    altitude_m: float
+    rate_ms: float = MISSION_CLIMB_RATE_MS
+    name: str = 'climb'
+
+    uses_hover = True
+
+    def time_s(self, cruise_speed_ms, wind_speed_ms, wind_from_deg):
+        return self.altitude_m / self.rate_ms
+
+    def power_w(self, calc: BatchPerformanceCalculator, weight_kg, cruise_speed_ms, hover_w=None):
+        return calc.climb_power(weight_kg, self.rate_ms, hover_w)
+
+
+@dataclass(frozen=True)
+class Cruise:
+    """
+    Level flight over a ground distance along a track.
+
+    speed_ms overrides the mission cruise airspeed for this leg.
+    """
+    distance_m: float
+    track_deg: float = MISSION_LOADED_TRACK_DEG
+    speed_ms: Optional[float] = None
+    name: str = 'cruise'
+
+    uses_hover = False
+
+    def airspeed_ms(self, cruise_speed_ms):
+        return cruise_speed_ms if self.speed_ms is None else self.speed_ms
+
+    def time_s(self, cruise_speed_ms, wind_speed_ms, wind_from_deg):
+        return self.distance_m / ground_speed_batch(self.airspeed_ms(cruise_speed_ms),
+                                                    wind_speed_ms, wind_from_deg, self.track_deg)
+
+    def power_w(self, calc: BatchPerformanceCalculator, weight_kg, cruise_speed_ms, hover_w=None):
+        return calc.forward_flight_power(weight_kg, self.airspeed_ms(cruise_speed_ms))
+
+
+@dataclass(frozen=True)
+class Hover:
+    """Hover in place for a fixed time"""
+    duration_s: float
+    name: str = 'hover'
+
+    uses_hover = True
+
+    def time_s(self, cruise_speed_ms, wind_speed_ms, wind_from_deg):
+        return self.duration_s
+
+    def power_w(self, calc: BatchPerformanceCalculator, weight_kg, cruise_speed_ms, hover_w=None):
+        return calc.hover_power_actual(weight_kg) if hover_w is None else hover_w
+
+
+@dataclass(frozen=True)
+class Descend(Hover):
+    """Descent over a fixed time, flown at hover power like the standard mission"""
+    name: str = 'descend'
+
+
+@dataclass(frozen=True)
+class PayloadChange:
+    """
+    Load or release payload (takes no time).
+
+    The weight changes by fraction * mission payload + kg, so
+    PayloadChange() releases the whole payload and PayloadChange(-0.5)
+    releases half of it.
+    """
+    fraction: float = -1.0
+    kg: float = 0.0
+
+
+FlightPhase = Union[Climb, Cruise, Hover]
+PhaseSpec = Union[Climb, Cruise, Hover, PayloadChange]
+
+
+@dataclass(frozen=True)
+class MissionProfile:
+    """
+    Ordered phase specs of a mission, starting with the full payload aboard.
+
+    Flight phase names label the results and must be unique.
+    """
+    phases: Tuple[PhaseSpec, ...]
+    time_limit_min: float = MISSION_TIME_LIMIT_MIN
+
+    def __post_init__(self):
+        object.__setattr__(self, 'phases', tuple(self.phases))
+        names = [phase.name for phase in self.phases if not isinstance(phase, PayloadChange)]
+        if not names:
+            raise ValueError("Mission profile needs at least one flight phase")
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate phase names in mission profile: {names}")
+        aboard = 1.0
+        for phase in self.phases:
+            if isinstance(phase, PayloadChange):
+                aboard += phase.fraction
+                if aboard < -1e-12:
+                    raise ValueError("Mission profile releases more payload than is aboard")
+
+    @property
+    def phase_names(self) -> Tuple[str, ...]:
+        return tuple(phase.name for phase in self.phases if not isinstance(phase, PayloadChange))
+
+    @functools.cached_property
+    def kernel(self) -> 'MissionKernel':
+        """The compiled profile (built on first use)"""
+        return MissionKernel(self)
+
+    def evaluate(self, table: DesignTable, payload_kg, cruise_speed_ms=7.5, outer: bool = False,
+                 air_density=AIR_DENSITY_SEA_LEVEL, wind_speed_ms=0.0, wind_from_deg=0.0) -> Dict:
+        """Evaluate the profile for a design batch (see MissionKernel.__call__)"""
+        return self.kernel(table, payload_kg, cruise_speed_ms, outer,
+                           air_density, wind_speed_ms, wind_from_deg)
+
+
+class MissionKernel:
+    """
+    Vectorized evaluator of a MissionProfile.
+
+    Built once per profile: flight phases are resolved to payload states
+    (payload share aboard, fixed weight change) and fixed phase times are
+    computed up front.
+    """
+
+    def __init__(self, profile: MissionProfile):
+        self.profile = profile
+        self.states: List[Tuple[float, float]] = []
+        # Flight phases with the index of their payload state
+        self.steps: List[Tuple[FlightPhase, int]] = []
+
+        fraction, kg = 1.0, 0.0
+        for phase in profile.phases:
+            if isinstance(phase, PayloadChange):
+                fraction += phase.fraction
+                kg += phase.kg
+                continue
+            if (fraction, kg) not in self.states:
+                self.states.append((fraction, kg))
+            self.steps.append((phase, self.states.index((fraction, kg))))
+
+        self._hover_states = sorted({state for phase, state in self.steps if phase.uses_hover})
+        self._fixed_times = {i: phase.time_s(None, None, None)
+                             for i, (phase, _) in enumerate(self.steps)
+                             if not isinstance(phase, Cruise)}
+
+    def weights(self, unloaded_weight, payload_kg) -> List[np.ndarray]:
+        """Aircraft weight in every payload state"""
+        return [unloaded_weight if (fraction, kg) == (0.0, 0.0)
+                else unloaded_weight + payload_kg * fraction + kg
+                for fraction, kg in self.states]
+
+    def __call__(self, table: DesignTable, payload_kg, cruise_speed_ms=7.5, outer: bool = False,
+                 air_density=AIR_DENSITY_SEA_LEVEL, wind_speed_ms=0.0, wind_from_deg=0.0) -> Dict:
+        """
+        Evaluate the mission for many designs, payloads and cruise speeds.
+
+        Arguments broadcast as in calculate_mission_energy_batch, and the
+        result has the same 'phases' / 'totals' / 'feasibility' layout with
+        one phase entry per flight phase. Peak power is taken over all
+        phases; 'under_30_min' and 'time_margin_min' use the profile's
+        time limit.
+
+        Returns: Dictionary of arrays with the mission energy breakdown
+        """
+        table, payload_kg, cruise_speed_ms, conditions, shape = _broadcast_inputs(
+            table, payload_kg, cruise_speed_ms, outer, air_density, wind_speed_ms, wind_from_deg)
+        air_density, wind_speed_ms, wind_from_deg = conditions
+        calc = BatchPerformanceCalculator(table, air_density)
+
+        def full(values) -> np.ndarray:
+            return np.broadcast_to(np.asarray(values, dtype=np.float64), shape)
+
+        unloaded_weight = table.total_weight()
+        weights = self.weights(unloaded_weight, payload_kg)
+        hover_w = {state: calc.hover_power_actual(weights[state]) for state in self._hover_states}
+
+        phases = {}
+        total_time_s = 0.0
+        total_energy_wh = 0.0
+        max_power_w = None
+        for i, (phase, state) in enumerate(self.steps):
+            time_s = self._fixed_times.get(i)
+            if time_s is None:
+                time_s = phase.time_s(cruise_speed_ms, wind_speed_ms, wind_from_deg)
+            power_w = phase.power_w(calc, weights[state], cruise_speed_ms, hover_w.get(state))
+            energy_wh = power_w * time_s / 3600
+
+            phases[phase.name] = {'time_s': full(time_s), 'power_w': full(power_w),
+                                  'energy_wh': full(energy_wh)}
+            total_time_s = total_time_s + time_s
+            total_energy_wh = total_energy_wh + energy_wh
+            max_power_w = power_w if max_power_w is None else np.maximum(max_power_w, power_w)
+
+        time_limit_min = self.profile.time_limit_min
+        total_time_min = full(total_time_s / 60)
+        generator_adequate = table.hybrid_power & (table.generator_power_w > max_power_w)
+
+        return {
+            'phases': phases,
+            'totals': {
+                'total_time_s': full(total_time_s),
+                'total_time_min': total_time_min,
+                'total_energy_wh': full(total_energy_wh),
+                'loaded_weight_kg': full(unloaded_weight + payload_kg),
+                'unloaded_weight_kg': full(unloaded_weight),
+                'payload_kg': full(payload_kg),
+                'cruise_speed_ms': full(cruise_speed_ms),
+                'cruise_speed_kmh': full(ms_to_kmh(cruise_speed_ms))
+            },
+            'feasibility': {
+                'under_30_min': total_time_min < time_limit_min,
+                'time_margin_min': time_limit_min - total_time_min,
+                'generator_adequate': np.broadcast_to(generator_adequate, shape),
+                'max_power_w': full(max_power_w),
+                'avg_power_w': full(total_energy_wh / (total_time_s / 3600))
+            }
+        }
+
+
+# The competition course (calculate_mission_energy)
+STANDARD_MISSION = MissionProfile((
+    Climb(MISSION_ALTITUDE_M, MISSION_CLIMB_RATE_MS, name='takeoff_climb'),
+    Cruise(MISSION_LOADED_DISTANCE_M, MISSION_LOADED_TRACK_DEG, name='loaded_cruise'),
+    Descend(MISSION_DESCENT_TIME_S + MISSION_DROP_TIME_S, name='payload_drop'),
+    PayloadChange(),
+    Climb(MISSION_ALTITUDE_M, MISSION_CLIMB_RATE_MS, name='climb_unloaded'),
+    Cruise(MISSION_UNLOADED_DISTANCE_M, MISSION_UNLOADED_TRACK_DEG, name='unloaded_cruise'),
+    Descend(MISSION_LANDING_TIME_S, name='landing'),
+))
+
+
+def _check_standard_mission():
+    """Raise if calculate_mission_energy and STANDARD_MISSION have drifted apart"""
+    if STANDARD_MISSION.phase_names != MISSION_PHASES:
+        raise RuntimeError(f"STANDARD_MISSION phases {STANDARD_MISSION.phase_names} "
+                           f"do not match calculate_mission_energy {MISSION_PHASES}")
+    config = AircraftConfig(aircraft_weight_kg=10.0, num_rotors=8, rotor_diameter_m=0.6,
+                            generator_weight_kg=13.0, generator_power_w=15000)
+    # A quartering wind gives every leg its own ground speed
+    scalar = calculate_mission_energy(config, 50.0, 7.5, wind_speed_ms=3.0, wind_from_deg=30.0)
+    batch = STANDARD_MISSION.evaluate(DesignTable.from_configs([config]), 50.0, 7.5,
+                                      wind_speed_ms=3.0, wind_from_deg=30.0)
+    for name in MISSION_PHASES:
+        for key, value in scalar.phases[name].items():
+            if not np.isclose(value, batch['phases'][name][key][0], rtol=1e-12):
+                raise RuntimeError(f"STANDARD_MISSION {name} {key} does not match "
+                                   f"calculate_mission_energy")
+
+
+_check_standard_mission()
+
+
+if __name__ == "__main__":
+    import time
+    from simulator import lbs_to_kg
+
+    # Two drop zones: half the payload halfway out, the rest at the usual zone
+    two_drops = MissionProfile((
+        Climb(MISSION_ALTITUDE_M, name='takeoff_climb'),
+        Cruise(MISSION_LOADED_DISTANCE_M / 2, name='leg_1'),
+        Descend(MISSION_DESCENT_TIME_S + MISSION_DROP_TIME_S, name='drop_1'),
+        PayloadChange(-0.5),
+        Climb(MISSION_ALTITUDE_M, name='climb_1'),
+        Cruise(MISSION_LOADED_DISTANCE_M / 2, name='leg_2'),
+        Descend(MISSION_DESCENT_TIME_S + MISSION_DROP_TIME_S, name='drop_2'),
+        PayloadChange(-0.5),
+        Climb(MISSION_ALTITUDE_M, name='climb_2'),
+        Cruise(MISSION_UNLOADED_DISTANCE_M, MISSION_UNLOADED_TRACK_DEG, name='return'),
+        Descend(MISSION_LANDING_TIME_S, name='landing'),
+    ))
+    # Faster loaded leg under a tighter 20 minute rule
+    sprint = MissionProfile(
+        tuple(Cruise(phase.distance_m, phase.track_deg, 12.0, phase.name)
+              if phase is STANDARD_MISSION.phases[1] else phase
+              for phase in STANDARD_MISSION.phases),
+        time_limit_min=20)
+
+    rng = np.random.default_rng(0)
+    n = 1_000_000
+    table = DesignTable.from_columns(
+        aircraft_weight_kg=rng.uniform(8, 14, n),
+        num_rotors=rng.choice([8, 12, 16], n),
+        rotor_diameter_m=rng.uniform(0.5, 0.8, n),
+        generator_weight_kg=13.0,
+        generator_power_w=15000
+    )
+    payload = lbs_to_kg(110)
+
+    print(f"{'Profile':<12} {'Phases':>7} {'Time (min)':>11} {'Energy (kWh)':>13} "
+          f"{'In time':>8} {'ms per 10^6':>12}")
+    print("-" * 70)
+    for label, profile in (('standard', STANDARD_MISSION), ('two drops', two_drops),
+                           ('sprint', sprint)):
+        result = profile.evaluate(table, payload)  # compile and warm up
+        elapsed = float('inf')
+        for _ in range(3):
+            start = time.perf_counter()
+            profile.evaluate(table, payload)
+            elapsed = min(elapsed, (time.perf_counter() - start) * 1000)
+        print(f"{label:<12} {len(profile.phase_names):>7} "
+              f"{np.median(result['totals']['total_time_min']):>11.1f} "
+              f"{np.median(result['totals']['total_energy_wh'])/1000:>13.2f} "
+              f"{np.mean(result['feasibility']['under_30_min'])*100:>7.0f}% {elapsed:>12.0f}")
@@ -0,0 +1,421 @@
+#!/usr/bin/env python3
+"""
+DARPA Lift Challenge - Vectorized Monte Carlo Engine
+
+Propagates manufacturing and performance uncertainty through the full
+mission model. All uncertain parameters are drawn as arrays and the mission
+is evaluated with batch_simulator, so 10^6-10^7 trials run in seconds.
+
+Trials are processed in fixed-size chunks to bound memory.
+
+run_adaptive_monte_carlo draws from low-discrepancy sequences (qmc.py)
+instead and stops once the confidence intervals are narrow enough. It
+runs several independently scrambled replicates side by side: their
+spread gives valid intervals for quasi-random points, where the binomial
+formulas would overstate the error.
+"""
+
+import itertools
+import math
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from simulator import AircraftConfig, lbs_to_kg, kg_to_lbs
+from batch_simulator import DesignTable, payload_ratio_analysis_batch
+from qmc import make_sequence
+
+
+@dataclass
+class UncertainParameter:
+    """Uniformly distributed uncertain input"""
+    name: str
+    low: float
+    high: float
+    description: str = ""
+
+
+# Parameter variations used by the comprehensive test suite
+DEFAULT_UNCERTAINTIES = (
+    UncertainParameter('hover_efficiency', 0.60, 0.70, "Hover efficiency (nominal 0.65)"),
+    UncertainParameter('cruise_efficiency', 0.70, 0.80, "Cruise efficiency (nominal 0.75)"),
+    UncertainParameter('weight_factor', 0.95, 1.15, "Aircraft weight (manufacturing variation)"),
+    UncertainParameter('generator_factor', 0.90, 1.05, "Generator power (performance variation)"),
+)
+
+# 16-rotor baseline: 11 kg airframe + 13 kg generator = 24 kg aircraft
+NOMINAL_CONFIG = AircraftConfig(
+    aircraft_weight_kg=11.0,
+    num_rotors=16,
+    rotor_diameter_m=0.61,
+    hover_efficiency=0.65,
+    cruise_efficiency=0.75,
+    has_wing=False,
+    hybrid_power=True,
+    generator_weight_kg=13.0,
+    generator_power_w=15000
+)
+
+PERCENTILES = (5, 50, 95)
+
+# Result columns summarised over successful trials
+RESULT_COLUMNS = ('payload_ratio', 'mission_time_min', 'mission_energy_kwh')
+
+
+@dataclass
+class MonteCarloResult:
+    """Summary statistics from a Monte Carlo run"""
+    n_trials: int
+    n_success: int
+    success_rate: float  # percent
+    success_ci: Tuple[float, float]  # percent, Wilson score interval
+    confidence: float
+    risk: str
+    # Statistics over successful trials: {'mean', 'min', 'max', 'p5', 'p50', 'p95'}
+    payload_ratio: Dict[str, float] = field(default_factory=dict)
+    mission_time_min: Dict[str, float] = field(default_factory=dict)
+    mission_energy_kwh: Dict[str, float] = field(default_factory=dict)
+    sampler: str = 'random'
+    # Adaptive runs only: whether the interval targets were met, and the
+    # percentile intervals as {column: {'p5': (low, high), ...}}
+    converged: Optional[bool] = None
+    percentile_ci: Dict[str, Dict[str, Tuple[float, float]]] = field(default_factory=dict)
+
+
+def classify_risk(success_rate: float) -> str:
+    """Map a success rate in percent to the risk classes used in reports"""
+    if success_rate > 95:
+        return "LOW - Very robust design"
+    elif success_rate > 85:
+        return "MODERATE - Good design with some uncertainty"
+    elif success_rate > 70:
+        return "ELEVATED - Marginal design, may have issues"
+    else:
+        return "HIGH - Design likely to fail"
+
+
+def wilson_interval(successes: int, trials: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """
+    Wilson score confidence interval for a binomial proportion.
+
+    Returns: (low, high) as fractions
+    """
+    if trials == 0:
+        return (0.0, 1.0)
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / trials
+    denom = 1 + z ** 2 / trials
+    centre = (p + z ** 2 / (2 * trials)) / denom
+    half_width = z * math.sqrt(p * (1 - p) / trials + z ** 2 / (4 * trials ** 2)) / denom
+    return (max(0.0, centre - half_width), min(1.0, centre + half_width))
+
+
+def _t_quantile(q: float, dof: int) -> float:
+    """
+    Student-t quantile from the normal quantile (Cornish-Fisher expansion,
+    accurate to about 1e-3 for dof >= 5).
+    """
+    z = NormalDist().inv_cdf(q)
+    return (z + (z ** 3 + z) / (4 * dof)
+            + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * dof ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * dof ** 3)
+            + (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z)
+            / (92160 * dof ** 4))
+
+
+def sample_uncertainties(rng: np.random.Generator, n: int,
+                         uncertainties=DEFAULT_UNCERTAINTIES) -> Dict[str, np.ndarray]:
+    """Draw n uniform samples for every uncertain parameter"""
+    return {p.name: rng.uniform(p.low, p.high, n) for p in uncertainties}
+
+
+def scale_uncertainties(points: np.ndarray,
+                        uncertainties=DEFAULT_UNCERTAINTIES) -> Dict[str, np.ndarray]:
+    """Map (n, d) points in the unit hypercube onto the parameter ranges"""
+    return {p.name: p.low + (p.high - p.low) * points[:, i]
+            for i, p in enumerate(uncertainties)}
+
+
+def evaluate_trials(samples: Dict[str, np.ndarray],
+                    nominal: AircraftConfig = NOMINAL_CONFIG,
+                    payload_kg: float = lbs_to_kg(240),
+                    max_aircraft_weight_lbs: float = 55) -> Dict[str, np.ndarray]:
+    """
+    Evaluate the mission for a batch of sampled trials.
+
+    weight_factor scales the nominal total aircraft weight (the generator
+    and battery weights stay fixed), and generator_factor scales the
+    generator power. Trials over the aircraft weight limit fail.
+
+    Returns: Dictionary with the 'success' mask and result columns
+    """
+    aircraft_weight = nominal.total_weight() * samples['weight_factor']
+    gen_power = nominal.generator_power_w * samples['generator_factor']
+
+    table = DesignTable.from_columns(
+        aircraft_weight_kg=aircraft_weight - nominal.generator_weight_kg - nominal.battery_weight_kg,
+        num_rotors=nominal.num_rotors,
+        rotor_diameter_m=nominal.rotor_diameter_m,
+        hover_efficiency=samples['hover_efficiency'],
+        cruise_efficiency=samples['cruise_efficiency'],
+        has_wing=nominal.has_wing,
+        wing_area_m2=nominal.wing_area_m2,
+        wing_efficiency=nominal.wing_efficiency,
+        hybrid_power=nominal.hybrid_power,
+        generator_weight_kg=nominal.generator_weight_kg,
+        generator_power_w=gen_power,
+        battery_capacity_wh=nominal.battery_capacity_wh,
+        battery_weight_kg=nominal.battery_weight_kg
+    )
+
+    result = payload_ratio_analysis_batch(table, payload_kg)
+
+    weight_ok = kg_to_lbs(aircraft_weight) <= max_aircraft_weight_lbs
+    power_ok = result['max_power_w'] < gen_power * 1.2
+    time_ok = result['meets_time_requirement']
+
+    return {
+        'success': weight_ok & power_ok & time_ok,
+        'payload_ratio': result['payload_ratio'],
+        'mission_time_min': result['mission_time_min'],
+        'mission_energy_kwh': result['mission_energy_wh'] / 1000,
+    }
+
+
+def _summarize(values: np.ndarray) -> Dict[str, float]:
+    """Mean, range and percentiles of a result column"""
+    if values.size == 0:
+        return {}
+    summary = {
+        'mean': float(values.mean(dtype=np.float64)),
+        'min': float(values.min()),
+        'max': float(values.max()),
+    }
+    for q, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        summary[f'p{q}'] = float(value)
+    return summary
+
+
+def run_monte_carlo(n_trials: int = 1_000_000,
+                    seed: Optional[int] = None,
+                    nominal: AircraftConfig = NOMINAL_CONFIG,
+                    payload_kg: float = lbs_to_kg(240),
+                    uncertainties=DEFAULT_UNCERTAINTIES,
+                    confidence: float = 0.95,
+                    chunk_size: int = 1_000_000,
+                    on_batch: Optional[Callable[[Dict], None]] = None) -> MonteCarloResult:
+    """
+    Run a vectorized Monte Carlo uncertainty analysis.
+
+    Args:
+        n_trials: Number of trials
+        seed: Random seed (None for fresh entropy)
+        nominal: Nominal aircraft configuration
+        payload_kg: Payload weight in kg
+        uncertainties: Uncertain parameters to sample
+        confidence: Confidence level for the success rate interval
+        chunk_size: Trials evaluated per batch (bounds memory use)
+        on_batch: Called after every batch with a progress dict ('batch',
+                  'trials', 'successes' and the running 'total_trials',
+                  'total_successes' and 'success_rate' in percent)
+
+    Returns: MonteCarloResult
+    """
+    rng = np.random.default_rng(seed)
+
+    n_success = 0
+    # Successful-trial columns kept as float32 to halve memory at 10^7 trials
+    kept = {'payload_ratio': [], 'mission_time_min': [], 'mission_energy_kwh': []}
+
+    for batch, start in enumerate(range(0, n_trials, chunk_size)):
+        n = min(chunk_size, n_trials - start)
+        trials = evaluate_trials(sample_uncertainties(rng, n, uncertainties),
+                                 nominal, payload_kg)
+        success = trials['success']
+        batch_success = int(np.count_nonzero(success))
+        n_success += batch_success
+        for name, chunks in kept.items():
+            chunks.append(trials[name][success].astype(np.float32))
+        if on_batch is not None:
+            on_batch({'batch': batch, 'trials': n, 'successes': batch_success,
+                      'total_trials': start + n, 'total_successes': n_success,
+                      'success_rate': n_success / (start + n) * 100})
+
+    columns = {name: np.concatenate(chunks) if chunks else np.empty(0, dtype=np.float32)
+               for name, chunks in kept.items()}
+
+    success_rate = n_success / n_trials * 100 if n_trials else 0.0
+    ci_low, ci_high = wilson_interval(n_success, n_trials, confidence)
+
+    return MonteCarloResult(
+        n_trials=n_trials,
+        n_success=n_success,
+        success_rate=success_rate,
+        success_ci=(ci_low * 100, ci_high * 100),
+        confidence=confidence,
+        risk=classify_risk(success_rate),
+        payload_ratio=_summarize(columns['payload_ratio']),
+        mission_time_min=_summarize(columns['mission_time_min']),
+        mission_energy_kwh=_summarize(columns['mission_energy_kwh'])
+    )
+
+
+def _replicate_percentile_ci(columns: Dict[str, np.ndarray],
+                             replicate_columns, t: float) -> Dict[str, Dict[str, Tuple[float, float]]]:
+    """
+    Confidence intervals for the pooled percentiles from the spread of the
+    per-replicate percentiles (empty if a replicate has no successes).
+    """
+    if any(r[name].size == 0 for r in replicate_columns for name in RESULT_COLUMNS):
+        return {}
+    intervals = {}
+    for name in RESULT_COLUMNS:
+        pooled = np.percentile(columns[name], PERCENTILES)
+        per_replicate = np.array([np.percentile(r[name], PERCENTILES) for r in replicate_columns])
+        half_width = t * per_replicate.std(axis=0, ddof=1) / math.sqrt(len(replicate_columns))
+        intervals[name] = {f'p{q}': (float(p - h), float(p + h))
+                           for q, p, h in zip(PERCENTILES, pooled, half_width)}
+    return intervals
+
+
+def run_adaptive_monte_carlo(sampler: str = 'sobol',
+                             success_tol_pct: float = 0.25,
+                             percentile_rtol: float = 0.0025,
+                             max_trials: int = 1 << 22,
+                             seed: Optional[int] = None,
+                             nominal: AircraftConfig = NOMINAL_CONFIG,
+                             payload_kg: float = lbs_to_kg(240),
+                             uncertainties=DEFAULT_UNCERTAINTIES,
+                             confidence: float = 0.95,
+                             replicates: int = 16,
+                             initial_trials: int = 256,
+                             on_batch: Optional[Callable[[Dict], None]] = None) -> MonteCarloResult:
+    """
+    Monte Carlo uncertainty analysis that stops once it has converged.
+
+    Each round doubles the samples drawn from every replicate (keeping
+    Sobol blocks at powers of two) until the success-rate interval
+    half-width is at most success_tol_pct percentage points and every
+    reported percentile's half-width is at most percentile_rtol of its
+    value, or until the next round would exceed max_trials.
+
+    Intervals use Student's t over the replicate estimates. When every
+    replicate gives the same success rate (typically all 0% or 100%), the
+    success interval falls back to the Wilson interval of the pooled trials.
+
+    Args:
+        sampler: 'sobol', 'halton' or 'random' (pseudo-random baseline)
+        success_tol_pct: Target success-rate half-width in percentage points
+        percentile_rtol: Target percentile half-width relative to the value
+        max_trials: Trial budget across all replicates (at least one
+                    trial per replicate); the first round shrinks to fit it
+        seed: Seed of the replicate scramblings (None for fresh entropy)
+        nominal: Nominal aircraft configuration
+        payload_kg: Payload weight in kg
+        uncertainties: Uncertain parameters to sample
+        confidence: Confidence level of the intervals
+        replicates: Independently scrambled sequences (at least 2)
+        initial_trials: Samples per replicate in the first round
+        on_batch: Called after every round with a progress dict as in
+                  run_monte_carlo, plus the success-rate 'half_width_pct'
+                  and whether the run has 'converged'
+
+    Returns: MonteCarloResult with n_trials set to the samples used
+    """
+    if replicates < 2:
+        raise ValueError("At least 2 replicates are needed to estimate the error")
+    budget_per_replicate = max_trials // replicates
+    if budget_per_replicate < 1:
+        raise ValueError(f"max_trials ({max_trials}) must allow a trial per replicate ({replicates})")
+
+    sequences = [make_sequence(sampler, len(uncertainties), child)
+                 for child in np.random.SeedSequence(seed).spawn(replicates)]
+    t = _t_quantile(0.5 + confidence / 2, replicates - 1)
+
+    successes = np.zeros(replicates, dtype=np.int64)
+    kept = [{name: [] for name in RESULT_COLUMNS} for _ in range(replicates)]
+    per_replicate = 0
+    # Never start above the budget; a power of two keeps Sobol blocks balanced
+    block = min(initial_trials, 1 << (budget_per_replicate.bit_length() - 1))
+
+    for batch in itertools.count():
+        previous_success = int(successes.sum())
+        for r, sequence in enumerate(sequences):
+            trials = evaluate_trials(scale_uncertainties(sequence.random(block), uncertainties),
+                                     nominal, payload_kg)
+            success = trials['success']
+            successes[r] += np.count_nonzero(success)
+            for name in RESULT_COLUMNS:
+                kept[r][name].append(trials[name][success].astype(np.float32))
+        per_replicate += block
+        n_trials = per_replicate * replicates
+        n_success = int(successes.sum())
+
+        rate = n_success / n_trials
+        half_width = t * np.std(successes / per_replicate, ddof=1) / math.sqrt(replicates)
+        if half_width > 0:
+            success_ci = (max(0.0, float(rate - half_width)), min(1.0, float(rate + half_width)))
+        else:
+            success_ci = wilson_interval(n_success, n_trials, confidence)
+            half_width = max(rate - success_ci[0], success_ci[1] - rate)
+
+        replicate_columns = [{name: np.concatenate(chunks) for name, chunks in r.items()}
+                             for r in kept]
+        columns = {name: np.concatenate([r[name] for r in replicate_columns])
+                   for name in RESULT_COLUMNS}
+        percentile_ci = _replicate_percentile_ci(columns, replicate_columns, t)
+
+        if n_success == 0:
+            percentiles_ok = True  # nothing to report
+        elif not percentile_ci:
+            percentiles_ok = False
+        else:
+            percentiles_ok = all(
+                (high - low) / 2 <= percentile_rtol * abs(low + high) / 2
+                for intervals in percentile_ci.values() for low, high in intervals.values())
+
+        converged = half_width * 100 <= success_tol_pct and percentiles_ok
+        if on_batch is not None:
+            on_batch({'batch': batch, 'trials': block * replicates,
+                      'successes': n_success - previous_success,
+                      'total_trials': n_trials, 'total_successes': n_success,
+                      'success_rate': rate * 100, 'half_width_pct': float(half_width * 100),
+                      'converged': bool(converged)})
+        if converged or 2 * n_trials > max_trials:
+            break
+        block = per_replicate
+
+    return MonteCarloResult(
+        n_trials=n_trials,
+        n_success=n_success,
+        success_rate=rate * 100,
+        success_ci=(success_ci[0] * 100, success_ci[1] * 100),
+        confidence=confidence,
+        risk=classify_risk(rate * 100),
+        payload_ratio=_summarize(columns['payload_ratio']),
+        mission_time_min=_summarize(columns['mission_time_min']),
+        mission_energy_kwh=_summarize(columns['mission_energy_kwh']),
+        sampler=sampler,
+        converged=converged,
+        percentile_ci=percentile_ci
+    )
+
+
+if __name__ == "__main__":
+    import time
+
+    payload_kg = lbs_to_kg(110)
+    print(f"Adaptive Monte Carlo, {kg_to_lbs(payload_kg):.0f} lb payload "
+          f"(success rate to +/-0.25 pp, percentiles to +/-0.25%):\n")
+    print(f"{'Sampler':<10} {'Trials':>12} {'Converged':>10} {'Success rate':>14} "
+          f"{'Payload ratio p5':>18} {'Time':>8}")
+    print("-" * 78)
+    for sampler in ('random', 'halton', 'sobol'):
+        start = time.perf_counter()
+        result = run_adaptive_monte_carlo(sampler, seed=0, payload_kg=payload_kg, max_trials=1 << 24)
+        elapsed = time.perf_counter() - start
+        print(f"{sampler:<10} {result.n_trials:>12,} {str(result.converged):>10} "
+              f"{result.success_rate:>13.2f}% {result.payload_ratio['p5']:>18.3f} {elapsed:>7.2f}s")
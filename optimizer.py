@@ -6,16 +6,380 @@ Finds optimal aircraft configurations by varying key parameters.
 Identifies designs that maximize payload ratio while meeting mission requirements.
 """
 
+import contextlib
+import itertools
 import math
+import os
+import random
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from simulator import *
+from batch_simulator import DesignTable
+from pareto import pareto_front_records
+from sensitivity import sobol_indices
+from solvers import FeasibilityConstraints, optimal_cruise_speed_batch
+from result_store import SWEEP_RESULT_KEYS, ResultStore
+from streaming import TopK
 import json
 
 
+# Largest default chunk of grid points per sweep task
+SWEEP_CHUNK_SIZE = 4096
+
+
+def estimate_generator_weight(generator_power_w: float) -> float:
+    """
+    Estimate hybrid generator weight from its continuous power rating.
+
+    Uses the sizing rule from find_viable_design: 8 kg at 10 kW plus
+    ~0.5 kg per additional kW.
+
+    Returns: Generator weight in kg
+    """
+    return 8 + (generator_power_w / 1000 - 10) * 0.5
+
+
+def _grid_point_config(num_rotors: int,
+                       rotor_diameter_m: float,
+                       hybrid_generator_weight_kg: float,
+                       hybrid_generator_power_w: float,
+                       has_wing: bool,
+                       wing_area_m2: Optional[float] = None) -> AircraftConfig:
+    """
+    Build the estimated aircraft configuration for one design point.
+
+    wing_area_m2 defaults to the nominal wing for the rotor count; other
+    areas scale the ~3.5 kg nominal wing weight proportionally.
+    """
+    # Estimate airframe weight based on number of rotors and size
+    # Larger frames and more rotors = more weight
+    if has_wing:
+        # Quadplane: wing + fuselage + rotors
+        nominal_wing_area = 1.2 if num_rotors <= 6 else 1.5
+        wing_area = nominal_wing_area if wing_area_m2 is None else wing_area_m2
+        wing_weight = 3.5 * wing_area / nominal_wing_area  # Nominal wing adds ~3.5 kg
+        base_frame_weight = 2.5 + (num_rotors * 0.3) + wing_weight
+    else:
+        # Multirotor: just frame + motors
+        base_frame_weight = 1.5 + (num_rotors * 0.25)
+        wing_area = 0.0
+
+    # Motor weight scales with size
+    motor_weight_per = 0.25 + (rotor_diameter_m - 0.35) * 0.5
+    total_motor_weight = num_rotors * motor_weight_per
+
+    # Electronics, landing gear, payload mount
+    electronics_weight = 1.0
+    landing_gear_weight = 0.8
+    payload_mount_weight = 0.5
+
+    # Total airframe weight (excluding generator)
+    airframe_weight_kg = (base_frame_weight + total_motor_weight +
+                        electronics_weight + landing_gear_weight +
+                        payload_mount_weight)
+
+    return AircraftConfig(
+        aircraft_weight_kg=airframe_weight_kg,
+        num_rotors=num_rotors,
+        rotor_diameter_m=rotor_diameter_m,
+        hover_efficiency=0.65,
+        cruise_efficiency=0.75,
+        has_wing=has_wing,
+        wing_area_m2=wing_area,
+        wing_efficiency=0.85,
+        hybrid_power=True,
+        generator_weight_kg=hybrid_generator_weight_kg,
+        generator_power_w=hybrid_generator_power_w,
+        battery_capacity_wh=0,  # Not relevant for hybrid
+        battery_weight_kg=0
+    )
+
+
+def _evaluate_grid_point(num_rotors: int,
+                         rotor_diameter_m: float,
+                         cruise_speed_ms: float,
+                         target_payload_kg: float,
+                         max_aircraft_weight_kg: float,
+                         hybrid_generator_weight_kg: float,
+                         hybrid_generator_power_w: float,
+                         has_wing: bool) -> Optional[Dict]:
+    """
+    Evaluate one rotor count / diameter grid point.
+
+    Returns: Result dict if the design passes all checks, else None
+    """
+    rotor_diameter_inches = rotor_diameter_m / 0.0254
+
+    config = _grid_point_config(num_rotors, rotor_diameter_m,
+                                hybrid_generator_weight_kg, hybrid_generator_power_w,
+                                has_wing)
+
+    # Total aircraft weight
+    total_aircraft_kg = config.aircraft_weight_kg + hybrid_generator_weight_kg
+
+    # Skip if over weight limit (or no feasible cruise speed was found)
+    if total_aircraft_kg > max_aircraft_weight_kg or math.isnan(cruise_speed_ms):
+        return None
+
+    # Calculate performance
+    try:
+        analysis = payload_ratio_analysis(config, target_payload_kg, cruise_speed_ms)
+    except Exception:
+        # Skip invalid configurations
+        return None
+
+    # Check if generator is adequate
+    if analysis['max_power_w'] > hybrid_generator_power_w * 1.2:  # Allow 20% overpower briefly
+        return None
+
+    # Check if mission time is feasible
+    if not analysis['meets_time_requirement']:
+        return None
+
+    # Check if we have good time margin (at least 3 minutes)
+    if analysis['time_margin_min'] < 3.0:
+        return None
+
+    # This is a valid configuration
+    return {
+        'num_rotors': num_rotors,
+        'rotor_diameter_m': rotor_diameter_m,
+        'rotor_diameter_in': rotor_diameter_inches,
+        'cruise_speed_ms': cruise_speed_ms,
+        'aircraft_weight_kg': total_aircraft_kg,
+        'aircraft_weight_lbs': kg_to_lbs(total_aircraft_kg),
+        'payload_ratio': analysis['payload_ratio'],
+        'mission_time_min': analysis['mission_time_min'],
+        'time_margin_min': analysis['time_margin_min'],
+        'peak_power_w': analysis['max_power_w'],
+        'avg_power_w': analysis['avg_power_w'],
+        'energy_wh': analysis['mission_energy_wh'],
+        'disk_area_m2': config.total_disk_area(),
+        'disk_loading_kg_m2': config.disk_loading(total_aircraft_kg + target_payload_kg)
+    }
+
+
+def _evaluate_grid_chunk(chunk: List[Tuple[int, float]], sweep_args: Tuple,
+                         optimize_cruise_speed: bool = False) -> List[Optional[Dict]]:
+    """
+    Evaluate a chunk of (num_rotors, diameter) grid points in a worker process.
+
+    The cruise speed search (if any) runs here too, so it is spread across
+    the workers with the rest of the chunk. With a persistent evaluation
+    cache installed, the chunk's stored results are loaded in one query up
+    front and its new results written in one transaction at the end (pool
+    workers exit without running atexit).
+    """
+    target_payload_kg, _, hybrid_generator_weight_kg, hybrid_generator_power_w, has_wing = sweep_args
+    points = _cruise_speed_chunk(chunk, target_payload_kg, hybrid_generator_weight_kg,
+                                 hybrid_generator_power_w, has_wing, optimize_cruise_speed)
+
+    store = get_evaluation_cache()
+    if store is not None:
+        store.prefetch(
+            (_grid_point_config(num_rotors, rotor_diameter_m, hybrid_generator_weight_kg,
+                                hybrid_generator_power_w, has_wing),
+             target_payload_kg, cruise_speed_ms, AIR_DENSITY_SEA_LEVEL, 0.0, 0.0)
+            for num_rotors, rotor_diameter_m, cruise_speed_ms in points)
+
+    results = [_evaluate_grid_point(num_rotors, rotor_diameter_m, cruise_speed_ms, *sweep_args)
+               for num_rotors, rotor_diameter_m, cruise_speed_ms in points]
+    if store is not None:
+        store.flush()
+    return results
+
+
+def _cruise_speed_chunk(chunk: List[Tuple[int, float]],
+                        target_payload_kg: float,
+                        hybrid_generator_weight_kg: float,
+                        hybrid_generator_power_w: float,
+                        has_wing: bool,
+                        optimize_cruise_speed: bool) -> List[Tuple[int, float, float]]:
+    """Attach a cruise speed to each (num_rotors, diameter) grid point of a chunk"""
+    if not optimize_cruise_speed:
+        return [(num_rotors, rotor_diameter_m, 7.5) for num_rotors, rotor_diameter_m in chunk]
+
+    # One batched golden-section search covers the whole chunk
+    table = DesignTable.from_configs(
+        _grid_point_config(num_rotors, rotor_diameter_m, hybrid_generator_weight_kg,
+                           hybrid_generator_power_w, has_wing)
+        for num_rotors, rotor_diameter_m in chunk)
+    cruise_speeds = optimal_cruise_speed_batch(
+        table, target_payload_kg,
+        FeasibilityConstraints(power_limit_factor=1.2, min_time_margin_min=3.0)).tolist()
+    return [(num_rotors, rotor_diameter_m, cruise_speed_ms)
+            for (num_rotors, rotor_diameter_m), cruise_speed_ms in zip(chunk, cruise_speeds)]
+
+
+def _run_grid_chunks(tasks: Iterable[Tuple], workers: int,
+                     executor: Optional[Executor] = None) -> Iterator[Tuple]:
+    """
+    Evaluate (tag, chunk, sweep_args, optimize_cruise_speed) tasks.
+
+    Serial with workers <= 1 and no executor; otherwise a bounded window of
+    tasks is kept in flight on the executor (a new process pool if none is
+    given), and results come back in submission order regardless of which
+    worker finishes first.
+
+    Yields: (tag, chunk results) per task
+    """
+    if executor is None and workers <= 1:
+        for tag, chunk, sweep_args, optimize_cruise_speed in tasks:
+            yield tag, _evaluate_grid_chunk(chunk, sweep_args, optimize_cruise_speed)
+        return
+
+    with contextlib.ExitStack() as stack:
+        if executor is None:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+        pending = deque()
+        for tag, chunk, sweep_args, optimize_cruise_speed in tasks:
+            pending.append((tag, executor.submit(_evaluate_grid_chunk, chunk, sweep_args,
+                                                 optimize_cruise_speed)))
+            if len(pending) >= workers * 2:
+                tag, future = pending.popleft()
+                yield tag, future.result()
+        while pending:
+            tag, future = pending.popleft()
+            yield tag, future.result()
+
+
+def _default_grid(has_wing: bool, rotor_counts: Optional[Iterable[int]],
+                  rotor_diameters: Optional[Iterable[float]]) -> Tuple[Iterable[int], List[float]]:
+    """Rotor counts and diameters of a sweep (default: the standard grid)"""
+    if rotor_counts is None:
+        rotor_counts = [4, 6, 8, 12, 16] if not has_wing else [4, 6, 8]
+    if rotor_diameters is None:
+        rotor_diameters = [0.35, 0.40, 0.46, 0.51, 0.56, 0.61, 0.66, 0.71, 0.76]  # 14" to 30" in meters
+    return rotor_counts, list(rotor_diameters)
+
+
+def _grid_chunks(rotor_counts: Iterable[int], rotor_diameters: List[float],
+                 chunk_size: int) -> Iterator[List[Tuple[int, float]]]:
+    """Lazily split the rotor count x diameter grid into chunks"""
+    grid = ((num_rotors, rotor_diameter_m)
+            for num_rotors in rotor_counts
+            for rotor_diameter_m in rotor_diameters)
+    return iter(lambda: list(itertools.islice(grid, chunk_size)), [])
+
+
+def iter_rotor_configurations(target_payload_kg: float,
+                              max_aircraft_weight_kg: float,
+                              hybrid_generator_weight_kg: float,
+                              hybrid_generator_power_w: float,
+                              has_wing: bool = False,
+                              rotor_counts: Optional[Iterable[int]] = None,
+                              rotor_diameters: Optional[Iterable[float]] = None,
+                              workers: Optional[int] = 1,
+                              chunk_size: Optional[int] = None,
+                              optimize_cruise_speed: bool = False,
+                              executor: Optional[Executor] = None) -> Iterator[Dict]:
+    """
+    Lazily sweep the rotor count x diameter grid, yielding valid designs.
+
+    The grid is generated and evaluated chunk by chunk, and at most a few
+    chunks per worker are in flight, so memory stays bounded however large
+    the grid is. Results are yielded in grid order.
+
+    Args:
+        target_payload_kg: Target payload weight
+        max_aircraft_weight_kg: Maximum allowed aircraft weight
+        hybrid_generator_weight_kg: Weight of hybrid generator
+        hybrid_generator_power_w: Continuous power output of generator
+        has_wing: Does this design have a wing?
+        rotor_counts: Rotor counts to sweep (default: 4-16, or 4-8 with a wing)
+        rotor_diameters: Rotor diameters to sweep in m (default: 14" to 30")
+        workers: Worker processes (1 = serial, None = all CPUs)
+        chunk_size: Grid points per chunk (default: about four chunks per
+                    worker, capped at SWEEP_CHUNK_SIZE)
+        optimize_cruise_speed: Score each design at its own minimum-energy
+                               feasible cruise speed instead of 7.5 m/s
+        executor: Existing executor to run the chunks on (saves starting a
+                  pool per sweep); workers then sets how many chunks are
+                  kept in flight
+
+    Yields: Result dict for each design that passes all checks
+    """
+    rotor_counts, rotor_diameters = _default_grid(has_wing, rotor_counts, rotor_diameters)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if chunk_size is None:
+        chunk_size = SWEEP_CHUNK_SIZE
+        if hasattr(rotor_counts, '__len__'):
+            grid_size = len(rotor_counts) * len(rotor_diameters)
+            chunk_size = min(chunk_size, max(1, math.ceil(grid_size / (workers * 4))))
+
+    sweep_args = (target_payload_kg, max_aircraft_weight_kg,
+                  hybrid_generator_weight_kg, hybrid_generator_power_w, has_wing)
+    tasks = ((None, chunk, sweep_args, optimize_cruise_speed)
+             for chunk in _grid_chunks(rotor_counts, rotor_diameters, chunk_size))
+    for _, results in _run_grid_chunks(tasks, workers, executor):
+        yield from (result for result in results if result is not None)
+
+
+def sweep_scenarios(scenarios: List[Dict],
+                    workers: Optional[int] = 1,
+                    chunk_size: Optional[int] = None,
+                    executor: Optional[Executor] = None) -> List[List[Dict]]:
+    """
+    Sweep several design scenarios as one flattened scenario x rotor count
+    x diameter grid, so all of their chunks share one pool and keep every
+    worker busy instead of draining the pool after each small sweep.
+
+    Args:
+        scenarios: Keyword arguments of iter_rotor_configurations per
+                   scenario (target_payload_kg, max_aircraft_weight_kg,
+                   hybrid_generator_weight_kg, hybrid_generator_power_w and
+                   optionally has_wing, rotor_counts, rotor_diameters,
+                   optimize_cruise_speed)
+        workers: Worker processes (1 = serial, None = all CPUs)
+        chunk_size: Grid points per chunk (default: about four chunks per
+                    worker over the whole flattened grid)
+        executor: Existing executor to run the chunks on
+
+    Returns: Valid designs of each scenario, in grid order
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    grids = []
+    for scenario in scenarios:
+        has_wing = scenario.get('has_wing', False)
+        rotor_counts, rotor_diameters = _default_grid(
+            has_wing, scenario.get('rotor_counts'), scenario.get('rotor_diameters'))
+        sweep_args = (scenario['target_payload_kg'], scenario['max_aircraft_weight_kg'],
+                      scenario['hybrid_generator_weight_kg'], scenario['hybrid_generator_power_w'],
+                      has_wing)
+        grids.append((list(rotor_counts), rotor_diameters, sweep_args,
+                      scenario.get('optimize_cruise_speed', False)))
+
+    if chunk_size is None:
+        grid_size = sum(len(counts) * len(diameters) for counts, diameters, _, _ in grids)
+        chunk_size = min(SWEEP_CHUNK_SIZE, max(1, math.ceil(grid_size / (workers * 4))))
+
+    tasks = ((index, chunk, sweep_args, optimize_cruise_speed)
+             for index, (counts, diameters, sweep_args, optimize_cruise_speed) in enumerate(grids)
+             for chunk in _grid_chunks(counts, diameters, chunk_size))
+    designs = [[] for _ in scenarios]
+    for index, results in _run_grid_chunks(tasks, workers, executor):
+        designs[index].extend(result for result in results if result is not None)
+    return designs
+
+
 def optimize_rotor_configuration(target_payload_kg: float,
                                 max_aircraft_weight_kg: float,
                                 hybrid_generator_weight_kg: float,
                                 hybrid_generator_power_w: float,
-                                has_wing: bool = False) -> Dict:
+                                has_wing: bool = False,
+                                workers: Optional[int] = 1,
+                                chunk_size: Optional[int] = None,
+                                optimize_cruise_speed: bool = False,
+                                pareto_objectives: Optional[Dict[str, str]] = None,
+                                results_path: Optional[str] = None,
+                                keep_all: bool = True,
+                                executor: Optional[Executor] = None) -> Dict:
     """
     Find optimal rotor size and count for a given payload target.
 
@@ -25,130 +389,268 @@ def optimize_rotor_configuration(target_payload_kg: float,
         hybrid_generator_weight_kg: Weight of hybrid generator
         hybrid_generator_power_w: Continuous power output of generator
         has_wing: Does this design have a wing?
+        workers: Worker processes for the sweep (1 = serial, None = all CPUs)
+        chunk_size: Grid points per worker task (default: split the grid
+                    into about four chunks per worker)
+        optimize_cruise_speed: Score each design at its own minimum-energy
+                               feasible cruise speed instead of 7.5 m/s
+        pareto_objectives: If given ({result key: 'max' or 'min'}), also
+                           return the non-dominated valid designs over
+                           these objectives as 'pareto_front'
+        results_path: If given, also save all valid designs (sorted by
+                      payload ratio) as a columnar ResultStore .npy file
+        keep_all: Return every valid design as 'all_valid'. With False
+                  (and no pareto_objectives or results_path) only 'best'
+                  and 'top_10' are kept, in constant memory
+        executor: Existing executor to run the sweep on (see
+                  iter_rotor_configurations)
 
     Returns: Best configuration found
     """
+    _print_optimizing_header(target_payload_kg)
+
+    designs = iter_rotor_configurations(
+        target_payload_kg, max_aircraft_weight_kg,
+        hybrid_generator_weight_kg, hybrid_generator_power_w, has_wing,
+        workers=workers, chunk_size=chunk_size,
+        optimize_cruise_speed=optimize_cruise_speed, executor=executor)
+    return _summarize_designs(designs, pareto_objectives, results_path, keep_all)
+
+
+def _print_optimizing_header(target_payload_kg: float):
     print(f"\n{'='*80}")
     print(f"OPTIMIZING for {target_payload_kg:.0f} kg ({kg_to_lbs(target_payload_kg):.0f} lbs) payload")
     print(f"{'='*80}")
 
-    best_config = None
-    best_ratio = 0
+
+def _summarize_designs(designs: Iterable[Dict],
+                       pareto_objectives: Optional[Dict[str, str]] = None,
+                       results_path: Optional[str] = None,
+                       keep_all: bool = True) -> Dict:
+    """Summary of the valid designs of a sweep (see optimize_rotor_configuration)"""
+    keep_all = keep_all or pareto_objectives is not None or results_path is not None
+    top = TopK(10, 'payload_ratio')
     results = []
 
-    # Test different configurations
-    rotor_counts = [4, 6, 8, 12, 16] if not has_wing else [4, 6, 8]
-    rotor_diameters = [0.35, 0.40, 0.46, 0.51, 0.56, 0.61, 0.66, 0.71, 0.76]  # 14" to 30" in meters
+    for result in designs:
+        top.push(result)
+        if keep_all:
+            results.append(result)
 
-    for num_rotors in rotor_counts:
-        for rotor_diameter_m in rotor_diameters:
-            rotor_diameter_inches = rotor_diameter_m / 0.0254
-
-            # Estimate airframe weight based on number of rotors and size
-            # Larger frames and more rotors = more weight
-            if has_wing:
-                # Quadplane: wing + fuselage + rotors
-                base_frame_weight = 2.5 + (num_rotors * 0.3) + 3.5  # Wing adds ~3.5 kg
-                wing_area = 1.2 if num_rotors <= 6 else 1.5
+    top_10 = top.results()
+    summary = {
+        'best': top_10[0] if top_10 else None,
+        'top_10': top_10
+    }
+
+    if keep_all:
+        # Sort results by payload ratio
+        results.sort(key=lambda x: x['payload_ratio'], reverse=True)
+        summary['all_valid'] = results
+
+    if pareto_objectives is not None:
+        summary['pareto_front'] = [results[i] for i in pareto_front_records(results, pareto_objectives)]
+
+    if results_path is not None:
+        ResultStore.from_records(results, SWEEP_RESULT_KEYS).save(results_path)
+
+    return summary
+
+
+def _nelder_mead(objective: Callable[[List[float]], float],
+                 x0: List[float],
+                 step: float = 0.1,
+                 max_evals: int = 200,
+                 xtol: float = 1e-4,
+                 ftol: float = 1e-8) -> Tuple[List[float], float]:
+    """
+    Minimize objective with the Nelder-Mead simplex method.
+
+    Returns: (best point, best value)
+    """
+    n = len(x0)
+    simplex = [list(x0)]
+    for i in range(n):
+        vertex = list(x0)
+        vertex[i] += step
+        simplex.append(vertex)
+    values = [objective(x) for x in simplex]
+    evals = n + 1
+
+    while evals < max_evals:
+        order = sorted(range(n + 1), key=values.__getitem__)
+        simplex = [simplex[i] for i in order]
+        values = [values[i] for i in order]
+
+        size = max(abs(v[i] - simplex[0][i]) for v in simplex[1:] for i in range(n))
+        if size < xtol or values[-1] - values[0] < ftol:
+            break
+
+        centroid = [sum(v[i] for v in simplex[:-1]) / n for i in range(n)]
+        worst = simplex[-1]
+
+        def towards(coeff: float) -> List[float]:
+            return [c + coeff * (w - c) for c, w in zip(centroid, worst)]
+
+        reflected = towards(-1.0)
+        f_reflected = objective(reflected)
+        evals += 1
+
+        if f_reflected < values[0]:
+            expanded = towards(-2.0)
+            f_expanded = objective(expanded)
+            evals += 1
+            if f_expanded < f_reflected:
+                simplex[-1], values[-1] = expanded, f_expanded
+            else:
+                simplex[-1], values[-1] = reflected, f_reflected
+        elif f_reflected < values[-2]:
+            simplex[-1], values[-1] = reflected, f_reflected
+        else:
+            # Contract towards the better of the worst and reflected points
+            if f_reflected < values[-1]:
+                contracted = towards(-0.5)
+            else:
+                contracted = towards(0.5)
+            f_contracted = objective(contracted)
+            evals += 1
+            if f_contracted < min(f_reflected, values[-1]):
+                simplex[-1], values[-1] = contracted, f_contracted
             else:
-                # Multirotor: just frame + motors
-                base_frame_weight = 1.5 + (num_rotors * 0.25)
-                wing_area = 0.0
-
-            # Motor weight scales with size
-            motor_weight_per = 0.25 + (rotor_diameter_m - 0.35) * 0.5
-            total_motor_weight = num_rotors * motor_weight_per
-
-            # Electronics, landing gear, payload mount
-            electronics_weight = 1.0
-            landing_gear_weight = 0.8
-            payload_mount_weight = 0.5
-
-            # Total airframe weight (excluding generator)
-            airframe_weight_kg = (base_frame_weight + total_motor_weight +
-                                electronics_weight + landing_gear_weight +
-                                payload_mount_weight)
-
-            # Total aircraft weight
-            total_aircraft_kg = airframe_weight_kg + hybrid_generator_weight_kg
-
-            # Skip if over weight limit
-            if total_aircraft_kg > max_aircraft_weight_kg:
-                continue
-
-            # Create configuration
-            config = AircraftConfig(
-                aircraft_weight_kg=airframe_weight_kg,
-                num_rotors=num_rotors,
-                rotor_diameter_m=rotor_diameter_m,
-                hover_efficiency=0.65,
-                cruise_efficiency=0.75,
-                has_wing=has_wing,
-                wing_area_m2=wing_area,
-                wing_efficiency=0.85,
-                hybrid_power=True,
-                generator_weight_kg=hybrid_generator_weight_kg,
-                generator_power_w=hybrid_generator_power_w,
-                battery_capacity_wh=0,  # Not relevant for hybrid
-                battery_weight_kg=0
-            )
-
-            # Calculate performance
-            try:
-                analysis = payload_ratio_analysis(config, target_payload_kg)
-
-                # Check if generator is adequate
-                if analysis['max_power_w'] > hybrid_generator_power_w * 1.2:  # Allow 20% overpower briefly
-                    continue
-
-                # Check if mission time is feasible
-                if not analysis['meets_time_requirement']:
-                    continue
-
-                # Check if we have good time margin (at least 3 minutes)
-                if analysis['time_margin_min'] < 3.0:
-                    continue
-
-                # This is a valid configuration
-                result = {
-                    'num_rotors': num_rotors,
-                    'rotor_diameter_m': rotor_diameter_m,
-                    'rotor_diameter_in': rotor_diameter_inches,
-                    'aircraft_weight_kg': total_aircraft_kg,
-                    'aircraft_weight_lbs': kg_to_lbs(total_aircraft_kg),
-                    'payload_ratio': analysis['payload_ratio'],
-                    'mission_time_min': analysis['mission_time_min'],
-                    'time_margin_min': analysis['time_margin_min'],
-                    'peak_power_w': analysis['max_power_w'],
-                    'avg_power_w': analysis['avg_power_w'],
-                    'energy_wh': analysis['mission_energy_wh'],
-                    'disk_area_m2': config.total_disk_area(),
-                    'disk_loading_kg_m2': config.disk_loading(total_aircraft_kg + target_payload_kg)
-                }
-
-                results.append(result)
-
-                # Track best
-                if analysis['payload_ratio'] > best_ratio:
-                    best_ratio = analysis['payload_ratio']
-                    best_config = result
-
-            except Exception as e:
-                # Skip invalid configurations
-                continue
-
-    # Sort results by payload ratio
-    results.sort(key=lambda x: x['payload_ratio'], reverse=True)
+                # Shrink everything towards the best vertex
+                best = simplex[0]
+                for j in range(1, n + 1):
+                    simplex[j] = [b + 0.5 * (x - b) for b, x in zip(best, simplex[j])]
+                    values[j] = objective(simplex[j])
+                evals += n
+
+    best_index = min(range(n + 1), key=values.__getitem__)
+    return simplex[best_index], values[best_index]
+
+
+def optimize_continuous(target_payload_kg: float,
+                        max_aircraft_weight_kg: float,
+                        has_wing: bool = False,
+                        rotor_counts: Optional[List[int]] = None,
+                        diameter_bounds_m: Tuple[float, float] = (0.30, 1.00),
+                        generator_power_bounds_w: Tuple[float, float] = (2000, 30000),
+                        wing_area_bounds_m2: Tuple[float, float] = (0.5, 3.0),
+                        generator_weight_model: Callable[[float], float] = estimate_generator_weight,
+                        n_starts: int = 6,
+                        max_evals_per_start: int = 150,
+                        seed: Optional[int] = 0) -> Dict:
+    """
+    Optimize rotor diameter, generator size and wing area continuously.
+
+    For each integer rotor count, a multi-start Nelder-Mead search runs over
+    the continuous parameters (scaled to [0, 1]). Generator weight follows
+    generator_weight_model. The grid sweep's weight limit, 20% overpower
+    allowance and 3 minute time margin are enforced as penalties, and only
+    designs that satisfy all three are returned.
+
+    Args:
+        target_payload_kg: Target payload weight
+        max_aircraft_weight_kg: Maximum allowed aircraft weight
+        has_wing: Optimize a quadplane (adds wing area as a variable)
+        rotor_counts: Rotor counts to try (default matches the grid sweep)
+        diameter_bounds_m: Rotor diameter search range
+        generator_power_bounds_w: Generator power search range
+        wing_area_bounds_m2: Wing area search range (wing designs only)
+        generator_weight_model: Maps generator power (W) to weight (kg)
+        n_starts: Random starting points per rotor count
+        max_evals_per_start: Evaluation budget per local search
+        seed: Random seed for the starting points
+
+    Returns: Dictionary with the overall 'best' design, the best design per
+             rotor count and the number of payload_ratio_analysis evaluations
+    """
+    if rotor_counts is None:
+        rotor_counts = [4, 6, 8, 12, 16] if not has_wing else [4, 6, 8]
+
+    bounds = [diameter_bounds_m, generator_power_bounds_w]
+    if has_wing:
+        bounds.append(wing_area_bounds_m2)
+
+    rng = random.Random(seed)
+    evaluations = 0
+    per_rotor_count = {}
+
+    def design_at(num_rotors: int, unit_x: List[float]) -> Dict:
+        """Evaluate a design at a point in the unit cube"""
+        nonlocal evaluations
+        x = [lo + min(max(u, 0.0), 1.0) * (hi - lo) for u, (lo, hi) in zip(unit_x, bounds)]
+        rotor_diameter_m, generator_power_w = x[0], x[1]
+        wing_area_m2 = x[2] if has_wing else None
+        generator_weight_kg = generator_weight_model(generator_power_w)
+
+        config = _grid_point_config(num_rotors, rotor_diameter_m, generator_weight_kg,
+                                    generator_power_w, has_wing, wing_area_m2)
+        total_aircraft_kg = config.total_weight()
+
+        analysis = payload_ratio_analysis(config, target_payload_kg)
+        evaluations += 1
+
+        # Normalized constraint violations (<= 0 when satisfied)
+        violation = (max(0.0, total_aircraft_kg / max_aircraft_weight_kg - 1) +
+                     max(0.0, analysis['max_power_w'] / (generator_power_w * 1.2) - 1) +
+                     max(0.0, (3.0 - analysis['time_margin_min']) / 3.0))
+
+        return {
+            'num_rotors': num_rotors,
+            'rotor_diameter_m': rotor_diameter_m,
+            'rotor_diameter_in': rotor_diameter_m / 0.0254,
+            'generator_power_w': generator_power_w,
+            'generator_weight_kg': generator_weight_kg,
+            'wing_area_m2': config.wing_area_m2,
+            'aircraft_weight_kg': total_aircraft_kg,
+            'aircraft_weight_lbs': kg_to_lbs(total_aircraft_kg),
+            'payload_ratio': analysis['payload_ratio'],
+            'mission_time_min': analysis['mission_time_min'],
+            'time_margin_min': analysis['time_margin_min'],
+            'peak_power_w': analysis['max_power_w'],
+            'avg_power_w': analysis['avg_power_w'],
+            'energy_wh': analysis['mission_energy_wh'],
+            'disk_area_m2': config.total_disk_area(),
+            'disk_loading_kg_m2': config.disk_loading(total_aircraft_kg + target_payload_kg),
+            'feasible': violation == 0.0,
+            'violation': violation
+        }
+
+    for num_rotors in rotor_counts:
+        best = None
+
+        def objective(unit_x: List[float]) -> float:
+            nonlocal best
+            design = design_at(num_rotors, unit_x)
+            if design['feasible'] and (best is None or design['payload_ratio'] > best['payload_ratio']):
+                best = design
+            # Maximize payload ratio; penalize constraint violations
+            return -design['payload_ratio'] + 100.0 * design['violation']
+
+        for _ in range(n_starts):
+            x0 = [rng.random() for _ in bounds]
+            _nelder_mead(objective, x0, step=0.15, max_evals=max_evals_per_start)
+
+        per_rotor_count[num_rotors] = best
+
+    feasible = [d for d in per_rotor_count.values() if d is not None]
+    overall = max(feasible, key=lambda d: d['payload_ratio']) if feasible else None
 
     return {
-        'best': best_config,
-        'top_10': results[:10],
-        'all_valid': results
+        'best': overall,
+        'by_rotor_count': per_rotor_count,
+        'evaluations': evaluations
     }
 
 
-def compare_designs():
-    """Compare different design approaches"""
+def compare_designs(workers: Optional[int] = 1):
+    """
+    Compare different design approaches
+
+    Args:
+        workers: Worker processes for the sweep of all scenarios (1 = serial,
+                 None = all CPUs)
+    """
     print("\n" + "="*80)
     print("DESIGN COMPARISON ANALYSIS")
     print("="*80)
@@ -156,9 +658,6 @@ def compare_designs():
     target_payload = lbs_to_kg(240)  # 240 lbs
     max_aircraft_weight = lbs_to_kg(55)  # 55 lbs limit
 
-    # Test 1: Pure octocopter with various generator sizes
-    print("\n### SCENARIO 1: Octocopter with different generators ###")
-
     generators = [
         {'name': 'Small (3kW)', 'weight': 4.0, 'power': 3000},
         {'name': 'Medium (5kW)', 'weight': 7.0, 'power': 5000},
@@ -166,17 +665,31 @@ def compare_designs():
         {'name': 'X-Large (12kW)', 'weight': 13.0, 'power': 12000},
     ]
 
-    for gen in generators:
+    # Test 1: Pure octocopter with various generator sizes
+    # Test 2: Quadplane with wing (smaller generators, slightly lower target)
+    scenarios = [(gen, dict(target_payload_kg=target_payload, has_wing=False))
+                 for gen in generators]
+    scenarios += [(gen, dict(target_payload_kg=lbs_to_kg(220), has_wing=True))
+                  for gen in generators[:3]]
+
+    # All scenarios are swept together as one grid, then reported in order
+    all_designs = sweep_scenarios(
+        [dict(sweep, max_aircraft_weight_kg=max_aircraft_weight,
+              hybrid_generator_weight_kg=gen['weight'], hybrid_generator_power_w=gen['power'])
+         for gen, sweep in scenarios],
+        workers=workers)
+
+    for index, ((gen, sweep), designs) in enumerate(zip(scenarios, all_designs)):
+        if index == 0:
+            print("\n### SCENARIO 1: Octocopter with different generators ###")
+        elif index == len(generators):
+            print("\n\n### SCENARIO 2: Quadplane (Hybrid VTOL) ###")
+
         print(f"\n--- {gen['name']} Generator ---")
         print(f"Generator: {gen['weight']:.1f} kg, {gen['power']}W")
 
-        result = optimize_rotor_configuration(
-            target_payload_kg=target_payload,
-            max_aircraft_weight_kg=max_aircraft_weight,
-            hybrid_generator_weight_kg=gen['weight'],
-            hybrid_generator_power_w=gen['power'],
-            has_wing=False
-        )
+        _print_optimizing_header(sweep['target_payload_kg'])
+        result = _summarize_designs(designs, keep_all=False)
 
         if result['best']:
             best = result['best']
@@ -187,36 +700,47 @@ def compare_designs():
             print(f"  Mission time: {best['mission_time_min']:.1f} min (margin: {best['time_margin_min']:.1f} min)")
             print(f"  Peak power: {best['peak_power_w']/1000:.1f} kW")
             print(f"  Energy: {best['energy_wh']/1000:.1f} kWh")
-            print(f"  Disk loading: {best['disk_loading_kg_m2']:.1f} kg/m²")
+            if not sweep['has_wing']:
+                print(f"  Disk loading: {best['disk_loading_kg_m2']:.1f} kg/m²")
         else:
             print(f"✗ NO FEASIBLE SOLUTION FOUND")
 
-    # Test 2: Quadplane with wing
-    print("\n\n### SCENARIO 2: Quadplane (Hybrid VTOL) ###")
 
-    for gen in generators[:3]:  # Test smaller generators for quadplane
-        print(f"\n--- {gen['name']} Generator ---")
-        print(f"Generator: {gen['weight']:.1f} kg, {gen['power']}W")
-
-        result = optimize_rotor_configuration(
-            target_payload_kg=lbs_to_kg(220),  # Slightly lower target for quadplane
-            max_aircraft_weight_kg=max_aircraft_weight,
-            hybrid_generator_weight_kg=gen['weight'],
-            hybrid_generator_power_w=gen['power'],
-            has_wing=True
-        )
+# Baseline of the sensitivity analysis (16 rotors with a 12kW generator)
+SENSITIVITY_BASE_CONFIG = AircraftConfig(
+    aircraft_weight_kg=11.0,  # Airframe only
+    num_rotors=16,
+    rotor_diameter_m=0.61,
+    hover_efficiency=0.65,
+    cruise_efficiency=0.75,
+    has_wing=False,
+    hybrid_power=True,
+    generator_weight_kg=13.0,
+    generator_power_w=12000,
+    battery_capacity_wh=0,
+    battery_weight_kg=0
+)
+SENSITIVITY_PAYLOAD_KG = lbs_to_kg(240)
+
+
+def global_sensitivity(seed: Optional[int] = 0) -> Dict:
+    """
+    Sobol indices of peak power and mission energy around the sensitivity
+    baseline (captures interactions between parameters).
 
-        if result['best']:
-            best = result['best']
-            print(f"\n✓ FEASIBLE")
-            print(f"  Best: {best['num_rotors']} rotors × {best['rotor_diameter_in']:.0f}\"")
-            print(f"  Aircraft weight: {best['aircraft_weight_lbs']:.1f} lbs")
-            print(f"  PAYLOAD RATIO: {best['payload_ratio']:.2f}:1")
-            print(f"  Mission time: {best['mission_time_min']:.1f} min (margin: {best['time_margin_min']:.1f} min)")
-            print(f"  Peak power: {best['peak_power_w']/1000:.1f} kW")
-            print(f"  Energy: {best['energy_wh']/1000:.1f} kWh")
-        else:
-            print(f"✗ NO FEASIBLE SOLUTION FOUND")
+    Returns: {output: SobolResult}
+    """
+    baseline_payload = SENSITIVITY_PAYLOAD_KG
+    parameters = {
+        'hover_efficiency': (0.55, 0.75),
+        'cruise_efficiency': (0.70, 0.80),
+        'aircraft_weight_kg': (10.0, 12.0),
+        'rotor_diameter_m': (0.56, 0.66),
+        'payload_kg': (baseline_payload * 0.9, baseline_payload * 1.1),
+    }
+    return sobol_indices(SENSITIVITY_BASE_CONFIG, parameters,
+                         outputs=('max_power_w', 'mission_energy_wh'),
+                         payload_kg=baseline_payload, seed=seed)
 
 
 def sensitivity_analysis():
@@ -225,22 +749,8 @@ def sensitivity_analysis():
     print("SENSITIVITY ANALYSIS")
     print("="*80)
 
-    # Base configuration (octocopter with 12kW generator)
-    base_config = AircraftConfig(
-        aircraft_weight_kg=11.0,  # Airframe only
-        num_rotors=16,
-        rotor_diameter_m=0.61,
-        hover_efficiency=0.65,
-        cruise_efficiency=0.75,
-        has_wing=False,
-        hybrid_power=True,
-        generator_weight_kg=13.0,
-        generator_power_w=12000,
-        battery_capacity_wh=0,
-        battery_weight_kg=0
-    )
-
-    baseline_payload = lbs_to_kg(240)
+    base_config = SENSITIVITY_BASE_CONFIG
+    baseline_payload = SENSITIVITY_PAYLOAD_KG
 
     print("\n### Baseline Configuration ###")
     baseline = payload_ratio_analysis(base_config, baseline_payload)
@@ -294,8 +804,23 @@ def sensitivity_analysis():
         print(f"  {num_rotors} × {diameter_in:.1f}\": Power={result['max_power_w']/1000:.1f}kW, "
               f"Time={result['mission_time_min']:.1f}min")
 
+    # Global variance-based sensitivity (captures interactions)
+    print("\n### Global Sensitivity (Sobol indices, 95% CI) ###")
+    indices = global_sensitivity()
+
+    for output, result in indices.items():
+        print(f"\n  {output} ({result.n_evaluations:,} evaluations):")
+        for name in result.parameters:
+            low, high = result.total_order_ci[name]
+            print(f"    {name:<20} S1={result.first_order[name]:.3f}  "
+                  f"ST={result.total_order[name]:.3f} [{low:.3f}, {high:.3f}]")
+
 
 if __name__ == "__main__":
+    from eval_cache import enable_from_environment
+
+    enable_from_environment()
+
     # Run optimization
     compare_designs()
 
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+DARPA Lift Challenge - Pareto Front Engine
+
+Non-dominated sorting for multi-objective design trade-offs (payload ratio
+vs time margin, peak power, energy, ...):
+- Two objectives: lexicographic sort plus a running-minimum sweep, O(N log N)
+- Three objectives: sort plus a sweep with a Fenwick-tree prefix minimum,
+  O(N log N)
+- Four or more: Kung's divide-and-conquer algorithm with a vectorized
+  pairwise merge, O(N * F) for a front of F points, so O(N^2) in the
+  worst case where most points are non-dominated (the classic
+  O(N log^(k-2) N) bound needs a recursive merge; in practice the
+  prefilter leaves few points to merge)
+
+Works on plain (N, k) arrays, on columnar results (e.g. the table from
+payload_ratio_analysis_batch) and on lists of result records (e.g. the
+optimizer's all_valid list).
+"""
+
+from collections.abc import Mapping
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+
+
+# Objectives the design review board trades against each other
+DEFAULT_PARETO_OBJECTIVES = {
+    'payload_ratio': 'max',
+    'time_margin_min': 'max',
+    'peak_power_w': 'min',
+    'energy_wh': 'min',
+}
+
+# Below this size Kung's recursion falls back to a direct pairwise check
+_BRUTE_FORCE_SIZE = 256
+
+# Max elements materialized per block in the pairwise dominance check
+_DOMINANCE_BLOCK_ELEMENTS = 1 << 22
+
+# Random weightings used to pick guaranteed-optimal seed points for the
+# prefilter (the minimizer of a positively weighted sum is non-dominated)
+_PREFILTER_WEIGHTINGS = 32
+
+# Below this many unique points the exact algorithms run without prefilter
+_PREFILTER_MIN_SIZE = 4096
+
+
+def _dominated_by_any(candidates: np.ndarray, front: np.ndarray) -> np.ndarray:
+    """
+    Mask of candidates weakly dominated by some row of front.
+
+    All points are unique, so weak dominance (<= in every objective) by a
+    different point is strict dominance.
+    """
+    dominated = np.zeros(len(candidates), dtype=bool)
+    if len(front) == 0:
+        return dominated
+
+    block = max(1, _DOMINANCE_BLOCK_ELEMENTS // (len(front) * candidates.shape[1]))
+    for start in range(0, len(candidates), block):
+        chunk = candidates[start:start + block]
+        dominated[start:start + block] = np.any(
+            np.all(front[None, :, :] <= chunk[:, None, :], axis=2), axis=1)
+    return dominated
+
+
+def _prefilter(points: np.ndarray) -> np.ndarray:
+    """
+    Indices of unique points that survive a cheap dominance screen.
+
+    Points minimizing randomly weighted sums lie on the front; anything they
+    dominate is discarded before the exact algorithm runs. For typical
+    sweep data this removes almost every row in a few vectorized passes.
+    """
+    k = points.shape[1]
+    spread = points.max(axis=0) - points.min(axis=0)
+    scaled = (points - points.min(axis=0)) / np.where(spread > 0, spread, 1.0)
+
+    # One weighting at a time: an (N,) temporary instead of (weightings, N)
+    weights = np.random.default_rng(0).random((_PREFILTER_WEIGHTINGS, k)) + 1e-3
+    seeds = np.unique(np.concatenate(([np.argmin(scaled @ w) for w in weights],
+                                      np.argmin(points, axis=0))))
+
+    # Seeds weakly dominate themselves; keep them
+    dominated = _dominated_by_any(points, points[seeds])
+    dominated[seeds] = False
+    return np.flatnonzero(~dominated)
+
+
+def _front_two_objectives(points: np.ndarray) -> np.ndarray:
+    """Non-dominated rows of unique, lexicographically sorted 2-D points"""
+    f2 = points[:, 1]
+    previous_best = np.concatenate(([np.inf], np.minimum.accumulate(f2)[:-1]))
+    return np.flatnonzero(f2 < previous_best)
+
+
+def _front_three_objectives(points: np.ndarray) -> np.ndarray:
+    """
+    Non-dominated rows of unique, lexicographically sorted 3-D points.
+
+    Rows are visited in f1 order. A row is dominated iff an earlier row has
+    f2 and f3 no larger than its own, i.e. iff the minimum f3 over earlier
+    rows with f2 <= its f2 is no larger than its f3. A Fenwick tree over the
+    f2 ranks answers that prefix minimum in O(log N) per row, so the sweep
+    is O(N log N) however large the front gets.
+    """
+    f2 = points[:, 1]
+    f2_values = np.unique(f2)
+    ranks = (np.searchsorted(f2_values, f2) + 1).tolist()  # 1-based
+    size = len(f2_values)
+    tree: List[float] = [np.inf] * (size + 1)
+    front = []
+
+    for i, (rank, f3) in enumerate(zip(ranks, points[:, 2].tolist())):
+        r = rank
+        best = np.inf
+        while r:
+            if tree[r] < best:
+                best = tree[r]
+            r &= r - 1
+        if best <= f3:
+            continue
+        front.append(i)
+
+        # Only front rows need inserting: a dominated row's dominator
+        # already covers every query it would
+        r = rank
+        while r <= size:
+            if f3 < tree[r]:
+                tree[r] = f3
+            r += r & -r
+
+    return np.array(front, dtype=np.intp)
+
+
+def _front_kung(points: np.ndarray, index: np.ndarray) -> np.ndarray:
+    """
+    Kung's algorithm on unique, lexicographically sorted points.
+
+    Each merge checks the bottom half's front against the top half's front
+    pairwise (in vectorized blocks), so the cost grows with the product of
+    the front sizes: O(N^2) when most points are non-dominated.
+    """
+    n = len(index)
+    if n <= _BRUTE_FORCE_SIZE:
+        block = points[index]
+        # weakly_dominates[i, j]: row j <= row i in every objective
+        weakly_dominates = np.all(block[None, :, :] <= block[:, None, :], axis=2)
+        np.fill_diagonal(weakly_dominates, False)
+        return index[~weakly_dominates.any(axis=1)]
+
+    half = n // 2
+    top = _front_kung(points, index[:half])
+    bottom = _front_kung(points, index[half:])
+    survivors = bottom[~_dominated_by_any(points[bottom], points[top])]
+    return np.concatenate((top, survivors))
+
+
+def pareto_front(points, maximize: Union[bool, Sequence[bool]] = False) -> np.ndarray:
+    """
+    Indices of the non-dominated rows of an (N, k) objective array.
+
+    Args:
+        points: Objective values, one row per design
+        maximize: Per-objective flags (or one flag for all); objectives are
+                  minimized unless flagged
+
+    Returns: Sorted array of row indices on the Pareto front. Duplicate
+             rows on the front are all returned.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 2:
+        raise ValueError("points must be an (N, k) array")
+    if len(points) == 0:
+        return np.empty(0, dtype=np.intp)
+
+    if np.isnan(points).any():
+        raise ValueError("points must not contain NaN")
+    sign = np.where(np.broadcast_to(np.asarray(maximize, dtype=bool), points.shape[1:]), -1.0, 1.0)
+
+    # Sort rows lexicographically and collapse duplicates. A stable sort on
+    # the first objective is already lexicographic when it has no ties.
+    signed = points * sign
+    order = np.argsort(signed[:, 0], kind='stable')
+    if np.any(np.diff(signed[order, 0]) == 0):
+        order = np.lexsort(signed.T[::-1])
+    ordered = signed[order]
+    is_new = np.ones(len(ordered), dtype=bool)
+    is_new[1:] = np.any(ordered[1:] != ordered[:-1], axis=1)
+    unique = ordered[is_new]
+    inverse = np.empty(len(points), dtype=np.intp)
+    inverse[order] = np.cumsum(is_new) - 1
+
+    k = unique.shape[1]
+    if k == 1:
+        front = np.array([0])
+    elif k == 2:
+        front = _front_two_objectives(unique)
+    else:
+        if len(unique) >= _PREFILTER_MIN_SIZE:
+            survivors = _prefilter(unique)
+        else:
+            survivors = np.arange(len(unique))
+        if k == 3:
+            front = survivors[_front_three_objectives(unique[survivors])]
+        else:
+            front = _front_kung(unique, survivors)
+
+    on_front = np.zeros(len(unique), dtype=bool)
+    on_front[front] = True
+    return np.flatnonzero(on_front[inverse])
+
+
+def pareto_front_records(results: Union[List[Mapping], Mapping[str, np.ndarray]],
+                         objectives: Dict[str, str] = None) -> np.ndarray:
+    """
+    Pareto front of result records over selected objectives.
+
+    Args:
+        results: List of result records or a columnar mapping of arrays
+        objectives: {result key: 'max' or 'min'} (defaults to
+                    DEFAULT_PARETO_OBJECTIVES)
+
+    Returns: Indices of the non-dominated records
+    """
+    if objectives is None:
+        objectives = DEFAULT_PARETO_OBJECTIVES
+
+    for key, sense in objectives.items():
+        if sense not in ('max', 'min'):
+            raise ValueError(f"Objective {key!r} must be 'max' or 'min', got {sense!r}")
+
+    if isinstance(results, Mapping):
+        columns = [np.asarray(results[key], dtype=np.float64).reshape(-1) for key in objectives]
+    else:
+        columns = [np.array([r[key] for r in results], dtype=np.float64) for key in objectives]
+
+    points = np.column_stack(columns) if columns and len(columns[0]) else np.empty((0, len(objectives)))
+    return pareto_front(points, [sense == 'max' for sense in objectives.values()])
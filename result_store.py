@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+DARPA Lift Challenge - Columnar Sweep Result Store
+
+Design sweeps produce one flat result dict per valid design (see
+optimizer._evaluate_grid_point). ResultStore keeps the same data as a NumPy
+structured array, one field per result key, and persists it as a .npy file.
+Reopening a store memory-maps the file, so reports can read multi-gigabyte
+sweeps instantly and only touch the columns and rows they use.
+"""
+
+import os
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+
+# Known result columns (result key -> dtype); other numeric keys are stored as float64
+RESULT_COLUMNS = {
+    'num_rotors': np.int64,
+    'rotor_diameter_m': np.float64,
+    'rotor_diameter_in': np.float64,
+    'cruise_speed_ms': np.float64,
+    'generator_power_w': np.float64,
+    'generator_weight_kg': np.float64,
+    'wing_area_m2': np.float64,
+    'aircraft_weight_kg': np.float64,
+    'aircraft_weight_lbs': np.float64,
+    'payload_ratio': np.float64,
+    'mission_time_min': np.float64,
+    'time_margin_min': np.float64,
+    'peak_power_w': np.float64,
+    'avg_power_w': np.float64,
+    'energy_wh': np.float64,
+    'disk_area_m2': np.float64,
+    'disk_loading_kg_m2': np.float64,
+    'feasible': np.bool_,
+    'violation': np.float64,
+}
+
+
+# Keys of an optimize_rotor_configuration result, in order
+SWEEP_RESULT_KEYS = ('num_rotors', 'rotor_diameter_m', 'rotor_diameter_in', 'cruise_speed_ms',
+                     'aircraft_weight_kg', 'aircraft_weight_lbs', 'payload_ratio',
+                     'mission_time_min', 'time_margin_min', 'peak_power_w', 'avg_power_w',
+                     'energy_wh', 'disk_area_m2', 'disk_loading_kg_m2')
+
+
+def result_dtype(columns: Sequence[str]) -> np.dtype:
+    """Structured dtype for the given result keys, in order"""
+    return np.dtype([(name, RESULT_COLUMNS.get(name, np.float64)) for name in columns])
+
+
+class ResultStore:
+    """
+    Columnar table of sweep results backed by a structured array.
+
+    store['payload_ratio'] returns a column, record(i) a plain result dict
+    and columns() a {key: column} dict (accepted by pareto_front_records).
+    Stores opened from disk are read-only memory maps.
+    """
+
+    def __init__(self, data: np.ndarray):
+        if data.dtype.names is None:
+            raise ValueError("ResultStore needs a structured array")
+        self.data = data.reshape(-1)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict],
+                     columns: Optional[Sequence[str]] = None) -> 'ResultStore':
+        """
+        Build a store from result dicts.
+
+        Args:
+            records: Result dicts sharing the same keys
+            columns: Keys to store (default: the keys of the first record)
+
+        Returns: ResultStore
+        """
+        records = list(records)
+        if columns is None:
+            if not records:
+                raise ValueError("columns are required for an empty store")
+            columns = list(records[0])
+        dtype = result_dtype(columns)
+        data = np.empty(len(records), dtype=dtype)
+        for name in columns:
+            data[name] = [r[name] for r in records]
+        return cls(data)
+
+    @classmethod
+    def open(cls, path: str, mmap: bool = True) -> 'ResultStore':
+        """
+        Open a store saved with save().
+
+        Args:
+            path: .npy file path
+            mmap: Memory-map the file read-only instead of loading it
+
+        Returns: ResultStore
+        """
+        return cls(np.load(path, mmap_mode='r' if mmap else None, allow_pickle=False))
+
+    def save(self, path: str):
+        """Write the store to a .npy file (written to a temp file, then renamed)"""
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.lib.format.write_array(f, np.ascontiguousarray(self.data), allow_pickle=False)
+        os.replace(tmp_path, path)
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    @property
+    def column_names(self) -> tuple:
+        return self.data.dtype.names
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.data[key]
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Return the columns as a {result key: array} dict"""
+        return {name: self.data[name] for name in self.column_names}
+
+    def record(self, i: int) -> Dict:
+        """Result dict for one row"""
+        row = self.data[i]
+        return {name: row[name].item() for name in self.column_names}
+
+    def records(self) -> List[Dict]:
+        """Result dicts for every row"""
+        columns = [self.data[name].tolist() for name in self.column_names]
+        return [dict(zip(self.column_names, values)) for values in zip(*columns)]
+
+    def take(self, index) -> 'ResultStore':
+        """Select rows by integer index array, slice or boolean mask"""
+        return ResultStore(self.data[index])
+
+    def sorted_by(self, key: str, descending: bool = True) -> 'ResultStore':
+        """Rows ordered by one column (stable, so ties keep their order)"""
+        values = self.data[key]
+        order = np.argsort(-values if descending else values, kind='stable')
+        return self.take(order)
+
+    def top(self, k: int, key: str = 'payload_ratio', descending: bool = True) -> 'ResultStore':
+        """The k best rows by one column, best first"""
+        values = self.data[key]
+        values = -values if descending else values
+        if k < len(values):
+            index = np.argpartition(values, k)[:k]
+            index = index[np.argsort(values[index], kind='stable')]
+        else:
+            index = np.argsort(values, kind='stable')
+        return self.take(index)
+
+    def __repr__(self) -> str:
+        return f'ResultStore(rows={len(self)}, columns={list(self.column_names)})'
+
+
+if __name__ == "__main__":
+    import tempfile
+    from simulator import lbs_to_kg
+    from optimizer import optimize_rotor_configuration
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sweep.npy')
+        optimize_rotor_configuration(
+            target_payload_kg=lbs_to_kg(110),
+            max_aircraft_weight_kg=lbs_to_kg(55),
+            hybrid_generator_weight_kg=13.0,
+            hybrid_generator_power_w=15000,
+            results_path=path
+        )
+        store = ResultStore.open(path)
+        print(f"\n{store}")
+        for r in store.top(5).records():
+            print(f"  {r['num_rotors']:2d} × {r['rotor_diameter_in']:.0f}\": "
+                  f"ratio {r['payload_ratio']:.2f}:1, peak {r['peak_power_w']/1000:.1f} kW")
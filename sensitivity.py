@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+DARPA Lift Challenge - Global Sensitivity Analysis
+
+Variance-based (Sobol) sensitivity of mission outputs to any subset of
+AircraftConfig fields and mission inputs (payload, cruise speed, air
+density and steady wind):
+- First-order index S_i: share of output variance explained by input i alone
+- Total index ST_i: share involving input i, including all interactions
+
+Samples follow the Saltelli scheme (matrices A, B and the N*d hybrid rows
+AB_i) and are evaluated in one call to payload_ratio_analysis_batch.
+Confidence intervals come from bootstrap resampling of the base rows.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from simulator import AircraftConfig, AIR_DENSITY_SEA_LEVEL
+from batch_simulator import DESIGN_COLUMNS, DesignTable, payload_ratio_analysis_batch
+
+
+# Mission inputs that can be varied alongside the design fields
+MISSION_INPUTS = ('payload_kg', 'cruise_speed_ms', 'air_density', 'wind_speed_ms', 'wind_from_deg')
+
+
+@dataclass
+class SobolResult:
+    """Sobol indices for one output"""
+    output: str
+    parameters: Tuple[str, ...]
+    first_order: Dict[str, float]
+    total_order: Dict[str, float]
+    first_order_ci: Dict[str, Tuple[float, float]]
+    total_order_ci: Dict[str, Tuple[float, float]]
+    variance: float
+    n_evaluations: int
+
+
+def saltelli_sample(bounds: Sequence[Tuple[float, float]], n_base: int,
+                    rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Draw Saltelli sample matrices.
+
+    Returns: (A, B, AB) with A and B of shape (n_base, d) and AB of shape
+             (d, n_base, d), where AB[i] is A with column i taken from B
+    """
+    bounds = np.asarray(bounds, dtype=np.float64)
+    d = len(bounds)
+    low, high = bounds[:, 0], bounds[:, 1]
+
+    A = low + (high - low) * rng.random((n_base, d))
+    B = low + (high - low) * rng.random((n_base, d))
+    AB = np.repeat(A[None, :, :], d, axis=0)
+    for i in range(d):
+        AB[i, :, i] = B[:, i]
+    return A, B, AB
+
+
+def _indices(f_A: np.ndarray, f_B: np.ndarray, f_AB: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    First-order (Saltelli 2010) and total (Jansen) index estimators.
+
+    f_AB has shape (d, N). Returns (S, ST, variance).
+    """
+    both = np.concatenate((f_A, f_B))
+    variance = np.var(both)
+    if variance == 0:
+        zeros = np.zeros(len(f_AB))
+        return zeros, zeros, 0.0
+    # Centering f_B leaves the first-order estimator unbiased but cuts its
+    # variance when the output mean is large relative to its spread
+    first = np.mean((f_B - both.mean()) * (f_AB - f_A), axis=1) / variance
+    total = 0.5 * np.mean((f_A - f_AB) ** 2, axis=1) / variance
+    return first, total, float(variance)
+
+
+def _evaluate(base_config: AircraftConfig, parameters: Sequence[str], samples: np.ndarray,
+              mission: Dict[str, float], outputs: Sequence[str]) -> Dict[str, np.ndarray]:
+    """
+    Evaluate the mission for sample rows (one column per parameter).
+
+    mission holds the fixed value of every MISSION_INPUTS entry.
+    """
+    columns = {name: getattr(base_config, name) for name in DESIGN_COLUMNS}
+    mission = dict(mission)
+
+    for j, name in enumerate(parameters):
+        values = samples[:, j]
+        if name in mission:
+            mission[name] = values
+        elif DESIGN_COLUMNS[name] is np.int64:
+            columns[name] = np.rint(values)
+        else:
+            columns[name] = values
+
+    table = DesignTable.from_columns(**columns)
+    result = payload_ratio_analysis_batch(table, mission['payload_kg'], mission['cruise_speed_ms'],
+                                          air_density=mission['air_density'],
+                                          wind_speed_ms=mission['wind_speed_ms'],
+                                          wind_from_deg=mission['wind_from_deg'])
+    return {name: np.broadcast_to(result[name], (len(samples),)) for name in outputs}
+
+
+def sobol_indices(base_config: AircraftConfig,
+                  parameters: Dict[str, Tuple[float, float]],
+                  outputs: Sequence[str] = ('max_power_w',),
+                  payload_kg: float = 100.0,
+                  cruise_speed_ms: float = 7.5,
+                  air_density: float = AIR_DENSITY_SEA_LEVEL,
+                  wind_speed_ms: float = 0.0,
+                  wind_from_deg: float = 0.0,
+                  n_base: int = 2 ** 14,
+                  n_bootstrap: int = 200,
+                  confidence: float = 0.95,
+                  seed: Optional[int] = None) -> Dict[str, SobolResult]:
+    """
+    Compute first-order and total Sobol indices.
+
+    Args:
+        base_config: Configuration supplying every field not being varied
+        parameters: {name: (low, high)} uniform ranges. Names are numeric
+                    AircraftConfig fields or MISSION_INPUTS; num_rotors
+                    samples are rounded to integers. Keep wind ranges
+                    below the cruise speed: samples where the course
+                    cannot be flown give NaN outputs, and so NaN indices
+        outputs: payload_ratio_analysis result keys to analyze
+        payload_kg: Payload when not varied
+        cruise_speed_ms: Cruise speed when not varied
+        air_density: Air density in kg/m^3 when not varied (default: ISA
+                     sea level)
+        wind_speed_ms: Steady wind speed in m/s when not varied
+        wind_from_deg: Direction the wind blows from, relative to the
+                       loaded leg track, when not varied
+        n_base: Base sample size N; the analysis costs N * (d + 2)
+                mission evaluations for d parameters
+        n_bootstrap: Bootstrap resamples for the confidence intervals
+        confidence: Confidence level of the intervals
+        seed: Random seed
+
+    Returns: {output name: SobolResult}
+    """
+    names = tuple(parameters)
+    for name in names:
+        if name not in MISSION_INPUTS and (name not in DESIGN_COLUMNS or DESIGN_COLUMNS[name] is np.bool_):
+            raise ValueError(f"Cannot vary {name!r}: not a numeric design field or mission input")
+
+    rng = np.random.default_rng(seed)
+    d = len(names)
+    A, B, AB = saltelli_sample([parameters[name] for name in names], n_base, rng)
+
+    # One batched evaluation over A, B and every AB_i
+    stacked = np.concatenate((A, B, AB.reshape(d * n_base, d)))
+    mission = {'payload_kg': payload_kg, 'cruise_speed_ms': cruise_speed_ms,
+               'air_density': air_density, 'wind_speed_ms': wind_speed_ms,
+               'wind_from_deg': wind_from_deg}
+    evaluated = _evaluate(base_config, names, stacked, mission, outputs)
+
+    alpha = (1 - confidence) / 2
+    results = {}
+    for output in outputs:
+        values = evaluated[output]
+        f_A = values[:n_base]
+        f_B = values[n_base:2 * n_base]
+        f_AB = values[2 * n_base:].reshape(d, n_base)
+
+        first, total, variance = _indices(f_A, f_B, f_AB)
+
+        boot_first = np.empty((n_bootstrap, d))
+        boot_total = np.empty((n_bootstrap, d))
+        for b in range(n_bootstrap):
+            rows = rng.integers(0, n_base, n_base)
+            boot_first[b], boot_total[b], _ = _indices(f_A[rows], f_B[rows], f_AB[:, rows])
+
+        first_ci = np.quantile(boot_first, [alpha, 1 - alpha], axis=0)
+        total_ci = np.quantile(boot_total, [alpha, 1 - alpha], axis=0)
+
+        results[output] = SobolResult(
+            output=output,
+            parameters=names,
+            first_order=dict(zip(names, first.tolist())),
+            total_order=dict(zip(names, total.tolist())),
+            first_order_ci={name: (float(first_ci[0, i]), float(first_ci[1, i])) for i, name in enumerate(names)},
+            total_order_ci={name: (float(total_ci[0, i]), float(total_ci[1, i])) for i, name in enumerate(names)},
+            variance=variance,
+            n_evaluations=len(stacked)
+        )
+
+    return results
@@ -9,11 +9,32 @@ This module provides core physics calculations for VTOL drone performance:
 - Performance metrics
 
 All calculations use SI units internally, with conversion functions provided.
+Air density defaults to sea level and can be set per evaluation (see
+atmosphere.py for ISA densities by altitude and temperature). A steady wind
+changes the ground speed, and so the duration, of the two cruise legs;
+cruise power is set by airspeed.
+
+Results are returned as compact slotted records (MissionResult,
+PayloadAnalysis) that also support dict-style access and to_dict().
+
+An opt-in LRU memoization layer (enable_memoization / memoized) caches the
+physics hot paths and payload_ratio_analysis results for repeated configs.
+Below it, an optional persistent cache (eval_cache.py, installed with
+set_evaluation_cache) keeps payload_ratio_analysis results across runs.
+
+An opt-in instrumentation layer (enable_instrumentation / instrumented)
+counts and times mission phases and physics calls, and counts model branch
+hits. When it is off, the physics methods run unwrapped.
 """
 
 import math
-from dataclasses import dataclass
-from typing import Tuple, Dict
+import functools
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from typing import Tuple, Dict, Hashable, Optional
 import json
 
 
@@ -23,6 +44,23 @@ AIR_DENSITY_SEA_LEVEL = 1.225  # kg/m^3
 GASOLINE_ENERGY_DENSITY = 12000  # Wh/kg
 LIPO_ENERGY_DENSITY = 250  # Wh/kg
 
+# Mission profile (DARPA Lift Challenge course)
+MISSION_ALTITUDE_M = 107  # meters (350 ft)
+MISSION_CLIMB_RATE_MS = 2.0  # m/s
+MISSION_LOADED_DISTANCE_M = 7408  # meters (4 nm)
+MISSION_UNLOADED_DISTANCE_M = 1852  # meters (1 nm)
+MISSION_DESCENT_TIME_S = 60  # descend and stabilize before drop
+MISSION_DROP_TIME_S = 30  # payload release
+MISSION_LANDING_TIME_S = 60  # final descent and landing
+MISSION_TIME_LIMIT_MIN = 30  # competition time limit
+MISSION_LOADED_TRACK_DEG = 0.0  # loaded leg course (true heading of the track)
+MISSION_UNLOADED_TRACK_DEG = 180.0  # unloaded leg flies back toward the start
+MISSION_MAX_WIND_KT = 25  # competition wind limit
+
+# Version of the physics and mission model: bump it with any change that
+# alters computed results, so persistent caches (eval_cache.py) miss
+PHYSICS_VERSION = 1
+
 
 # Unit conversion helpers
 def lbs_to_kg(lbs: float) -> float:
@@ -49,6 +87,14 @@ def ms_to_kmh(ms: float) -> float:
     """Convert meters per second to kilometers per hour"""
     return ms * 3.6
 
+def ft_to_m(ft: float) -> float:
+    """Convert feet to meters"""
+    return ft * 0.3048
+
+def kt_to_ms(kt: float) -> float:
+    """Convert knots to meters per second"""
+    return kt * 0.514444
+
 
 @dataclass
 class AircraftConfig:
@@ -87,12 +133,280 @@ class AircraftConfig:
                 self.generator_weight_kg +
                 self.battery_weight_kg)
 
+    def fingerprint(self) -> Tuple:
+        """Hashable tuple of all configuration fields (memoization key)"""
+        return tuple(getattr(self, f.name) for f in fields(self))
+
+
+class LRUCache:
+    """Bounded least-recently-used cache with hit/miss/eviction counters"""
+
+    def __init__(self, maxsize: int = 100_000):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_or_compute(self, key: Hashable, compute):
+        """Return the cached value for key, computing and storing it on a miss"""
+        data = self._data
+        try:
+            value = data[key]
+        except KeyError:
+            self.misses += 1
+            value = compute()
+            data[key] = value
+            if len(data) > self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+            return value
+        data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict:
+        """Cache counters"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+# Active memoization cache (None = memoization disabled)
+_memo_cache: Optional[LRUCache] = None
+
+
+def enable_memoization(maxsize: int = 100_000) -> LRUCache:
+    """
+    Turn on memoization of physics and payload analysis results.
+
+    Returns: The active cache (its counters can be inspected directly)
+    """
+    global _memo_cache
+    _memo_cache = LRUCache(maxsize)
+    return _memo_cache
+
+
+def disable_memoization():
+    """Turn memoization off and drop the cache"""
+    global _memo_cache
+    _memo_cache = None
+
+
+def memoization_stats() -> Optional[Dict]:
+    """Counters of the active cache, or None when memoization is disabled"""
+    return _memo_cache.stats() if _memo_cache is not None else None
+
+
+@contextmanager
+def memoized(maxsize: int = 100_000):
+    """Context manager that enables memoization for the enclosed block"""
+    global _memo_cache
+    previous = _memo_cache
+    cache = enable_memoization(maxsize)
+    try:
+        yield cache
+    finally:
+        _memo_cache = previous
+
+
+# Active persistent evaluation cache (eval_cache.EvaluationCache; None = disabled)
+_evaluation_cache = None
+
+
+def set_evaluation_cache(cache):
+    """
+    Install the persistent cache consulted by payload_ratio_analysis
+    (None removes it). See eval_cache.enable_evaluation_cache.
+    """
+    global _evaluation_cache
+    _evaluation_cache = cache
+
+
+def get_evaluation_cache():
+    """The installed persistent cache, or None"""
+    return _evaluation_cache
+
+
+def _memoize_physics(kind: str, config_key):
+    """
+    Memoize a PerformanceCalculator method when memoization is enabled.
+
+    The cache key is (kind, config_key(config), air density, *args), so
+    config_key should return only the configuration values the method
+    depends on.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            cache = _memo_cache
+            if cache is None:
+                return method(self, *args)
+            key = (kind, config_key(self.config), self.air_density) + args
+            return cache.get_or_compute(key, lambda: method(self, *args))
+        return wrapper
+    return decorator
+
+
+class Instrumentation:
+    """
+    Call counters, timers and branch-hit counters collected over a run.
+
+    Timers are inclusive: a physics call that calls another (e.g.
+    hover_power_actual -> hover_power_ideal) counts its callee's time too.
+    Counters are per process, so worker processes of a parallel sweep are
+    not included.
+    """
+
+    def __init__(self):
+        self.calls = Counter()
+        self.seconds = Counter()
+        self.branches = Counter()
+
+    def lap(self, name: str, start: float) -> float:
+        """Record one call of name that started at start; returns the current time"""
+        now = time.perf_counter()
+        self.calls[name] += 1
+        self.seconds[name] += now - start
+        return now
+
+    def branch(self, name: str):
+        """Count one hit of a model branch"""
+        self.branches[name] += 1
+
+    def clear(self):
+        """Reset all counters"""
+        self.calls.clear()
+        self.seconds.clear()
+        self.branches.clear()
+
+    def stats(self) -> Dict:
+        """Timers ({name: calls, total_s, mean_us}) and branch counts"""
+        return {
+            'timers': {
+                name: {
+                    'calls': calls,
+                    'total_s': self.seconds[name],
+                    'mean_us': self.seconds[name] / calls * 1e6
+                }
+                for name, calls in self.calls.items()
+            },
+            'branches': dict(self.branches)
+        }
+
+    def report(self) -> str:
+        """Human-readable table of timers and branch counts, slowest first"""
+        lines = [f"{'Timer':<34} {'Calls':>12} {'Total (s)':>10} {'Mean (us)':>10}"]
+        for name, _ in self.seconds.most_common():
+            calls = self.calls[name]
+            lines.append(f"{name:<34} {calls:>12,} {self.seconds[name]:>10.4f} "
+                         f"{self.seconds[name] / calls * 1e6:>10.2f}")
+        if self.branches:
+            lines.append(f"\n{'Branch':<34} {'Hits':>12}")
+            lines.extend(f"{name:<34} {hits:>12,}" for name, hits in sorted(self.branches.items()))
+        return "\n".join(lines)
+
+
+# Active instrumentation (None = instrumentation disabled)
+_instrumentation: Optional[Instrumentation] = None
+
+# PerformanceCalculator methods timed while instrumentation is enabled
+INSTRUMENTED_METHODS = ('hover_power_ideal', 'hover_power_actual', 'forward_flight_power',
+                        '_multirotor_forward_power', '_wing_forward_power', 'climb_power')
+
+# Original methods of PerformanceCalculator while they are wrapped
+_uninstrumented_methods: Dict[str, object] = {}
+
+
+def _timed_method(name: str, method):
+    """Wrap a method so each call is timed under name"""
+    @functools.wraps(method)
+    def wrapper(*args):
+        inst = _instrumentation
+        if inst is None:
+            return method(*args)
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            inst.lap(name, start)
+    return wrapper
+
+
+def _set_instrumentation(inst: Optional[Instrumentation]):
+    """Activate inst (or disable), wrapping or restoring the physics methods"""
+    global _instrumentation
+    _instrumentation = inst
+    if inst is not None and not _uninstrumented_methods:
+        for name in INSTRUMENTED_METHODS:
+            method = PerformanceCalculator.__dict__[name]
+            _uninstrumented_methods[name] = method
+            setattr(PerformanceCalculator, name, _timed_method(name, method))
+    elif inst is None and _uninstrumented_methods:
+        for name, method in _uninstrumented_methods.items():
+            setattr(PerformanceCalculator, name, method)
+        _uninstrumented_methods.clear()
+
+
+def enable_instrumentation() -> Instrumentation:
+    """
+    Turn on counting and timing of mission phases and physics calls.
+
+    Returns: The active Instrumentation (inspect it with stats() or report())
+    """
+    inst = Instrumentation()
+    _set_instrumentation(inst)
+    return inst
+
+
+def disable_instrumentation():
+    """Turn instrumentation off and unwrap the physics methods"""
+    _set_instrumentation(None)
+
+
+def instrumentation_stats() -> Optional[Dict]:
+    """Stats of the active instrumentation, or None when it is disabled"""
+    return _instrumentation.stats() if _instrumentation is not None else None
+
+
+@contextmanager
+def instrumented():
+    """Context manager that collects instrumentation over the enclosed block"""
+    previous = _instrumentation
+    inst = enable_instrumentation()
+    try:
+        yield inst
+    finally:
+        _set_instrumentation(previous)
+
+
+def _hover_key(config: AircraftConfig) -> Tuple:
+    """Configuration values hover power depends on"""
+    return (config.total_disk_area(), config.hover_efficiency)
+
 
 class PerformanceCalculator:
-    """Calculate aircraft performance metrics"""
+    """Calculate aircraft performance metrics at a given air density (kg/m^3)"""
 
-    def __init__(self, config: AircraftConfig):
+    def __init__(self, config: AircraftConfig, air_density: float = AIR_DENSITY_SEA_LEVEL):
         self.config = config
+        self.air_density = air_density
 
     def hover_power_ideal(self, total_weight_kg: float) -> float:
         """
@@ -113,10 +427,11 @@ class PerformanceCalculator:
             raise ValueError("Disk area must be positive")
 
         # Momentum theory formula
-        power_ideal = (thrust_n ** 1.5) / math.sqrt(2 * AIR_DENSITY_SEA_LEVEL * disk_area)
+        power_ideal = (thrust_n ** 1.5) / math.sqrt(2 * self.air_density * disk_area)
 
         return power_ideal
 
+    @_memoize_physics('hover', _hover_key)
     def hover_power_actual(self, total_weight_kg: float) -> float:
         """
         Calculate actual hover power including losses.
@@ -127,6 +442,7 @@ class PerformanceCalculator:
         actual_power = ideal_power / self.config.hover_efficiency
         return actual_power
 
+    @_memoize_physics('forward', AircraftConfig.fingerprint)
     def forward_flight_power(self, total_weight_kg: float, speed_ms: float) -> float:
         """
         Calculate power required for forward flight.
@@ -159,6 +475,10 @@ class PerformanceCalculator:
         # Model as quadratic benefit up to optimal speed, then drag increases
         optimal_speed = 12.0  # m/s (about 27 mph)
 
+        if _instrumentation is not None:
+            _instrumentation.branch('multirotor_below_optimal_speed' if speed_ms <= optimal_speed
+                                    else 'multirotor_above_optimal_speed')
+
         if speed_ms <= optimal_speed:
             # Benefit increases with speed up to optimal
             benefit_factor = 0.15 * (speed_ms / optimal_speed)
@@ -179,7 +499,7 @@ class PerformanceCalculator:
         Much more efficient than pure multirotor.
         """
         # Dynamic pressure
-        q = 0.5 * AIR_DENSITY_SEA_LEVEL * speed_ms ** 2
+        q = 0.5 * self.air_density * speed_ms ** 2
 
         # Lift from wing (assumes angle of attack generates required lift)
         lift_coefficient = 1.2  # Typical for high-lift airfoil
@@ -188,6 +508,9 @@ class PerformanceCalculator:
         # How much weight does wing support?
         total_weight_n = total_weight_kg * GRAVITY
         wing_lift_fraction = min(wing_lift_n / total_weight_n, 0.95)  # Wing can't support 100%
+        if _instrumentation is not None:
+            _instrumentation.branch('wing_lift_fraction_clamped' if wing_lift_fraction == 0.95
+                                    else 'wing_lift_fraction_unclamped')
 
         # Remaining lift from rotors
         rotor_thrust_n = total_weight_n * (1 - wing_lift_fraction)
@@ -209,6 +532,7 @@ class PerformanceCalculator:
 
         return total_power
 
+    @_memoize_physics('climb', _hover_key)
     def climb_power(self, total_weight_kg: float, climb_rate_ms: float) -> float:
         """
         Calculate power for climbing.
@@ -247,9 +571,231 @@ class PerformanceCalculator:
         return flight_time_hours * 60  # Convert to minutes
 
 
+class _Record(Mapping):
+    """
+    Compact result record.
+
+    Values live in __slots__ attributes (no per-instance dict), while the
+    Mapping interface keeps result['key'] access working for existing code.
+    Subclasses list their keys in _KEYS; keys may name properties.
+    """
+    __slots__ = ()
+    _KEYS: Tuple[str, ...] = ()
+
+    def __getitem__(self, key):
+        if key in self._KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def to_dict(self) -> Dict:
+        """Plain dict copy of the record"""
+        return {key: getattr(self, key) for key in self._KEYS}
+
+    def copy(self) -> '_Record':
+        """Shallow copy of the record"""
+        cls = type(self)
+        new = cls.__new__(cls)
+        for name in cls.__slots__:
+            setattr(new, name, getattr(self, name))
+        return new
+
+    def __repr__(self) -> str:
+        values = ', '.join(f'{key}={getattr(self, key)!r}' for key in self._KEYS)
+        return f'{type(self).__name__}({values})'
+
+
+class PhaseResult(_Record):
+    """Duration, power and energy of one mission phase"""
+    __slots__ = ('time_s', 'power_w', 'energy_wh')
+    _KEYS = __slots__
+
+    def __init__(self, time_s: float, power_w: float, energy_wh: float):
+        self.time_s = time_s
+        self.power_w = power_w
+        self.energy_wh = energy_wh
+
+
+# Mission phases in flight order
+MISSION_PHASES = ('takeoff_climb', 'loaded_cruise', 'payload_drop',
+                  'climb_unloaded', 'unloaded_cruise', 'landing')
+
+
+class MissionResult(_Record):
+    """
+    calculate_mission_energy result.
+
+    Stores the six phases and the mission-level scalars; the 'phases',
+    'totals' and 'feasibility' sections of the dict layout are built on
+    access, so mission['totals']['total_time_min'] still works. Hot paths
+    should use the attributes (mission.total_time_min) instead.
+    """
+    __slots__ = MISSION_PHASES + ('total_time_s', 'total_energy_wh', 'loaded_weight_kg',
+                                  'unloaded_weight_kg', 'payload_kg', 'cruise_speed_ms',
+                                  'max_power_w', 'generator_adequate')
+    _KEYS = ('phases', 'totals', 'feasibility')
+
+    def __init__(self, phases: Tuple[PhaseResult, ...], total_time_s: float,
+                 total_energy_wh: float, loaded_weight_kg: float, unloaded_weight_kg: float,
+                 payload_kg: float, cruise_speed_ms: float, max_power_w: float,
+                 generator_adequate: Optional[bool]):
+        (self.takeoff_climb, self.loaded_cruise, self.payload_drop,
+         self.climb_unloaded, self.unloaded_cruise, self.landing) = phases
+        self.total_time_s = total_time_s
+        self.total_energy_wh = total_energy_wh
+        self.loaded_weight_kg = loaded_weight_kg
+        self.unloaded_weight_kg = unloaded_weight_kg
+        self.payload_kg = payload_kg
+        self.cruise_speed_ms = cruise_speed_ms
+        self.max_power_w = max_power_w
+        self.generator_adequate = generator_adequate
+
+    @property
+    def total_time_min(self) -> float:
+        return self.total_time_s / 60
+
+    @property
+    def cruise_speed_kmh(self) -> float:
+        return ms_to_kmh(self.cruise_speed_ms)
+
+    @property
+    def under_30_min(self) -> bool:
+        return self.total_time_s / 60 < MISSION_TIME_LIMIT_MIN
+
+    @property
+    def time_margin_min(self) -> float:
+        return MISSION_TIME_LIMIT_MIN - (self.total_time_s / 60)
+
+    @property
+    def avg_power_w(self) -> float:
+        return self.total_energy_wh / (self.total_time_s / 3600)
+
+    @property
+    def phases(self) -> Dict[str, PhaseResult]:
+        return {name: getattr(self, name) for name in MISSION_PHASES}
+
+    @property
+    def totals(self) -> Dict:
+        return {
+            'total_time_s': self.total_time_s,
+            'total_time_min': self.total_time_min,
+            'total_energy_wh': self.total_energy_wh,
+            'loaded_weight_kg': self.loaded_weight_kg,
+            'unloaded_weight_kg': self.unloaded_weight_kg,
+            'payload_kg': self.payload_kg,
+            'cruise_speed_ms': self.cruise_speed_ms,
+            'cruise_speed_kmh': self.cruise_speed_kmh
+        }
+
+    @property
+    def feasibility(self) -> Dict:
+        return {
+            'under_30_min': self.under_30_min,
+            'time_margin_min': self.time_margin_min,
+            'generator_adequate': self.generator_adequate,
+            'max_power_w': self.max_power_w,
+            'avg_power_w': self.avg_power_w
+        }
+
+    def to_dict(self) -> Dict:
+        """Nested plain dict in the original calculate_mission_energy layout"""
+        return {
+            'phases': {name: getattr(self, name).to_dict() for name in MISSION_PHASES},
+            'totals': self.totals,
+            'feasibility': self.feasibility
+        }
+
+
+class PayloadAnalysis(_Record):
+    """
+    payload_ratio_analysis result.
+
+    Only the independent values are stored; pound conversions, the ratio
+    and the mission-level derived values are computed on access.
+    """
+    __slots__ = ('aircraft_weight_kg', 'payload_kg', 'mission_time_min', 'mission_energy_wh',
+                 'max_power_w', 'avg_power_w')
+    _KEYS = ('aircraft_weight_kg', 'aircraft_weight_lbs', 'payload_kg', 'payload_lbs',
+             'payload_ratio', 'total_weight_kg', 'total_weight_lbs', 'mission_time_min',
+             'mission_energy_wh', 'meets_time_requirement', 'time_margin_min',
+             'max_power_w', 'avg_power_w')
+
+    def __init__(self, aircraft_weight_kg: float, payload_kg: float, mission_time_min: float,
+                 mission_energy_wh: float, max_power_w: float, avg_power_w: float):
+        self.aircraft_weight_kg = aircraft_weight_kg
+        self.payload_kg = payload_kg
+        self.mission_time_min = mission_time_min
+        self.mission_energy_wh = mission_energy_wh
+        self.max_power_w = max_power_w
+        self.avg_power_w = avg_power_w
+
+    @property
+    def aircraft_weight_lbs(self) -> float:
+        return kg_to_lbs(self.aircraft_weight_kg)
+
+    @property
+    def payload_lbs(self) -> float:
+        return kg_to_lbs(self.payload_kg)
+
+    @property
+    def payload_ratio(self) -> float:
+        return kg_to_lbs(self.payload_kg) / kg_to_lbs(self.aircraft_weight_kg)
+
+    @property
+    def total_weight_kg(self) -> float:
+        return self.aircraft_weight_kg + self.payload_kg
+
+    @property
+    def total_weight_lbs(self) -> float:
+        return kg_to_lbs(self.aircraft_weight_kg + self.payload_kg)
+
+    @property
+    def meets_time_requirement(self) -> bool:
+        return self.mission_time_min < MISSION_TIME_LIMIT_MIN
+
+    @property
+    def time_margin_min(self) -> float:
+        return MISSION_TIME_LIMIT_MIN - self.mission_time_min
+
+
+def ground_speed(airspeed_ms: float, wind_speed_ms: float, wind_from_deg: float,
+                 track_deg: float) -> float:
+    """
+    Ground speed along a track flown at constant airspeed in a steady wind.
+
+    The aircraft crabs into the crosswind to hold the track, so the
+    tailwind component adds to the remaining along-track airspeed.
+
+    Args:
+        airspeed_ms: True airspeed in m/s
+        wind_speed_ms: Wind speed in m/s
+        wind_from_deg: Direction the wind blows from (0 = north)
+        track_deg: Direction of travel over the ground
+
+    Returns: Ground speed in m/s, NaN if the wind cannot be overcome
+    """
+    if wind_speed_ms == 0:
+        return airspeed_ms
+    relative = math.radians(wind_from_deg + 180 - track_deg)
+    tailwind = wind_speed_ms * math.cos(relative)
+    crosswind = wind_speed_ms * math.sin(relative)
+    if abs(crosswind) >= airspeed_ms:
+        return math.nan
+    speed = tailwind + math.sqrt(airspeed_ms ** 2 - crosswind ** 2)
+    return speed if speed > 0 else math.nan
+
+
 def calculate_mission_energy(config: AircraftConfig,
                             payload_kg: float,
-                            cruise_speed_ms: float = 7.5) -> Dict:
+                            cruise_speed_ms: float = 7.5,
+                            air_density: float = AIR_DENSITY_SEA_LEVEL,
+                            wind_speed_ms: float = 0.0,
+                            wind_from_deg: float = 0.0) -> MissionResult:
     """
     Calculate energy consumption for complete DARPA Lift Challenge mission.
 
@@ -265,48 +811,72 @@ def calculate_mission_energy(config: AircraftConfig,
         config: Aircraft configuration
         payload_kg: Payload weight in kg
         cruise_speed_ms: Cruise speed in m/s (default 7.5 m/s = 16.8 mph)
-
-    Returns: Dictionary with energy breakdown
+        air_density: Air density in kg/m^3 (default: ISA sea level)
+        wind_speed_ms: Steady wind speed in m/s
+        wind_from_deg: Direction the wind blows from, relative to the loaded
+                       leg track (MISSION_LOADED_TRACK_DEG)
+
+    Returns: MissionResult with the energy breakdown (dict-style access and
+             to_dict() give the nested phases/totals/feasibility layout).
+             Mission time and energy are NaN if the wind cannot be overcome.
     """
-    calc = PerformanceCalculator(config)
+    inst = _instrumentation
+    if inst is not None:
+        mission_start = lap = time.perf_counter()
+
+    calc = PerformanceCalculator(config, air_density)
 
     # Weights
-    loaded_weight = config.total_weight() + payload_kg
     unloaded_weight = config.total_weight()
+    loaded_weight = unloaded_weight + payload_kg
 
     # Phase 1: Takeoff and climb (assume 2 m/s climb rate to 107m)
-    climb_altitude = 107  # meters (350 ft)
-    climb_rate = 2.0  # m/s
+    climb_altitude = MISSION_ALTITUDE_M
+    climb_rate = MISSION_CLIMB_RATE_MS
     climb_time_s = climb_altitude / climb_rate  # 53.5 seconds
     climb_power = calc.climb_power(loaded_weight, climb_rate)
     climb_energy_wh = (climb_power * climb_time_s / 3600)
+    if inst is not None:
+        lap = inst.lap('phase.takeoff_climb', lap)
 
     # Phase 2: Loaded cruise (4 nm = 7408 m)
-    loaded_distance = 7408  # meters
-    loaded_cruise_time_s = loaded_distance / cruise_speed_ms
+    loaded_distance = MISSION_LOADED_DISTANCE_M
+    loaded_cruise_time_s = loaded_distance / ground_speed(
+        cruise_speed_ms, wind_speed_ms, wind_from_deg, MISSION_LOADED_TRACK_DEG)
     loaded_cruise_power = calc.forward_flight_power(loaded_weight, cruise_speed_ms)
     loaded_cruise_energy_wh = (loaded_cruise_power * loaded_cruise_time_s / 3600)
+    if inst is not None:
+        lap = inst.lap('phase.loaded_cruise', lap)
 
     # Phase 3: Descend and drop payload (assume hover during drop)
-    descent_time_s = 60  # 1 minute to descend and stabilize
-    drop_time_s = 30  # 30 seconds for payload release
+    descent_time_s = MISSION_DESCENT_TIME_S  # 1 minute to descend and stabilize
+    drop_time_s = MISSION_DROP_TIME_S  # 30 seconds for payload release
     payload_drop_power = calc.hover_power_actual(loaded_weight)
     payload_drop_energy_wh = (payload_drop_power * (descent_time_s + drop_time_s) / 3600)
+    if inst is not None:
+        lap = inst.lap('phase.payload_drop', lap)
 
     # Phase 4: Climb back (unloaded now)
     climb_back_power = calc.climb_power(unloaded_weight, climb_rate)
     climb_back_energy_wh = (climb_back_power * climb_time_s / 3600)
+    if inst is not None:
+        lap = inst.lap('phase.climb_unloaded', lap)
 
     # Phase 5: Unloaded cruise (1 nm = 1852 m)
-    unloaded_distance = 1852  # meters
-    unloaded_cruise_time_s = unloaded_distance / cruise_speed_ms
+    unloaded_distance = MISSION_UNLOADED_DISTANCE_M
+    unloaded_cruise_time_s = unloaded_distance / ground_speed(
+        cruise_speed_ms, wind_speed_ms, wind_from_deg, MISSION_UNLOADED_TRACK_DEG)
     unloaded_cruise_power = calc.forward_flight_power(unloaded_weight, cruise_speed_ms)
     unloaded_cruise_energy_wh = (unloaded_cruise_power * unloaded_cruise_time_s / 3600)
+    if inst is not None:
+        lap = inst.lap('phase.unloaded_cruise', lap)
 
     # Phase 6: Descent and landing
-    landing_time_s = 60  # 1 minute
+    landing_time_s = MISSION_LANDING_TIME_S  # 1 minute
     landing_power = calc.hover_power_actual(unloaded_weight)
     landing_energy_wh = (landing_power * landing_time_s / 3600)
+    if inst is not None:
+        lap = inst.lap('phase.landing', lap)
 
     # Total mission time and energy
     total_time_s = (climb_time_s + loaded_cruise_time_s + descent_time_s +
@@ -315,70 +885,95 @@ def calculate_mission_energy(config: AircraftConfig,
     total_energy_wh = (climb_energy_wh + loaded_cruise_energy_wh + payload_drop_energy_wh +
                       climb_back_energy_wh + unloaded_cruise_energy_wh + landing_energy_wh)
 
-    return {
-        'phases': {
-            'takeoff_climb': {'time_s': climb_time_s, 'power_w': climb_power, 'energy_wh': climb_energy_wh},
-            'loaded_cruise': {'time_s': loaded_cruise_time_s, 'power_w': loaded_cruise_power, 'energy_wh': loaded_cruise_energy_wh},
-            'payload_drop': {'time_s': descent_time_s + drop_time_s, 'power_w': payload_drop_power, 'energy_wh': payload_drop_energy_wh},
-            'climb_unloaded': {'time_s': climb_time_s, 'power_w': climb_back_power, 'energy_wh': climb_back_energy_wh},
-            'unloaded_cruise': {'time_s': unloaded_cruise_time_s, 'power_w': unloaded_cruise_power, 'energy_wh': unloaded_cruise_energy_wh},
-            'landing': {'time_s': landing_time_s, 'power_w': landing_power, 'energy_wh': landing_energy_wh}
-        },
-        'totals': {
-            'total_time_s': total_time_s,
-            'total_time_min': total_time_s / 60,
-            'total_energy_wh': total_energy_wh,
-            'loaded_weight_kg': loaded_weight,
-            'unloaded_weight_kg': unloaded_weight,
-            'payload_kg': payload_kg,
-            'cruise_speed_ms': cruise_speed_ms,
-            'cruise_speed_kmh': ms_to_kmh(cruise_speed_ms)
-        },
-        'feasibility': {
-            'under_30_min': total_time_s / 60 < 30,
-            'time_margin_min': 30 - (total_time_s / 60),
-            'generator_adequate': config.generator_power_w > max(
-                climb_power, loaded_cruise_power, payload_drop_power
-            ) if config.hybrid_power else None,
-            'max_power_w': max(climb_power, loaded_cruise_power, payload_drop_power),
-            'avg_power_w': total_energy_wh / (total_time_s / 3600)
-        }
-    }
+    max_power_w = max(climb_power, loaded_cruise_power, payload_drop_power)
+
+    if inst is not None:
+        inst.lap('calculate_mission_energy', mission_start)
+
+    return MissionResult(
+        (PhaseResult(climb_time_s, climb_power, climb_energy_wh),
+         PhaseResult(loaded_cruise_time_s, loaded_cruise_power, loaded_cruise_energy_wh),
+         PhaseResult(descent_time_s + drop_time_s, payload_drop_power, payload_drop_energy_wh),
+         PhaseResult(climb_time_s, climb_back_power, climb_back_energy_wh),
+         PhaseResult(unloaded_cruise_time_s, unloaded_cruise_power, unloaded_cruise_energy_wh),
+         PhaseResult(landing_time_s, landing_power, landing_energy_wh)),
+        total_time_s=total_time_s,
+        total_energy_wh=total_energy_wh,
+        loaded_weight_kg=loaded_weight,
+        unloaded_weight_kg=unloaded_weight,
+        payload_kg=payload_kg,
+        cruise_speed_ms=cruise_speed_ms,
+        max_power_w=max_power_w,
+        generator_adequate=config.generator_power_w > max_power_w if config.hybrid_power else None
+    )
 
 
-def payload_ratio_analysis(config: AircraftConfig, max_payload_kg: float) -> Dict:
+def payload_ratio_analysis(config: AircraftConfig, max_payload_kg: float,
+                           cruise_speed_ms: float = 7.5,
+                           air_density: float = AIR_DENSITY_SEA_LEVEL,
+                           wind_speed_ms: float = 0.0,
+                           wind_from_deg: float = 0.0) -> PayloadAnalysis:
     """
     Analyze payload ratio for a given configuration.
 
+    When memoization is enabled, repeated calls with the same arguments
+    return a copy of the cached record, so callers may modify their result
+    without affecting later calls. With a persistent evaluation cache
+    installed, results are also looked up in and stored to it.
+
     Args:
         config: Aircraft configuration
         max_payload_kg: Maximum payload to test
+        cruise_speed_ms: Cruise speed in m/s (default 7.5 m/s = 16.8 mph)
+        air_density: Air density in kg/m^3 (default: ISA sea level)
+        wind_speed_ms: Steady wind speed in m/s
+        wind_from_deg: Direction the wind blows from (see calculate_mission_energy)
 
-    Returns: Performance metrics including payload ratio
+    Returns: PayloadAnalysis with performance metrics including payload ratio
+             (supports result['key'] access and to_dict())
     """
-    aircraft_weight_lbs = kg_to_lbs(config.total_weight())
-    payload_lbs = kg_to_lbs(max_payload_kg)
-
-    ratio = payload_lbs / aircraft_weight_lbs
-
+    cache = _memo_cache
+    if cache is not None:
+        key = ('payload_ratio', config.fingerprint(), max_payload_kg, cruise_speed_ms,
+               air_density, wind_speed_ms, wind_from_deg)
+        return cache.get_or_compute(
+            key, lambda: _stored_payload_ratio_analysis(config, max_payload_kg, cruise_speed_ms,
+                                                        air_density, wind_speed_ms, wind_from_deg)
+        ).copy()
+    return _stored_payload_ratio_analysis(config, max_payload_kg, cruise_speed_ms,
+                                          air_density, wind_speed_ms, wind_from_deg)
+
+
+def _stored_payload_ratio_analysis(config: AircraftConfig, max_payload_kg: float,
+                                   cruise_speed_ms: float, air_density: float,
+                                   wind_speed_ms: float, wind_from_deg: float) -> PayloadAnalysis:
+    """payload_ratio_analysis through the persistent cache, if one is installed"""
+    store = _evaluation_cache
+    if store is None:
+        return _payload_ratio_analysis(config, max_payload_kg, cruise_speed_ms,
+                                       air_density, wind_speed_ms, wind_from_deg)
+    return store.get_or_compute(
+        config, max_payload_kg, cruise_speed_ms, air_density, wind_speed_ms, wind_from_deg,
+        lambda: _payload_ratio_analysis(config, max_payload_kg, cruise_speed_ms,
+                                        air_density, wind_speed_ms, wind_from_deg))
+
+
+def _payload_ratio_analysis(config: AircraftConfig, max_payload_kg: float,
+                            cruise_speed_ms: float, air_density: float,
+                            wind_speed_ms: float, wind_from_deg: float) -> PayloadAnalysis:
+    """Uncached payload_ratio_analysis"""
     # Calculate if it meets mission requirements
-    mission_energy = calculate_mission_energy(config, max_payload_kg)
-
-    return {
-        'aircraft_weight_kg': config.total_weight(),
-        'aircraft_weight_lbs': aircraft_weight_lbs,
-        'payload_kg': max_payload_kg,
-        'payload_lbs': payload_lbs,
-        'payload_ratio': ratio,
-        'total_weight_kg': config.total_weight() + max_payload_kg,
-        'total_weight_lbs': kg_to_lbs(config.total_weight() + max_payload_kg),
-        'mission_time_min': mission_energy['totals']['total_time_min'],
-        'mission_energy_wh': mission_energy['totals']['total_energy_wh'],
-        'meets_time_requirement': mission_energy['feasibility']['under_30_min'],
-        'time_margin_min': mission_energy['feasibility']['time_margin_min'],
-        'max_power_w': mission_energy['feasibility']['max_power_w'],
-        'avg_power_w': mission_energy['feasibility']['avg_power_w']
-    }
+    mission = calculate_mission_energy(config, max_payload_kg, cruise_speed_ms, air_density,
+                                       wind_speed_ms, wind_from_deg)
+
+    return PayloadAnalysis(
+        aircraft_weight_kg=mission.unloaded_weight_kg,
+        payload_kg=max_payload_kg,
+        mission_time_min=mission.total_time_s / 60,
+        mission_energy_wh=mission.total_energy_wh,
+        max_power_w=mission.max_power_w,
+        avg_power_w=mission.avg_power_w
+    )
 
 
 if __name__ == "__main__":
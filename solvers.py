@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+DARPA Lift Challenge - Feasibility Boundary Solvers
+
+Finds mission feasibility boundaries to a chosen tolerance instead of by
+dense scans:
+- max_feasible_payload: largest payload that meets the power and time limits
+  (bracketing + bisection), with a vectorized form for whole design tables
+- optimal_cruise_speed: minimum-energy cruise speed inside the time limit
+  (golden-section search), with a vectorized form for whole design tables
+
+Feasibility follows the checks used throughout the analysis scripts: peak
+mission power must stay below the generator rating times an overpower
+factor, and the mission must finish inside the time limit.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from simulator import AircraftConfig, MISSION_TIME_LIMIT_MIN, MissionResult, calculate_mission_energy
+from batch_simulator import DesignTable, calculate_mission_energy_batch
+
+
+# Golden ratio conjugate for golden-section search
+_INV_PHI = (math.sqrt(5) - 1) / 2
+
+# Default cruise speed search range in m/s (about 7 to 56 mph)
+CRUISE_SPEED_BOUNDS_MS = (3.0, 25.0)
+
+
+@dataclass
+class FeasibilityConstraints:
+    """Mission feasibility limits"""
+    power_limit_factor: float = 1.2  # Peak power must be below generator_power_w * factor
+    time_limit_min: float = MISSION_TIME_LIMIT_MIN
+    min_time_margin_min: float = 0.0  # Required margin below the time limit
+
+    def power_limit_w(self, generator_power_w):
+        """Maximum allowed peak power for a generator rating"""
+        return generator_power_w * self.power_limit_factor
+
+    def max_time_min(self) -> float:
+        """Latest allowed mission completion time in minutes"""
+        return self.time_limit_min - self.min_time_margin_min
+
+
+def mission_feasible(config: AircraftConfig,
+                     mission: MissionResult,
+                     constraints: FeasibilityConstraints) -> bool:
+    """Check a calculate_mission_energy result against the constraints"""
+    power_ok = mission.max_power_w < constraints.power_limit_w(config.generator_power_w)
+    time_ok = mission.total_time_min < constraints.max_time_min()
+    return power_ok and time_ok
+
+
+def mission_feasible_batch(table: DesignTable,
+                           mission: dict,
+                           constraints: FeasibilityConstraints) -> np.ndarray:
+    """Check a calculate_mission_energy_batch result against the constraints"""
+    power_ok = mission['feasibility']['max_power_w'] < constraints.power_limit_w(table.generator_power_w)
+    time_ok = mission['totals']['total_time_min'] < constraints.max_time_min()
+    return power_ok & time_ok
+
+
+def max_feasible_payload(config: AircraftConfig,
+                         constraints: Optional[FeasibilityConstraints] = None,
+                         cruise_speed_ms: float = 7.5,
+                         tol_kg: float = 0.01,
+                         max_payload_kg: float = 1000.0) -> Optional[float]:
+    """
+    Find the largest feasible payload by bracketing and bisection.
+
+    Peak power grows monotonically with payload, so the feasible payloads
+    form an interval [0, boundary]. The upper bracket is found by doubling,
+    then bisection narrows the boundary to tol_kg.
+
+    Args:
+        config: Aircraft configuration
+        constraints: Feasibility limits (defaults to FeasibilityConstraints())
+        cruise_speed_ms: Cruise speed in m/s
+        tol_kg: Payload tolerance in kg
+        max_payload_kg: Search cap; returned if still feasible there
+
+    Returns: Maximum feasible payload in kg, or None if the aircraft cannot
+             fly the mission even without payload
+    """
+    if constraints is None:
+        constraints = FeasibilityConstraints()
+
+    def feasible(payload_kg: float) -> bool:
+        mission = calculate_mission_energy(config, payload_kg, cruise_speed_ms)
+        return mission_feasible(config, mission, constraints)
+
+    if not feasible(0.0):
+        return None
+
+    # Bracket: grow the upper bound until it becomes infeasible
+    lo, hi = 0.0, min(1.0, max_payload_kg)
+    while feasible(hi):
+        if hi >= max_payload_kg:
+            return max_payload_kg
+        lo, hi = hi, min(hi * 2, max_payload_kg)
+
+    # Bisect: lo is always feasible, hi always infeasible
+    while hi - lo > tol_kg:
+        mid = 0.5 * (lo + hi)
+        if feasible(mid):
+            lo = mid
+        else:
+            hi = mid
+
+    return lo
+
+
+def max_feasible_payload_batch(table: DesignTable,
+                               constraints: Optional[FeasibilityConstraints] = None,
+                               cruise_speed_ms=7.5,
+                               tol_kg: float = 0.01,
+                               max_payload_kg: float = 1000.0) -> np.ndarray:
+    """
+    Vectorized maximum feasible payload for every design in a table.
+
+    All rows are bisected together on [0, max_payload_kg]; each iteration is
+    one batched mission evaluation, and ceil(log2(max_payload_kg / tol_kg))
+    iterations reach the tolerance.
+
+    Args:
+        table: Design table
+        constraints: Feasibility limits (defaults to FeasibilityConstraints())
+        cruise_speed_ms: Cruise speed(s) in m/s, broadcast against the table
+        tol_kg: Payload tolerance in kg
+        max_payload_kg: Search cap; returned for rows still feasible there
+
+    Returns: Array of maximum feasible payloads in kg (NaN where the design
+             is infeasible even without payload)
+    """
+    if constraints is None:
+        constraints = FeasibilityConstraints()
+
+    def feasible(payload_kg: np.ndarray) -> np.ndarray:
+        mission = calculate_mission_energy_batch(table, payload_kg, cruise_speed_ms)
+        return mission_feasible_batch(table, mission, constraints)
+
+    shape = np.broadcast_shapes(table.shape, np.shape(cruise_speed_ms))
+    lo = np.zeros(shape)
+    hi = np.full(shape, float(max_payload_kg))
+
+    feasible_empty = feasible(lo)
+    feasible_cap = feasible(hi)
+
+    iterations = max(0, math.ceil(math.log2(max_payload_kg / tol_kg)))
+    for _ in range(iterations):
+        mid = 0.5 * (lo + hi)
+        ok = feasible(mid)
+        lo = np.where(ok, mid, lo)
+        hi = np.where(ok, hi, mid)
+
+    result = np.where(feasible_cap, float(max_payload_kg), lo)
+    return np.where(feasible_empty, result, np.nan)
+
+
+def _golden_section_iterations(width: float, tol: float) -> int:
+    """Iterations needed to shrink a bracket of the given width to tol"""
+    if width <= tol:
+        return 0
+    return math.ceil(math.log(tol / width) / math.log(_INV_PHI))
+
+
+def optimal_cruise_speed(config: AircraftConfig,
+                         payload_kg: float,
+                         constraints: Optional[FeasibilityConstraints] = None,
+                         speed_bounds_ms: Tuple[float, float] = CRUISE_SPEED_BOUNDS_MS,
+                         tol_ms: float = 0.01) -> Optional[float]:
+    """
+    Find the minimum-energy feasible cruise speed for one design.
+
+    Mission time falls monotonically with cruise speed, so the time limit
+    sets a minimum speed, found by bisection. Mission energy is then
+    minimized over [minimum speed, upper bound] by golden-section search,
+    and the optimum is checked against the power limit.
+
+    Args:
+        config: Aircraft configuration
+        payload_kg: Payload weight in kg
+        constraints: Feasibility limits (defaults to FeasibilityConstraints())
+        speed_bounds_ms: (low, high) cruise speed search range in m/s
+        tol_ms: Speed tolerance in m/s
+
+    Returns: Optimal cruise speed in m/s, or None if no speed in range is
+             feasible
+    """
+    if constraints is None:
+        constraints = FeasibilityConstraints()
+
+    lo, hi = speed_bounds_ms
+    max_time_min = constraints.max_time_min()
+
+    def mission_at(speed_ms: float) -> MissionResult:
+        return calculate_mission_energy(config, payload_kg, speed_ms)
+
+    def energy_at(speed_ms: float) -> float:
+        return mission_at(speed_ms).total_energy_wh
+
+    # Time limit -> minimum feasible speed
+    if mission_at(hi).total_time_min >= max_time_min:
+        return None
+    if mission_at(lo).total_time_min >= max_time_min:
+        slow, fast = lo, hi
+        while fast - slow > tol_ms:
+            mid = 0.5 * (slow + fast)
+            if mission_at(mid).total_time_min < max_time_min:
+                fast = mid
+            else:
+                slow = mid
+        lo = fast
+
+    # Golden-section search for minimum energy on [lo, hi]
+    a, b = lo, hi
+    c = b - _INV_PHI * (b - a)
+    d = a + _INV_PHI * (b - a)
+    fc, fd = energy_at(c), energy_at(d)
+    for _ in range(_golden_section_iterations(b - a, tol_ms)):
+        if fc < fd:
+            b, d, fd = d, c, fc
+            c = b - _INV_PHI * (b - a)
+            fc = energy_at(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + _INV_PHI * (b - a)
+            fd = energy_at(d)
+
+    # Compare the interior estimate with the bracket ends, since energy is
+    # often monotone in speed and the optimum sits on a bound
+    candidates = [(fc, c), (fd, d), (energy_at(lo), lo), (energy_at(hi), hi)]
+    best_speed = min(candidates)[1]
+
+    if not mission_feasible(config, mission_at(best_speed), constraints):
+        return None
+    return best_speed
+
+
+def optimal_cruise_speed_batch(table: DesignTable,
+                               payload_kg,
+                               constraints: Optional[FeasibilityConstraints] = None,
+                               speed_bounds_ms: Tuple[float, float] = CRUISE_SPEED_BOUNDS_MS,
+                               tol_ms: float = 0.01) -> np.ndarray:
+    """
+    Vectorized minimum-energy feasible cruise speed for every design.
+
+    Same method as optimal_cruise_speed, with every row's bracket advanced
+    together so each iteration is one batched mission evaluation.
+
+    Args:
+        table: Design table
+        payload_kg: Payload weight(s) in kg, broadcast against the table
+        constraints: Feasibility limits (defaults to FeasibilityConstraints())
+        speed_bounds_ms: (low, high) cruise speed search range in m/s
+        tol_ms: Speed tolerance in m/s
+
+    Returns: Array of optimal cruise speeds in m/s (NaN where infeasible)
+    """
+    if constraints is None:
+        constraints = FeasibilityConstraints()
+
+    max_time_min = constraints.max_time_min()
+    shape = np.broadcast_shapes(table.shape, np.shape(payload_kg))
+
+    def mission_at(speed_ms: np.ndarray) -> dict:
+        return calculate_mission_energy_batch(table, payload_kg, speed_ms)
+
+    def energy_at(speed_ms: np.ndarray) -> np.ndarray:
+        return mission_at(speed_ms)['totals']['total_energy_wh']
+
+    def time_ok(speed_ms: np.ndarray) -> np.ndarray:
+        return mission_at(speed_ms)['totals']['total_time_min'] < max_time_min
+
+    width = speed_bounds_ms[1] - speed_bounds_ms[0]
+    lo = np.full(shape, float(speed_bounds_ms[0]))
+    hi = np.full(shape, float(speed_bounds_ms[1]))
+    reachable = time_ok(hi)
+
+    # Time limit -> minimum feasible speed per row
+    slow, fast = lo.copy(), hi.copy()
+    for _ in range(max(0, math.ceil(math.log2(width / tol_ms)))):
+        mid = 0.5 * (slow + fast)
+        ok = time_ok(mid)
+        fast = np.where(ok, mid, fast)
+        slow = np.where(ok, slow, mid)
+    lo = np.where(time_ok(lo), lo, fast)
+
+    # Golden-section search for minimum energy on [lo, hi]
+    a, b = lo, hi
+    c = b - _INV_PHI * (b - a)
+    d = a + _INV_PHI * (b - a)
+    fc, fd = energy_at(c), energy_at(d)
+    for _ in range(_golden_section_iterations(width, tol_ms)):
+        left = fc < fd
+        a, b = np.where(left, a, c), np.where(left, d, b)
+        new_c = b - _INV_PHI * (b - a)
+        new_d = a + _INV_PHI * (b - a)
+        # Reuse the surviving interior point; evaluate only the new one
+        c, d = np.where(left, new_c, d), np.where(left, c, new_d)
+        f_new = energy_at(np.where(left, c, d))
+        fc, fd = np.where(left, f_new, fd), np.where(left, fc, f_new)
+
+    # Compare the interior estimate with the bracket ends
+    candidates = np.stack([c, d, lo, hi])
+    energies = np.stack([fc, fd, energy_at(lo), energy_at(hi)])
+    best_speed = np.take_along_axis(candidates, np.argmin(energies, axis=0)[None], axis=0)[0]
+
+    feasible = reachable & mission_feasible_batch(table, mission_at(best_speed), constraints)
+    return np.where(feasible, best_speed, np.nan)
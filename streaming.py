@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+DARPA Lift Challenge - Streaming Result Selection
+
+Bounded-memory helpers for consuming design sweeps that yield results one
+at a time (see optimizer.iter_rotor_configurations):
+- TopK: keeps the k best results by any result key in a heap, O(k) state
+- top_k: one-shot top-k of an iterable of results
+- NDJSONWriter: streams results as newline-delimited JSON records
+
+Ties are broken in favour of the earlier result, so the output matches a
+stable sort of the full result list truncated to k.
+"""
+
+import heapq
+import itertools
+import json
+import math
+import sys
+import threading
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, TextIO, Union
+
+
+class TopK:
+    """
+    Streaming top-k selector over result dicts.
+
+    Args:
+        k: Number of results to keep
+        key: Result key to rank by, or a function of the result
+        maximize: Keep the largest values (False keeps the smallest)
+    """
+
+    def __init__(self, k: int, key: Union[str, Callable[[Dict], float]] = 'payload_ratio',
+                 maximize: bool = True):
+        if k <= 0:
+            raise ValueError("k must be positive")
+        self.k = k
+        self._key = (lambda result: result[key]) if isinstance(key, str) else key
+        self._sign = 1.0 if maximize else -1.0
+        # Min-heap of (signed value, -arrival, result): the root is the
+        # current k-th best, with later arrivals losing ties
+        self._heap = []
+        self._arrivals = itertools.count()
+        self.seen = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, result: Dict):
+        """Offer one result"""
+        self.seen += 1
+        entry = (self._sign * self._key(result), -next(self._arrivals), result)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def extend(self, results: Iterable[Dict]):
+        """Offer every result from an iterable"""
+        for result in results:
+            self.push(result)
+
+    def results(self) -> List[Dict]:
+        """Kept results, best first"""
+        return [entry[2] for entry in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+
+def top_k(results: Iterable[Dict], k: int,
+          key: Union[str, Callable[[Dict], float]] = 'payload_ratio',
+          maximize: bool = True) -> List[Dict]:
+    """
+    The k best results of an iterable, best first, in O(k) memory.
+
+    Returns: List of at most k results
+    """
+    selector = TopK(k, key, maximize)
+    selector.extend(results)
+    return selector.results()
+
+
+def json_value(value):
+    """
+    Convert a result value to plain JSON types: numpy scalars and arrays
+    become numbers and lists, tuples become lists, and NaN / infinity
+    become null (which strict JSON parsers require).
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, (str, int, bool)) or value is None:
+        return value
+    if isinstance(value, Mapping):
+        return {str(key): json_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [json_value(item) for item in value]
+    if hasattr(value, 'tolist'):  # numpy scalar or array
+        return json_value(value.tolist())
+    if hasattr(value, 'to_dict'):  # MissionResult, PayloadAnalysis
+        return json_value(value.to_dict())
+    raise TypeError(f"Cannot write {type(value).__name__} as JSON")
+
+
+class NDJSONWriter:
+    """
+    Writes records as newline-delimited JSON, one object per line.
+
+    Every record gets a 'type' field naming what it describes (e.g.
+    'design', 'mc_batch', 'requirement'). Lines are buffered and written
+    out, with a flush, once max_buffered records are pending or the oldest
+    has waited flush_interval_s. A timer thread enforces the interval, so
+    records reach the reader even while the next one takes long to compute
+    (an error it hits writing, e.g. a closed pipe, is raised by the next
+    write or flush).
+
+    Args:
+        stream: Text stream to write to (default: sys.stdout)
+        max_buffered: Records held before they are written
+        flush_interval_s: Longest time a record is held (0 = write each
+                          record at once)
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, max_buffered: int = 1000,
+                 flush_interval_s: float = 0.5):
+        if max_buffered <= 0:
+            raise ValueError("max_buffered must be positive")
+        self.stream = sys.stdout if stream is None else stream
+        self.max_buffered = max_buffered
+        self.flush_interval_s = flush_interval_s
+        self.records = 0
+        self._lines = []
+        self._lock = threading.Lock()
+        self._timer = None
+        self._error = None
+
+    def write(self, record_type: str, record: Optional[Mapping] = None, **fields):
+        """Queue one record built from record and/or keyword fields"""
+        values = {'type': record_type}
+        if record is not None:
+            values.update(record)
+        values.update(fields)
+        line = json.dumps(json_value(values), ensure_ascii=False)
+        with self._lock:
+            self._raise_error()
+            self._lines.append(line)
+            self.records += 1
+            if len(self._lines) >= self.max_buffered or self.flush_interval_s <= 0:
+                self._flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.flush_interval_s, self._timed_flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Write out pending records"""
+        with self._lock:
+            self._raise_error()
+            self._flush()
+
+    def close(self):
+        """Write out pending records and stop the flush timer"""
+        self.flush()
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._lines:
+            self.stream.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
+        self.stream.flush()
+
+    def _timed_flush(self):
+        with self._lock:
+            if threading.current_thread() is not self._timer:
+                return  # superseded by a flush in the meantime
+            self._timer = None
+            try:
+                self._flush()
+            except Exception as exc:
+                self._error = exc
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def __enter__(self) -> 'NDJSONWriter':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -6,9 +6,7 @@ Generates comprehensive validation report comparing initial research estimates
 against physics-based simulation results.
 """
 
-from simulator import *
-from optimizer import *
-import json
+from simulator import AircraftConfig, kg_to_lbs, lbs_to_kg, payload_ratio_analysis
 
 
 def generate_validation_report():
@@ -374,4 +372,7 @@ fundamental insight even though specific sizing was off.
 
 
 if __name__ == "__main__":
+    from eval_cache import enable_from_environment
+
+    enable_from_environment()
     generate_validation_report()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+DARPA Lift Challenge - Wind Envelope Evaluation
+
+Evaluates designs across many steady wind vectors in one batched call.
+Wind enters the mission model through the cruise legs only: airspeed sets
+cruise power, and the ground speed (headwind/tailwind component plus the
+crab angle needed to cancel the crosswind) sets how long each leg takes.
+The loaded leg is flown along MISSION_LOADED_TRACK_DEG and the unloaded
+leg along MISSION_UNLOADED_TRACK_DEG.
+
+- wind_scenarios: a speed x direction grid of wind vectors
+- wind_envelope: every design against every wind vector, with the
+  worst case and a pass/fail against the mission constraints
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from simulator import AIR_DENSITY_SEA_LEVEL, MISSION_MAX_WIND_KT, kt_to_ms
+from batch_simulator import DesignTable, calculate_mission_energy_batch
+from solvers import FeasibilityConstraints, mission_feasible_batch
+
+
+def wind_scenarios(max_wind_ms: float,
+                   n_speeds: int = 6,
+                   n_directions: int = 36) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Grid of steady wind vectors from calm up to max_wind_ms.
+
+    Args:
+        max_wind_ms: Highest wind speed in m/s
+        n_speeds: Wind speeds from 0 to max_wind_ms (inclusive)
+        n_directions: Evenly spaced directions the wind blows from
+
+    Returns: (wind_speed_ms, wind_from_deg) flat arrays, one entry per vector
+    """
+    speeds = np.linspace(0.0, max_wind_ms, n_speeds)
+    directions = np.arange(n_directions) * (360.0 / n_directions)
+    speed_grid, direction_grid = np.meshgrid(speeds, directions, indexing='ij')
+    return speed_grid.ravel(), direction_grid.ravel()
+
+
+@dataclass
+class WindEnvelope:
+    """
+    Mission results of N designs across K wind vectors.
+
+    Result arrays have shape (N, K); wind arrays have shape (K,).
+    """
+    wind_speed_ms: np.ndarray
+    wind_from_deg: np.ndarray
+    mission_time_min: np.ndarray
+    mission_energy_wh: np.ndarray
+    feasible: np.ndarray
+
+    @property
+    def certified(self) -> np.ndarray:
+        """True for designs that are feasible in every wind scenario"""
+        return np.all(self.feasible, axis=1)
+
+    @property
+    def feasible_fraction(self) -> np.ndarray:
+        """Fraction of wind scenarios each design can fly"""
+        return np.mean(self.feasible, axis=1)
+
+    def worst_case(self, design: int = 0) -> dict:
+        """Slowest wind scenario for one design (unflyable winds count as slowest)"""
+        times = np.where(np.isnan(self.mission_time_min[design]), np.inf,
+                         self.mission_time_min[design])
+        k = int(np.argmax(times))
+        return {
+            'wind_speed_ms': float(self.wind_speed_ms[k]),
+            'wind_from_deg': float(self.wind_from_deg[k]),
+            'mission_time_min': float(self.mission_time_min[design, k]),
+            'mission_energy_wh': float(self.mission_energy_wh[design, k]),
+        }
+
+
+def wind_envelope(table: DesignTable,
+                  payload_kg,
+                  cruise_speed_ms=7.5,
+                  max_wind_kt: float = MISSION_MAX_WIND_KT,
+                  n_speeds: int = 6,
+                  n_directions: int = 36,
+                  constraints: Optional[FeasibilityConstraints] = None,
+                  air_density=AIR_DENSITY_SEA_LEVEL) -> WindEnvelope:
+    """
+    Evaluate every design against a grid of wind vectors in one batch.
+
+    Args:
+        table: Design table (N rows, 1-D)
+        payload_kg: Payload weight in kg (scalar or one per design)
+        cruise_speed_ms: Cruise airspeed(s) in m/s (scalar or one per design)
+        max_wind_kt: Strongest wind to certify against (default: the 25 kt
+                     competition limit)
+        n_speeds: Wind speeds from calm to max_wind_kt
+        n_directions: Wind directions
+        constraints: Feasibility limits (defaults to FeasibilityConstraints())
+        air_density: Air density in kg/m^3
+
+    Returns: WindEnvelope with (N, n_speeds * n_directions) results
+    """
+    if constraints is None:
+        constraints = FeasibilityConstraints()
+
+    wind_speed_ms, wind_from_deg = wind_scenarios(kt_to_ms(max_wind_kt), n_speeds, n_directions)
+
+    # Designs along axis 0, wind vectors along axis 1
+    grid_table = table.expand_dims(2)
+    per_design = lambda values: np.asarray(values, dtype=np.float64).reshape(-1, 1)
+    mission = calculate_mission_energy_batch(
+        grid_table, per_design(payload_kg), per_design(cruise_speed_ms),
+        air_density=air_density, wind_speed_ms=wind_speed_ms, wind_from_deg=wind_from_deg)
+
+    return WindEnvelope(
+        wind_speed_ms=wind_speed_ms,
+        wind_from_deg=wind_from_deg,
+        mission_time_min=mission['totals']['total_time_min'],
+        mission_energy_wh=mission['totals']['total_energy_wh'],
+        feasible=mission_feasible_batch(grid_table, mission, constraints)
+    )
+
+
+if __name__ == "__main__":
+    from simulator import AircraftConfig, lbs_to_kg
+
+    config = AircraftConfig(
+        aircraft_weight_kg=11.0, num_rotors=16, rotor_diameter_m=0.61,
+        generator_weight_kg=13.0, generator_power_w=15000
+    )
+    # The same design at three cruise airspeeds
+    speeds = np.array([7.5, 10.0, 15.0])
+    table = DesignTable.from_configs([config] * len(speeds))
+    envelope = wind_envelope(table, lbs_to_kg(110), speeds)
+
+    print(f"{len(envelope.wind_speed_ms)} wind vectors up to {MISSION_MAX_WIND_KT} kt")
+    for i, speed in enumerate(speeds):
+        worst = envelope.worst_case(i)
+        print(f"  Cruise {speed:4.1f} m/s: {envelope.feasible_fraction[i]*100:5.1f}% of winds feasible, "
+              f"worst {worst['wind_speed_ms']:.1f} m/s from {worst['wind_from_deg']:.0f}° -> "
+              f"{worst['mission_time_min']:.1f} min "
+              f"({'CERTIFIED' if envelope.certified[i] else 'not certified'})")